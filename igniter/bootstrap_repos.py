@@ -10,7 +10,10 @@ import tempfile
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
+import json
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from zipfile import ZipFile, BadZipFile
 
@@ -34,6 +37,9 @@ LOG_INFO = 0
 LOG_WARNING = 1
 LOG_ERROR = 3
 
+HASH_CHUNK_SIZE = 128 * 1024
+VALIDATION_CACHE_FILENAME = "validated_versions.json"
+
 
 def sanitize_long_path(path):
     """Sanitize long paths (260 characters) when on Windows.
@@ -67,16 +73,182 @@ def sha256sum(filename):
     Returns:
         str: hex encoded sha256
 
+    """
+    with open(filename, 'rb', buffering=0) as f:
+        return sha256stream(f)
+
+
+def sha256stream(stream):
+    """Calculate sha256 of content of opened binary stream.
+
+    Content is read in chunks so the whole file is never held in memory.
+
+    Args:
+        stream (io.RawIOBase): Stream opened for reading in binary mode.
+
+    Returns:
+        str: hex encoded sha256
+
     """
     h = hashlib.sha256()
-    b = bytearray(128 * 1024)
+    b = bytearray(HASH_CHUNK_SIZE)
     mv = memoryview(b)
-    with open(filename, 'rb', buffering=0) as f:
-        for n in iter(lambda: f.readinto(mv), 0):
-            h.update(mv[:n])
+    for n in iter(lambda: stream.readinto(mv), 0):
+        h.update(mv[:n])
     return h.hexdigest()
 
 
+def get_validation_workers() -> int:
+    """Number of threads used to calculate checksums.
+
+    Can be overridden with `OPENPYPE_VALIDATION_WORKERS` environment
+    variable.
+
+    Returns:
+        int: Number of worker threads.
+
+    """
+    workers = os.getenv("OPENPYPE_VALIDATION_WORKERS")
+    if workers:
+        try:
+            return max(1, int(workers))
+        except ValueError:
+            pass
+    return min(8, os.cpu_count() or 1)
+
+
+def _check_checksums_parallel(
+        checksums: List[Tuple[str, str]],
+        hash_func: Callable[[str], str],
+        workers: int = None) -> Tuple[bool, str]:
+    """Compare checksums with hashes calculated in worker threads.
+
+    Hashing releases GIL so files are processed concurrently. Remaining
+    files are not hashed after first failure.
+
+    Args:
+        checksums (list): List of tuples with checksum and file name.
+        hash_func (Callable): Function returning hex digest of file name.
+        workers (int): Number of worker threads.
+
+    Returns:
+        tuple(bool, str): with validity as first item and string with
+            reason as second.
+
+    """
+    if workers is None:
+        workers = get_validation_workers()
+
+    def _check(item):
+        file_checksum, file_name = item
+        try:
+            current = hash_func(file_name)
+        except (FileNotFoundError, KeyError):
+            return False, f"Missing file [ {file_name} ]"
+        if current != file_checksum:
+            return False, f"Invalid checksum on {file_name}"
+        return True, None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_check, item) for item in checksums]
+        for future in as_completed(futures):
+            valid, reason = future.result()
+            if not valid:
+                for other in futures:
+                    other.cancel()
+                return False, reason
+    return True, "All ok"
+
+
+def _get_file_stat(path: Union[str, Path]) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ValidationCache:
+    """Cache of successfully validated OpenPype versions.
+
+    Version is stored with size and modification time of its files (or of
+    zip file) so unchanged version does not have to be hashed again. Any
+    change of size or modification time of any file invalidates the record.
+
+    Args:
+        filepath (Path): Path to json file where cache is stored.
+
+    """
+
+    def __init__(self, filepath: Path):
+        self._filepath = Path(filepath)
+        self._lock = threading.Lock()
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    def _load(self) -> dict:
+        try:
+            with open(self._filepath, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _save(self, data: dict):
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=self._filepath.name, dir=self._filepath.parent.as_posix()
+        )
+        try:
+            with os.fdopen(fd, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, self._filepath)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def is_valid(self, path: Path, stats: dict) -> bool:
+        """Was version on path validated with same file stats.
+
+        Args:
+            path (Path): Path to version directory or zip file.
+            stats (dict): Size and modification time by file name.
+
+        Returns:
+            bool: Validation can be skipped.
+
+        """
+        with self._lock:
+            data = self._load()
+        return data.get(Path(path).as_posix()) == stats
+
+    def set_valid(self, path: Path, stats: dict):
+        """Store successful validation of version on path.
+
+        Records of paths which don't exist anymore are removed.
+
+        Args:
+            path (Path): Path to version directory or zip file.
+            stats (dict): Size and modification time by file name.
+
+        """
+        with self._lock:
+            data = {
+                key: value
+                for key, value in self._load().items()
+                if os.path.exists(key)
+            }
+            data[Path(path).as_posix()] = stats
+            self._save(data)
+
+    def remove(self, path: Path):
+        with self._lock:
+            data = self._load()
+            if data.pop(Path(path).as_posix(), None) is not None:
+                self._save(data)
+
+
 class ZipFileLongPaths(ZipFile):
     def _extract_member(self, member, targetpath, pwd):
         return ZipFile._extract_member(
@@ -600,6 +772,7 @@ class BootstrapRepos:
         if not progress_callback:
             progress_callback = empty_progress
         self._progress_callback = progress_callback
+        self._validation_cache = None
 
     def set_data_dir(self, data_dir):
         if not data_dir:
@@ -882,15 +1055,32 @@ class BootstrapRepos:
             zip_file.testzip()
             self._progress_callback(100)
 
-    def validate_openpype_version(self, path: Path) -> tuple:
+    def get_validation_cache(self) -> ValidationCache:
+        """Cache of validated versions stored in user data dir."""
+        if self._validation_cache is None:
+            data_dir = Path(user_data_dir("openpype", "pypeclub"))
+            self._validation_cache = ValidationCache(
+                data_dir / VALIDATION_CACHE_FILENAME
+            )
+        return self._validation_cache
+
+    def validate_openpype_version(
+            self, path: Path, use_cache: bool = True) -> tuple:
         """Validate version directory or zip file.
 
         This will load `checksums` file if present, calculate checksums
         of existing files in given path and compare. It will also compare
         lists of files together for missing files.
 
+        Successful validation is cached with size and modification time
+        of validated files so unchanged version is not hashed again.
+        Cache can be disabled with `OPENPYPE_DISABLE_VALIDATION_CACHE`
+        environment variable.
+
         Args:
             path (Path): Path to OpenPype version to validate.
+            use_cache (bool): Skip hashing of files if version
+                was already validated and did not change.
 
         Returns:
             tuple(bool, str): with version validity as first item
@@ -902,26 +1092,52 @@ class BootstrapRepos:
         if not path.exists():
             return False, "Path doesn't exist"
 
+        cache = None
+        if use_cache and not os.getenv("OPENPYPE_DISABLE_VALIDATION_CACHE"):
+            cache = self.get_validation_cache()
+
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            return self._validate_zip(path, cache)
+        return self._validate_dir(path, cache)
+
+    @staticmethod
+    def _read_checksums(checksums_data: str) -> List[Tuple[str, str]]:
+        return [
+            tuple(line.split(":"))
+            for line in checksums_data.split("\n") if line
+        ]
 
     @staticmethod
-    def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
+    def _validate_zip(
+            path: Path, cache: ValidationCache = None) -> tuple:
+        """Validate content of zip file.
+
+        Members are hashed in worker threads, each thread reads from its
+        own handle of the zip file.
+
+        Args:
+            path (Path): path to zip file to validate.
+            cache (ValidationCache): Optional cache of validated versions.
+
+        Returns:
+            tuple(bool, str): returns status and reason as a bool
+                and str in a tuple.
+
+        """
+        stats = {"": _get_file_stat(path)}
+        if cache is not None and cache.is_valid(path, stats):
+            return True, "All ok (cached)"
+
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
+                checksums_data = zip_file.read("checksums").decode("utf-8")
+            except (IOError, KeyError):
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
 
             # split it to the list of tuples
-            checksums = [
-                tuple(line.split(":"))
-                for line in checksums_data.split("\n") if line
-            ]
+            checksums = BootstrapRepos._read_checksums(checksums_data)
 
             # get list of files in zip minus `checksums` file itself
             # and turn in to set to compare against list of files
@@ -934,26 +1150,39 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
-                try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+        thread_data = threading.local()
+        opened_zips = []
+        opened_lock = threading.Lock()
+
+        def _hash_member(file_name):
+            zip_file = getattr(thread_data, "zip_file", None)
+            if zip_file is None:
+                zip_file = ZipFile(path, "r")
+                thread_data.zip_file = zip_file
+                with opened_lock:
+                    opened_zips.append(zip_file)
+            with zip_file.open(file_name) as stream:
+                return sha256stream(stream)
+
+        # calculate and compare checksums in the zip file
+        try:
+            result = _check_checksums_parallel(checksums, _hash_member)
+        finally:
+            for zip_file in opened_zips:
+                zip_file.close()
 
-        return True, "All ok"
+        if result[0] and cache is not None:
+            cache.set_valid(path, stats)
+        return result
 
     @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+    def _validate_dir(
+            path: Path, cache: ValidationCache = None) -> tuple:
         """Validate checksums in a given path.
 
         Args:
             path (Path): path to folder to validate.
+            cache (ValidationCache): Optional cache of validated versions.
 
         Returns:
             tuple(bool, str): returns status and reason as a bool
@@ -965,10 +1194,7 @@ class BootstrapRepos:
             # FIXME: This should be set to False sometimes in the future
             return True, "Cannot read checksums for archive."
         checksums_data = checksums_file.read_text()
-        checksums = [
-            tuple(line.split(":"))
-            for line in checksums_data.split("\n") if line
-        ]
+        checksums = BootstrapRepos._read_checksums(checksums_data)
 
         # compare file list against list of files from checksum file.
         # If difference exists, something is wrong and we invalidate directly
@@ -983,21 +1209,34 @@ class BootstrapRepos:
         if diff:
             return False, f"Missing files {diff}"
 
-        # calculate and compare checksums
-        for file_checksum, file_name in checksums:
-            if platform.system().lower() == "windows":
+        is_windows = platform.system().lower() == "windows"
+
+        def _get_file_path(file_name):
+            if is_windows:
                 file_name = file_name.replace("/", "\\")
+            return sanitize_long_path((path / file_name).as_posix())
+
+        stats = None
+        if cache is not None:
             try:
-                current = sha256sum(
-                    sanitize_long_path((path / file_name).as_posix())
-                )
-            except FileNotFoundError:
-                return False, f"Missing file [ {file_name} ]"
+                stats = {
+                    file_name: _get_file_stat(_get_file_path(file_name))
+                    for file_name in files_in_checksum | {"checksums"}
+                }
+            except OSError:
+                # missing file is reported by validation
+                stats = None
 
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+            if stats is not None and cache.is_valid(path, stats):
+                return True, "All ok (cached)"
 
-        return True, "All ok"
+        # calculate and compare checksums
+        result = _check_checksums_parallel(
+            checksums, lambda file_name: sha256sum(_get_file_path(file_name))
+        )
+        if result[0] and stats is not None:
+            cache.set_valid(path, stats)
+        return result
 
     @staticmethod
     def add_paths_from_archive(archive: Path) -> None:
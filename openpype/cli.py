@@ -360,16 +360,38 @@ def repack_version(directory):
     "--dirpath", help="Directory where package is stored", default=None)
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def pack_project(project, dirpath, dbonly):
+@click.option(
+    "--resume", help="Continue packing to existing package",
+    default=False, is_flag=True)
+def pack_project(project, dirpath, dbonly, resume):
     """Create a package of project with all files and database dump."""
 
     if AYON_SERVER_ENABLED:
         raise RuntimeError("AYON does not support 'pack-project' command.")
-    PypeCommands().pack_project(project, dirpath, dbonly)
+    PypeCommands().pack_project(project, dirpath, dbonly, resume)
+
+
+@main.command()
+@click.option(
+    "--project", help="Project name (all projects if not passed)",
+    default=None, multiple=True
+)
+@click.option(
+    "--explain", help="Report queries which use collection scan",
+    default=False, is_flag=True
+)
+def ensure_project_indexes(project, explain):
+    """Create indexes of project collections used by OpenPype queries."""
+
+    if AYON_SERVER_ENABLED:
+        raise RuntimeError(
+            "AYON does not support 'ensure-project-indexes' command."
+        )
+    PypeCommands().ensure_project_indexes(project, explain)
 
 
 @main.command()
-@click.option("--zipfile", help="Path to zip file")
+@click.option("--zipfile", help="Path to package directory or zip file")
 @click.option(
     "--root", help="Replace root which was stored in project", default=None
 )
@@ -38,6 +38,7 @@ from .entities import (
     get_representation_parents,
     get_representations_parents,
     get_archived_representations,
+    get_representation_files_by_content_hash,
 
     get_thumbnail,
     get_thumbnails,
@@ -98,6 +99,7 @@ __all__ = (
     "get_representation_parents",
     "get_representations_parents",
     "get_archived_representations",
+    "get_representation_files_by_content_hash",
 
     "get_thumbnail",
     "get_thumbnails",
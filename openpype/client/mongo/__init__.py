@@ -10,6 +10,11 @@ from .mongo import (
     replace_project_documents,
     store_project_documents,
 )
+from .indexes import (
+    PROJECT_INDEXES,
+    ensure_project_indexes,
+    get_project_queries_report,
+)
 
 
 __all__ = (
@@ -23,4 +28,8 @@ __all__ = (
     "load_json_file",
     "replace_project_documents",
     "store_project_documents",
+
+    "PROJECT_INDEXES",
+    "ensure_project_indexes",
+    "get_project_queries_report",
 )
@@ -13,10 +13,15 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .indexes import VERSIONS_INDEX_NAME, ensure_project_indexes
 
 PatternType = type(re.compile(""))
 
 
+class _VersionsIndexCache:
+    project_names = set()
+
+
 def _prepare_fields(fields, required_fields=None):
     if not fields:
         return None
@@ -855,6 +860,25 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+def ensure_versions_index(project_name):
+    """Make sure project collection has index used to find last versions.
+
+    Compound index on 'type', 'parent' and 'name' is used by
+    'get_last_versions' so last version of each subset is found by index
+    walk instead of sorting all versions. Index is created only once per
+    project in a process.
+
+    Args:
+        project_name (str): Name of project.
+    """
+
+    if project_name in _VersionsIndexCache.project_names:
+        return
+
+    ensure_project_indexes(project_name, [VERSIONS_INDEX_NAME])
+    _VersionsIndexCache.project_names.add(project_name)
+
+
 def get_last_versions(project_name, subset_ids, active=None, fields=None):
     """Latest versions for entered subset_ids.
 
@@ -878,28 +902,6 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
         if not fields:
             return {}
 
-    # Avoid double query if only name and _id are requested
-    name_needed = False
-    limit_query = False
-    if fields:
-        fields_s = set(fields)
-        if "name" in fields_s:
-            name_needed = True
-            fields_s.remove("name")
-
-        for field in ("_id", "parent"):
-            if field in fields_s:
-                fields_s.remove(field)
-        limit_query = len(fields_s) == 0
-
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
-
     aggregate_filter = {
         "type": "version",
         "parent": {"$in": subset_ids}
@@ -912,41 +914,26 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
             {"data.active": active},
         ]
 
+    # Sort matches versions index so last version of each subset is found
+    #   by index and whole document is returned from the same aggregation
+    #   instead of second query
     aggregation_pipeline = [
         # Find all versions of those subsets
         {"$match": aggregate_filter},
-        # Sorting versions all together
-        {"$sort": {"name": 1}},
-        # Group them by "parent", but only take the last
-        {"$group": group_item}
-    ]
-
-    conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
-    if limit_query:
-        output = {}
-        for item in aggregate_result:
-            subset_id = item["_id"]
-            item_data = {"_id": item["_version_id"], "parent": subset_id}
-            if name_needed:
-                item_data["name"] = item["name"]
-            output[subset_id] = item_data
-        return output
-
-    version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
+        # Sort by subset and from the highest version
+        {"$sort": {"type": 1, "parent": 1, "name": -1}},
+        # Group them by "parent", but only take the first
+        {"$group": {"_id": "$parent", "doc": {"$first": "$$ROOT"}}},
+        {"$replaceRoot": {"newRoot": "$doc"}},
     ]
-
     fields = _prepare_fields(fields, ["parent"])
+    if fields:
+        aggregation_pipeline.append({"$project": fields})
 
-    version_docs = get_versions(
-        project_name, version_ids=version_ids, fields=fields
-    )
-
+    conn = get_project_connection(project_name)
     return {
         version_doc["parent"]: version_doc
-        for version_doc in version_docs
+        for version_doc in conn.aggregate(aggregation_pipeline)
     }
 
 
@@ -1312,6 +1299,43 @@ def get_archived_representations(
     )
 
 
+def get_representation_files_by_content_hash(project_name, content_hashes):
+    """Published files of representations with matching content hash.
+
+    Content hash is stored in 'content_hash' key of representation 'files'
+    items when publish is integrated with content deduplication.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        content_hashes (Iterable[str]): Content hashes of files.
+
+    Returns:
+        dict[str, list[dict[str, Any]]]: Files info of representations by
+            content hash. Files of latest representations are first.
+    """
+
+    content_hashes = list(set(content_hashes))
+    output = collections.defaultdict(list)
+    if not content_hashes:
+        return output
+
+    hash_filter = {"$in": content_hashes}
+    pipeline = [
+        {"$match": {
+            "type": "representation",
+            "files.content_hash": hash_filter
+        }},
+        {"$sort": {"_id": -1}},
+        {"$unwind": "$files"},
+        {"$match": {"files.content_hash": hash_filter}},
+        {"$replaceRoot": {"newRoot": "$files"}},
+    ]
+    conn = get_project_connection(project_name)
+    for file_info in conn.aggregate(pipeline):
+        output[file_info["content_hash"]].append(file_info)
+    return output
+
+
 def get_representations_parents(project_name, representations):
     """Prepare parents of representation entities.
 
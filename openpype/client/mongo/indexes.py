@@ -0,0 +1,280 @@
+"""Indexes of project collections.
+
+Project collections contain documents of all entity types which are queried
+by fields like 'type', 'parent', 'name' or 'files.sites.name'. Without
+indexes each such query is a collection scan which is very slow on projects
+with many representations.
+"""
+
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+
+from .mongo import get_project_connection
+
+VERSIONS_INDEX_NAME = "type_parent_name"
+
+# Indexes used by queries in 'openpype.client.mongo.entities' and by sync
+#   server
+# - partial indexes are used only by queries filtering single entity type
+PROJECT_INDEXES = [
+    {
+        "name": "type_name",
+        "keys": [("type", 1), ("name", 1)],
+    },
+    {
+        "name": VERSIONS_INDEX_NAME,
+        "keys": [("type", 1), ("parent", 1), ("name", -1)],
+    },
+    {
+        "name": "type_visual_parent",
+        "keys": [("type", 1), ("data.visualParent", 1)],
+    },
+    {
+        "name": "workfile_parent_task_filename",
+        "keys": [("parent", 1), ("task_name", 1), ("filename", 1)],
+        "partial": {"type": "workfile"},
+    },
+    {
+        "name": "representation_context",
+        "keys": [("context.asset", 1), ("context.subset", 1)],
+        "partial": {"type": "representation"},
+    },
+    {
+        "name": "representation_sites",
+        "keys": [("files.sites.name", 1)],
+        "partial": {"type": "representation"},
+    },
+    {
+        "name": "representation_content_hash",
+        "keys": [("files.content_hash", 1)],
+        "partial": {"type": "representation"},
+    },
+    {
+        "name": "version_input_links",
+        "keys": [("data.inputLinks.id", 1)],
+        "partial": {"type": "version"},
+    },
+]
+
+
+def _get_index_definition(index_name):
+    for index_def in PROJECT_INDEXES:
+        if index_def["name"] == index_name:
+            return index_def
+    raise ValueError("Unknown project index \"{}\"".format(index_name))
+
+
+def ensure_project_indexes(project_name, index_names=None):
+    """Create indexes of project collection if they don't exist.
+
+    Creation of existing index does not do anything. Index with same keys
+    but different name or options is kept as is.
+
+    Args:
+        project_name (str): Name of project.
+        index_names (Optional[Iterable[str]]): Create only indexes with these
+            names. All indexes from 'PROJECT_INDEXES' are created if not
+            passed.
+
+    Returns:
+        dict[str, str]: Result by index name. Result is "created",
+            "exists" or error message if index could not be created.
+    """
+
+    if index_names is None:
+        index_defs = list(PROJECT_INDEXES)
+    else:
+        index_defs = [
+            _get_index_definition(index_name)
+            for index_name in index_names
+        ]
+
+    collection = get_project_connection(project_name)
+    existing_names = set(collection.index_information().keys())
+    output = {}
+    for index_def in index_defs:
+        index_name = index_def["name"]
+        if index_name in existing_names:
+            output[index_name] = "exists"
+            continue
+
+        kwargs = {"name": index_name}
+        if index_def.get("partial"):
+            kwargs["partialFilterExpression"] = index_def["partial"]
+
+        try:
+            collection.create_index(index_def["keys"], **kwargs)
+            output[index_name] = "created"
+        except OperationFailure as exc:
+            # Same index already exists under different name or user is not
+            #   allowed to create indexes
+            output[index_name] = str(exc)
+    return output
+
+
+def _get_project_queries():
+    """Queries used by entities functions and sync server.
+
+    Values don't matter for query planner so placeholders are used.
+
+    Returns:
+        list[dict[str, Any]]: Query label with filter for 'find' or pipeline
+            for 'aggregate'.
+    """
+
+    object_id = ObjectId()
+    return [
+        {
+            "label": "assets by name",
+            "filter": {"type": "asset", "name": {"$in": ["_"]}},
+        },
+        {
+            "label": "assets by parent",
+            "filter": {
+                "type": "asset", "data.visualParent": {"$in": [object_id]}
+            },
+        },
+        {
+            "label": "subsets by asset",
+            "filter": {"type": "subset", "parent": {"$in": [object_id]}},
+        },
+        {
+            "label": "subset by name",
+            "filter": {"type": "subset", "name": "_", "parent": object_id},
+        },
+        {
+            "label": "versions by subset",
+            "filter": {"type": "version", "parent": {"$in": [object_id]}},
+        },
+        {
+            "label": "last versions",
+            "pipeline": [
+                {"$match": {
+                    "type": "version", "parent": {"$in": [object_id]}
+                }},
+                {"$sort": {"type": 1, "parent": 1, "name": -1}},
+                {"$group": {"_id": "$parent", "doc": {"$first": "$$ROOT"}}},
+            ],
+        },
+        {
+            "label": "output link versions",
+            "filter": {"type": "version", "data.inputLinks.id": object_id},
+        },
+        {
+            "label": "representations by version",
+            "filter": {
+                "type": "representation",
+                "parent": {"$in": [object_id]},
+                "name": {"$in": ["_"]},
+            },
+        },
+        {
+            "label": "representations by context",
+            "filter": {
+                "type": "representation",
+                "context.asset": "_",
+                "context.subset": "_",
+            },
+        },
+        {
+            "label": "representations on site",
+            "filter": {
+                "type": "representation",
+                "files.sites": {"$elemMatch": {
+                    "name": "_", "created_dt": {"$exists": True}
+                }},
+            },
+        },
+        {
+            "label": "representation files by content hash",
+            "filter": {
+                "type": "representation",
+                "files.content_hash": {"$in": ["_"]},
+            },
+        },
+        {
+            "label": "workfile info",
+            "filter": {
+                "type": "workfile",
+                "parent": object_id,
+                "task_name": "_",
+                "filename": "_",
+            },
+        },
+    ]
+
+
+def _get_plan_stages(plan):
+    stages = []
+    queue = [plan]
+    while queue:
+        item = queue.pop(0)
+        if isinstance(item, list):
+            queue.extend(item)
+            continue
+
+        if not isinstance(item, dict):
+            continue
+
+        stage = item.get("stage")
+        if stage:
+            stage_label = stage
+            if item.get("indexName"):
+                stage_label = "{}({})".format(stage, item["indexName"])
+            stages.append(stage_label)
+
+        for key, value in item.items():
+            if key in ("inputStage", "inputStages", "queryPlan"):
+                queue.append(value)
+    return stages
+
+
+def _get_aggregate_plan(explain_result):
+    if "queryPlanner" in explain_result:
+        return explain_result["queryPlanner"]["winningPlan"]
+
+    for stage in explain_result.get("stages", []):
+        cursor = stage.get("$cursor")
+        if cursor:
+            return cursor["queryPlanner"]["winningPlan"]
+    return {}
+
+
+def get_project_queries_report(project_name):
+    """Report which queries on project collection use collection scan.
+
+    Each query is explained by query planner and stages of winning plan
+    are returned. Query which contains 'COLLSCAN' stage does not use any
+    index.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        list[dict[str, Any]]: Report of each query with "label", "stages"
+            and "collection_scan" keys.
+    """
+
+    collection = get_project_connection(project_name)
+    database = collection.database
+    output = []
+    for query in _get_project_queries():
+        if "pipeline" in query:
+            explain_result = database.command(
+                "aggregate",
+                collection.name,
+                pipeline=query["pipeline"],
+                explain=True
+            )
+            plan = _get_aggregate_plan(explain_result)
+        else:
+            explain_result = collection.find(query["filter"]).explain()
+            plan = explain_result["queryPlanner"]["winningPlan"]
+
+        stages = _get_plan_stages(plan)
+        output.append({
+            "label": query["label"],
+            "stages": stages,
+            "collection_scan": "COLLSCAN" in stages,
+        })
+    return output
@@ -13,7 +13,8 @@ from openpype.client.operations_base import (
     BaseOperationsSession
 )
 from .mongo import get_project_connection
-from .entities import get_project
+from .indexes import ensure_project_indexes
+from .entities import get_project, ensure_versions_index
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -502,9 +503,19 @@ class MongoOperationsSession(BaseOperationsSession):
                 if mongo_op is not None:
                     bulk_writes.append(mongo_op)
 
-            if bulk_writes:
-                collection = get_project_connection(project_name)
-                collection.bulk_write(bulk_writes)
+            if not bulk_writes:
+                continue
+
+            # Keep index used to find last versions when versions are created
+            if any(
+                operation.entity_type == "version"
+                and operation.operation_name == "create"
+                for operation in operations
+            ):
+                ensure_versions_index(project_name)
+
+            collection = get_project_connection(project_name)
+            collection.bulk_write(bulk_writes)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
@@ -629,4 +640,6 @@ def create_project(
         op_session.commit()
         raise
 
+    ensure_project_indexes(project_name)
+
     return project_doc
@@ -611,6 +611,11 @@ def get_archived_representations(
     )
 
 
+def get_representation_files_by_content_hash(project_name, content_hashes):
+    # Content hash of published files is not stored on server
+    return {}
+
+
 def get_thumbnail(
     project_name, thumbnail_id, entity_type, entity_id, fields=None
 ):
@@ -97,7 +97,9 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    CompiledProfiles,
+    get_compiled_profiles,
 )
 
 from .transcoding import (
@@ -138,6 +140,8 @@ from .applications import (
     prepare_app_environments,
     prepare_context_environments,
     get_app_environments_for_context,
+    get_cached_app_environments_for_context,
+    get_app_environments_cache_dir,
     apply_project_environments_value
 )
 
@@ -254,11 +258,15 @@ __all__ = [
     "prepare_app_environments",
     "prepare_context_environments",
     "get_app_environments_for_context",
+    "get_cached_app_environments_for_context",
+    "get_app_environments_cache_dir",
     "apply_project_environments_value",
 
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "CompiledProfiles",
+    "get_compiled_profiles",
 
     "prepare_template_data",
     "source_hash",
@@ -2,6 +2,10 @@ import os
 import sys
 import copy
 import json
+import stat
+import time
+import getpass
+import hashlib
 import tempfile
 import platform
 import collections
@@ -1483,6 +1487,239 @@ def get_app_environments_for_context(
     return context.env
 
 
+def _get_app_environments_cache_key(
+    project_name,
+    asset_name,
+    task_name,
+    app_name,
+    env_group,
+    launch_type,
+    env
+):
+    """Hash of all inputs which affect environments of a context."""
+    from openpype.version import __version__
+    from openpype.client import get_project, get_asset_by_name
+
+    key_data = {
+        "context": [
+            project_name, asset_name, task_name, app_name, env_group,
+            launch_type
+        ],
+        "version": __version__,
+        "system_settings": get_system_settings(),
+        "project_settings": get_project_settings(project_name),
+        "local_settings": get_local_settings(),
+        "project": get_project(project_name),
+        "asset": get_asset_by_name(project_name, asset_name),
+        "env": env,
+    }
+    content = json.dumps(key_data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_app_environments_cache_dir():
+    """Directory where are cached environments of contexts.
+
+    Directory is specific for current user because cached environments
+    contain credentials. Can be changed with 'OPENPYPE_APP_ENV_CACHE_DIR'
+    environment variable.
+
+    Returns:
+        str: Path to directory.
+    """
+
+    cache_dir = os.environ.get("OPENPYPE_APP_ENV_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+
+    if hasattr(os, "getuid"):
+        user_id = str(os.getuid())
+    else:
+        user_id = getpass.getuser()
+    return os.path.join(
+        tempfile.gettempdir(), "openpype_app_env_cache_{}".format(user_id)
+    )
+
+
+def _ensure_private_cache_dir(cache_dir):
+    """Create cache directory accessible only by current user.
+
+    Existing directory is used only if is owned by current user and other
+    users don't have access to it. Windows temp directory is already
+    specific for the user so ownership is not validated there.
+
+    Args:
+        cache_dir (str): Path to directory.
+
+    Returns:
+        bool: Directory can be used for cache.
+    """
+
+    try:
+        os.makedirs(cache_dir, 0o700)
+    except (OSError, IOError):
+        # Directory already exists
+        pass
+
+    try:
+        stat_result = os.lstat(cache_dir)
+    except (OSError, IOError):
+        return False
+
+    if not stat.S_ISDIR(stat_result.st_mode):
+        return False
+
+    if hasattr(os, "getuid") and (
+        stat_result.st_uid != os.getuid()
+        or stat_result.st_mode & 0o077
+    ):
+        return False
+    return True
+
+
+def _remove_old_cache_files(cache_dir, max_age):
+    """Remove cached environments files older than 'max_age' seconds."""
+    now = time.time()
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                os.remove(path)
+        except (OSError, IOError):
+            pass
+
+
+def get_cached_app_environments_for_context(
+    project_name,
+    asset_name,
+    task_name,
+    app_name,
+    env_group=None,
+    launch_type=None,
+    env=None,
+    max_age=None
+):
+    """Prepare environment variables by context and cache them on disk.
+
+    Same as 'get_app_environments_for_context' but the result is stored
+    under hash of all inputs which affect it. Inputs are context, OpenPype
+    version, settings, project and asset documents and initial environment
+    variables. Cache is not used if 'OPENPYPE_APP_ENV_CACHE' environment
+    variable is set to "0" or when cache directory is accessible by other
+    users. Cached files older than 'max_age' are removed when new
+    environments are cached.
+
+    Args:
+        project_name (str): Name of project.
+        asset_name (str): Name of asset.
+        task_name (str): Name of task.
+        app_name (str): Name of application that is launched and can be found
+            by ApplicationManager.
+        env_group (Optional[str]): Name of environment group. If not passed
+            default group is used.
+        launch_type (Optional[str]): Type for which prelaunch hooks are
+            executed.
+        env (Optional[dict[str, str]]): Initial environment variables.
+            `os.environ` is used when not passed.
+        max_age (Optional[int]): Cached environments older than this
+            (in seconds) are prepared again. One day by default.
+
+    Returns:
+        dict: Environments for passed context and application.
+    """
+
+    if env is None:
+        env = os.environ.copy()
+
+    if os.environ.get("OPENPYPE_APP_ENV_CACHE") == "0":
+        return get_app_environments_for_context(
+            project_name,
+            asset_name,
+            task_name,
+            app_name,
+            env_group=env_group,
+            launch_type=launch_type,
+            env=env
+        )
+
+    if max_age is None:
+        max_age = 60 * 60 * 24
+
+    cache_dir = get_app_environments_cache_dir()
+    log = get_logger()
+    use_cache = _ensure_private_cache_dir(cache_dir)
+    if not use_cache:
+        log.warning((
+            "Environments cache directory \"{}\" is accessible by other"
+            " users. Skipping cache."
+        ).format(cache_dir))
+        return get_app_environments_for_context(
+            project_name,
+            asset_name,
+            task_name,
+            app_name,
+            env_group=env_group,
+            launch_type=launch_type,
+            env=env
+        )
+
+    cache_key = _get_app_environments_cache_key(
+        project_name,
+        asset_name,
+        task_name,
+        app_name,
+        env_group,
+        launch_type,
+        env
+    )
+    cache_path = os.path.join(cache_dir, "{}.json".format(cache_key))
+    try:
+        if time.time() - os.path.getmtime(cache_path) < max_age:
+            with open(cache_path, "r") as stream:
+                output = json.load(stream)
+            log.debug("Using cached environments {}".format(cache_path))
+            return output
+    except (OSError, IOError, ValueError):
+        pass
+
+    output = get_app_environments_for_context(
+        project_name,
+        asset_name,
+        task_name,
+        app_name,
+        env_group=env_group,
+        launch_type=launch_type,
+        env=env
+    )
+
+    # Write to unique temp file in the same directory and rename it to
+    #   avoid partially written files read by other processes
+    # - temporary file is created with permissions only for current user
+    try:
+        _remove_old_cache_files(cache_dir, max_age)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False
+        ) as stream:
+            json.dump(output, stream)
+        _replace_file(stream.name, cache_path)
+
+    except (OSError, IOError):
+        log.debug("Failed to cache environments", exc_info=True)
+
+    return output
+
+
+def _replace_file(src_path, dst_path):
+    if hasattr(os, "replace"):
+        os.replace(src_path, dst_path)
+        return
+
+    # Python 2 fallback
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+    os.rename(src_path, dst_path)
+
+
 def _merge_env(env, current_env):
     """Modified function(merge) from acre module."""
     import acre
@@ -43,6 +43,37 @@ def _get_func_info(func):
     return name, path
 
 
+_TOPIC_REGEX_CACHE = {}
+
+
+def _get_topic_regex(topic):
+    """Compiled topic regex shared by all callbacks with the same topic."""
+
+    regex = _TOPIC_REGEX_CACHE.get(topic)
+    if regex is None:
+        regex = _compile_topic_regex(topic)
+        _TOPIC_REGEX_CACHE[topic] = regex
+    return regex
+
+
+def _compile_topic_regex(topic):
+    """Compile regex matching topics for topic which may contain '*'."""
+
+    # Replace '*' with any character regex and escape rest of text
+    #   - when callback is registered for '*' topic it will receive all
+    #       events
+    #   - it is possible to register to a partial topis 'my.event.*'
+    #       - it will receive all matching event topics
+    #           e.g. 'my.event.start' and 'my.event.end'
+    topic_regex_str = "^{}$".format(
+        ".+".join(
+            re.escape(part)
+            for part in topic.split("*")
+        )
+    )
+    return re.compile(topic_regex_str)
+
+
 class weakref_partial:
     """Partial function with weak reference to the wrapped function.
 
@@ -172,20 +203,8 @@ class EventCallback(object):
         self._topic = topic
         self._order = order
         self._enabled = True
-        # Replace '*' with any character regex and escape rest of text
-        #   - when callback is registered for '*' topic it will receive all
-        #       events
-        #   - it is possible to register to a partial topis 'my.event.*'
-        #       - it will receive all matching event topics
-        #           e.g. 'my.event.start' and 'my.event.end'
-        topic_regex_str = "^{}$".format(
-            ".+".join(
-                re.escape(part)
-                for part in topic.split("*")
-            )
-        )
-        topic_regex = re.compile(topic_regex_str)
-        self._topic_regex = topic_regex
+        self._order_change_ref = None
+        self._topic_regex = _get_topic_regex(topic)
 
         # Callback function prep
         if isinstance(func, weakref_partial):
@@ -227,6 +246,26 @@ class EventCallback(object):
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @property
+    def topic(self):
+        """Topic to which is callback registered.
+
+        Returns:
+            str: Topic which may contain '*'.
+        """
+
+        return self._topic
+
+    @property
+    def is_wildcard(self):
+        """Topic of callback contains '*' and may match multiple topics.
+
+        Returns:
+            bool: Topic is a pattern.
+        """
+
+        return "*" in self._topic
+
     @property
     def is_ref_valid(self):
         """
@@ -292,10 +331,31 @@ class EventCallback(object):
         """
 
         self._validate_order(order)
+        if order == self._order:
+            return
         self._order = order
+        if self._order_change_ref is not None:
+            on_change = self._order_change_ref()
+            if on_change is not None:
+                on_change()
 
     order = property(get_order, set_order)
 
+    def set_order_change_callback(self, func):
+        """Set function called when order of callback changes.
+
+        Used by 'EventSystem' to keep registered callbacks sorted. Only weak
+            reference to the function is stored.
+
+        Args:
+            func (Union[Callable, None]): Function without arguments.
+        """
+
+        if func is None:
+            self._order_change_ref = None
+        else:
+            self._order_change_ref = _get_func_ref(func)
+
     def topic_matches(self, topic):
         """Check if event topic matches callback's topic.
 
@@ -315,6 +375,16 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        if self.topic_matches(event.topic):
+            self.process_matched_event(event)
+
+    def process_matched_event(self, event):
+        """Process event which topic is known to match callback's topic.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
         # Skip if callback is not enabled
         if not self._enabled:
             return
@@ -324,9 +394,6 @@ class EventCallback(object):
         if callback is None:
             return
 
-        if not self.topic_matches(event.topic):
-            return
-
         # Try to execute callback
         try:
             if self._expect_args:
@@ -504,6 +571,14 @@ class EventSystem(object):
 
     def __init__(self):
         self._registered_callbacks = []
+        # Index of callbacks, each list is kept sorted by callback order
+        #   and order of registration
+        self._exact_callbacks = {}
+        self._wildcard_callbacks = collections.OrderedDict()
+        self._registration_indexes = {}
+        self._registration_counter = 0
+        # Resolved callbacks by topic, cleared on any registration change
+        self._topic_callbacks_cache = {}
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -524,7 +599,17 @@ class EventSystem(object):
             order = self.default_order
 
         callback = EventCallback(topic, callback, order)
+        self._registration_counter += 1
+        self._registration_indexes[callback] = self._registration_counter
         self._registered_callbacks.append(callback)
+
+        if callback.is_wildcard:
+            bucket = self._wildcard_callbacks.setdefault(topic, [])
+        else:
+            bucket = self._exact_callbacks.setdefault(topic, [])
+        self._insert_sorted(bucket, callback)
+        callback.set_order_change_callback(self._on_callback_order_change)
+        self._topic_callbacks_cache.clear()
         return callback
 
     def create_event(self, topic, data, source):
@@ -575,13 +660,90 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
-        callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
-        ))
-        for callback in callbacks:
-            callback.process_event(event)
+        invalid_callbacks = []
+        for callback in self._get_topic_callbacks(event.topic):
+            callback.process_matched_event(event)
             if not callback.is_ref_valid:
-                self._registered_callbacks.remove(callback)
+                invalid_callbacks.append(callback)
+
+        for callback in invalid_callbacks:
+            self._remove_callback(callback)
+
+    def _get_sort_key(self, callback):
+        return (callback.order, self._registration_indexes[callback])
+
+    def _insert_sorted(self, bucket, callback):
+        key = self._get_sort_key(callback)
+        idx = len(bucket)
+        # Most of callbacks are registered with default order so they
+        #   are appended to the end
+        while idx > 0 and self._get_sort_key(bucket[idx - 1]) > key:
+            idx -= 1
+        bucket.insert(idx, callback)
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks matching topic sorted by order.
+
+        Result is cached until registered callbacks change.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            tuple[EventCallback, ...]: Callbacks to trigger.
+        """
+
+        callbacks = self._topic_callbacks_cache.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        buckets = []
+        exact_callbacks = self._exact_callbacks.get(topic)
+        if exact_callbacks:
+            buckets.append(exact_callbacks)
+
+        for pattern, bucket in self._wildcard_callbacks.items():
+            if bucket and _get_topic_regex(pattern).match(topic):
+                buckets.append(bucket)
+
+        if len(buckets) == 1:
+            callbacks = tuple(buckets[0])
+        else:
+            callbacks = tuple(sorted(
+                (
+                    callback
+                    for bucket in buckets
+                    for callback in bucket
+                ),
+                key=self._get_sort_key
+            ))
+        self._topic_callbacks_cache[topic] = callbacks
+        return callbacks
+
+    def _remove_callback(self, callback):
+        if callback not in self._registration_indexes:
+            return
+
+        if callback.is_wildcard:
+            buckets = self._wildcard_callbacks
+        else:
+            buckets = self._exact_callbacks
+        bucket = buckets.get(callback.topic)
+        if bucket is not None:
+            bucket.remove(callback)
+            if not bucket:
+                buckets.pop(callback.topic)
+
+        self._registered_callbacks.remove(callback)
+        self._registration_indexes.pop(callback)
+        callback.set_order_change_callback(None)
+        self._topic_callbacks_cache.clear()
+
+    def _on_callback_order_change(self):
+        for buckets in (self._exact_callbacks, self._wildcard_callbacks):
+            for bucket in buckets.values():
+                bucket.sort(key=self._get_sort_key)
+        self._topic_callbacks_cache.clear()
 
 
 class QueuedEventSystem(EventSystem):
@@ -2,7 +2,12 @@ import os
 import logging
 import sys
 import errno
+import time
+import hashlib
+import threading
+
 import six
+from six.moves import queue
 
 from openpype.lib import create_hard_link
 
@@ -23,6 +28,79 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+class TransferVerificationError(IOError):
+    """Error raised when transferred file does not match its source.
+
+    Verification is done only when `verify` is enabled on the
+    FileTransaction instance.
+
+    """
+
+
+def _get_file_hash(path, chunk_size=1024 * 1024):
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_files_hashes(paths, max_workers=1):
+    """Calculate sha256 of content of files.
+
+    Files are read in chunks and hashed in worker threads when
+    'max_workers' is higher than 1.
+
+    Args:
+        paths (Iterable[str]): Paths to files.
+        max_workers (Optional[int]): Number of threads used to hash files.
+
+    Returns:
+        dict[str, str]: Hex digest of content by path.
+    """
+
+    paths = list(set(paths))
+    output = {}
+    workers_count = min(max(int(max_workers or 1), 1), len(paths))
+    if workers_count < 2:
+        for path in paths:
+            output[path] = _get_file_hash(path)
+        return output
+
+    paths_queue = queue.Queue()
+    for path in paths:
+        paths_queue.put(path)
+
+    errors = []
+
+    def _worker():
+        while not errors:
+            try:
+                path = paths_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                output[path] = _get_file_hash(path)
+            except Exception:
+                errors.append(sys.exc_info())
+                return
+
+    threads = [
+        threading.Thread(target=_worker)
+        for _ in range(workers_count)
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        six.reraise(*errors[0])
+    return output
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -49,17 +127,60 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Transfers can be processed in parallel threads when `max_workers` is
+    higher than 1. Number of concurrent transfers to single destination
+    volume (drive, share or mount point) can be limited with
+    `max_workers_per_volume`, which is useful for network storages that
+    don't scale with number of connections. Backup and rollback logic is
+    the same for both serial and parallel processing.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace
+            source of already queued destination.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files. Value lower than 2 means serial processing.
+        max_workers_per_volume (Optional[int]): Limit of concurrent
+            transfers to one destination volume. Value lower than 1 means
+            no limit.
+        verify (Optional[int]): Verification of copied files. One of
+            'VERIFY_NONE', 'VERIFY_SIZE' or 'VERIFY_HASH'.
+        progress_callback (Optional[Callable[[dict], None]]): Callback
+            called after each processed transfer with transfer report.
+            Callback may be called from worker thread.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Hardlink and fallback to copy if hardlink can't be created
+    MODE_HARDLINK_OR_COPY = 2
+
+    VERIFY_NONE = 0
+    VERIFY_SIZE = 1
+    VERIFY_HASH = 2
+
+    _hash_chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        max_workers_per_volume=0,
+        verify=VERIFY_NONE,
+        progress_callback=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        self._max_workers = max(int(max_workers or 1), 1)
+        self._max_workers_per_volume = int(max_workers_per_volume or 0)
+        self._verify = verify
+        self._progress_callback = progress_callback
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -72,13 +193,20 @@ class FileTransaction(object):
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        # Reports of processed transfers
+        self._transfer_reports = []
+        self._transfers_total = 0
+        self._created_dirs = set()
+        self._lock = threading.Lock()
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
         """
 
         opts = {"mode": mode}
@@ -109,6 +237,42 @@ class FileTransaction(object):
 
         self._transfers[dst] = (src, opts)
 
+    def set_transfer_source(self, dst, src, mode=None):
+        """Change source of already queued transfer.
+
+        Can be used to transfer the same content from a different source,
+        e.g. to hardlink already published file with identical content.
+
+        Args:
+            dst (str): Destination path of queued transfer.
+            src (str): New source path.
+            mode (Optional[int]): New transfer mode. Mode is not changed
+                if not passed.
+
+        Raises:
+            KeyError: Transfer to destination is not queued.
+        """
+
+        dst = os.path.normpath(os.path.abspath(dst))
+        _, opts = self._transfers[dst]
+        if mode is not None:
+            opts = dict(opts, mode=mode)
+        self._transfers[dst] = (os.path.normpath(os.path.abspath(src)), opts)
+
+    @property
+    def queued_transfers(self):
+        """Queued transfers.
+
+        Returns:
+            list[tuple[str, str, int]]: Source, destination and mode of
+                queued transfers.
+        """
+
+        return [
+            (src, dst, opts["mode"])
+            for dst, (src, opts) in self._transfers.items()
+        ]
+
     def process(self):
         # Backup any existing files
         for dst, (src, _) in self._transfers.items():
@@ -125,7 +289,8 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
-        # Copy the files to transfer
+        # Collect the files to transfer
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -135,17 +300,153 @@ class FileTransaction(object):
                 continue
 
             self._create_folder_for_file(dst)
+            transfers.append((src, dst, opts))
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
+        self._transfers_total = len(transfers)
+        start = time.time()
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_parallel(transfers)
+        else:
+            for src, dst, opts in transfers:
+                self._transfer_file(src, dst, opts)
+
+        self._log_transfer_summary(time.time() - start)
+
+    def _process_parallel(self, transfers):
+        """Process transfers in worker threads.
+
+        On first error are not started any new transfers, running transfers
+        are finished and the error is re-raised so rollback is possible.
+        """
+
+        volume_semaphores = {}
+        transfers_queue = queue.Queue()
+        for src, dst, opts in transfers:
+            semaphore = None
+            if self._max_workers_per_volume > 0:
+                volume = self._get_volume(dst)
+                semaphore = volume_semaphores.get(volume)
+                if semaphore is None:
+                    semaphore = threading.BoundedSemaphore(
+                        self._max_workers_per_volume)
+                    volume_semaphores[volume] = semaphore
+            transfers_queue.put((src, dst, opts, semaphore))
+
+        errors = []
+
+        def _worker():
+            while not errors:
+                try:
+                    src, dst, opts, semaphore = transfers_queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    if semaphore is None:
+                        self._transfer_file(src, dst, opts)
+                    else:
+                        with semaphore:
+                            self._transfer_file(src, dst, opts)
+                except Exception:
+                    errors.append(sys.exc_info())
+                    return
+
+        workers_count = min(self._max_workers, len(transfers))
+        self.log.debug("Transferring {} files using {} threads".format(
+            len(transfers), workers_count))
+        threads = [
+            threading.Thread(target=_worker)
+            for _ in range(workers_count)
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            six.reraise(*errors[0])
+
+    def _transfer_file(self, src, dst, opts):
+        start = time.time()
+        mode = opts["mode"]
+        if mode == self.MODE_HARDLINK_OR_COPY:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            try:
                 create_hard_link(src, dst)
+                mode = self.MODE_HARDLINK
+            except (OSError, NotImplementedError):
+                self.log.debug(
+                    "Hardlink failed, falling back to copy.", exc_info=True)
+                mode = self.MODE_COPY
+                copyfile(src, dst)
+
+        elif mode == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif mode == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
 
+        with self._lock:
             self._transferred.append(dst)
 
+        # Hardlinks point to the same data so there is nothing to verify
+        if mode == self.MODE_COPY:
+            self._verify_transfer(src, dst)
+
+        report = {
+            "src": src,
+            "dst": dst,
+            "mode": mode,
+            "size": os.path.getsize(dst),
+            "duration": time.time() - start,
+        }
+        with self._lock:
+            self._transfer_reports.append(report)
+            report["processed"] = len(self._transfer_reports)
+            report["total"] = self._transfers_total
+
+        if self._progress_callback is not None:
+            self._progress_callback(report)
+
+    def _verify_transfer(self, src, dst):
+        if self._verify == self.VERIFY_NONE:
+            return
+
+        src_size = os.path.getsize(src)
+        dst_size = os.path.getsize(dst)
+        if src_size != dst_size:
+            raise TransferVerificationError(
+                "Transferred file size does not match source ({} != {}):"
+                " {} -> {}".format(src_size, dst_size, src, dst)
+            )
+
+        if (
+            self._verify == self.VERIFY_HASH
+            and self._file_hash(src) != self._file_hash(dst)
+        ):
+            raise TransferVerificationError(
+                "Transferred file hash does not match source: {} -> {}".format(
+                    src, dst)
+            )
+
+    def _file_hash(self, path):
+        return _get_file_hash(path, self._hash_chunk_size)
+
+    def _log_transfer_summary(self, duration):
+        if not self._transfer_reports:
+            return
+
+        size = sum(report["size"] for report in self._transfer_reports)
+        size_mb = float(size) / (1024 * 1024)
+        throughput = size_mb / duration if duration > 0 else 0.0
+        self.log.debug((
+            "Transferred {} files ({:.2f} MB) in {:.2f}s ({:.2f} MB/s)"
+        ).format(len(self._transfer_reports), size_mb, duration, throughput))
+
     def finalize(self):
         # Delete any backed up files
         for backup in self._backup_to_original.keys():
@@ -190,6 +491,19 @@ class FileTransaction(object):
         """Return the processed transfers destination paths"""
         return list(self._transferred)
 
+    @property
+    def transfer_reports(self):
+        """Reports of processed transfers.
+
+        Each report contains 'src', 'dst', 'mode', 'size' in bytes,
+        'duration' in seconds and 'processed'/'total' counts.
+
+        Returns:
+            list[dict[str, Any]]: Transfer reports in order of processing.
+        """
+
+        return list(self._transfer_reports)
+
     @property
     def backups(self):
         """Return the backup file paths"""
@@ -197,6 +511,9 @@ class FileTransaction(object):
 
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
+        if dirname in self._created_dirs:
+            return
+
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -205,6 +522,26 @@ class FileTransaction(object):
             else:
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
+        self._created_dirs.add(dirname)
+
+    def _get_volume(self, path):
+        """Volume of path used to limit concurrent transfers.
+
+        Drive letter or UNC share is used on Windows, mount point on other
+        platforms.
+        """
+
+        drive, _ = os.path.splitdrive(path)
+        if drive:
+            return drive.lower()
+
+        path = os.path.dirname(path)
+        while not os.path.ismount(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return path
 
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
@@ -22,6 +22,7 @@ import sys
 import time
 import traceback
 import threading
+import collections
 import copy
 
 from openpype import AYON_SERVER_ENABLED
@@ -162,7 +163,12 @@ class MongoFormatter(logging.Formatter):
             'method': record.funcName,
             'lineNumber': record.lineno
         }
-        document.update(Logger.get_process_data())
+        # Process data contain only immutable values so it's not needed
+        #   to deepcopy them for each record
+        process_data = Logger.process_data
+        if process_data is None:
+            process_data = Logger.get_process_data()
+        document.update(process_data)
 
         # Standard document decorated with exception info
         if record.exc_info is not None:
@@ -182,6 +188,167 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class BufferedMongoHandler(MongoHandler):
+    """Mongo handler which inserts records in batches from background thread.
+
+    Records are formatted when emitted and stored to buffer with limited
+    size. Background thread writes buffered documents with 'insert_many'
+    when 'batch_size' is reached or 'flush_interval' passed. Remaining
+    documents are written on 'flush' and 'close' which is called on
+    process exit by logging module.
+
+    When buffer is full the behavior is defined by 'overflow_policy':
+    - "drop_oldest" oldest buffered document is dropped
+    - "drop_newest" emitted record is dropped
+    - "block" emit waits until there is space in buffer (with timeout)
+
+    Count of dropped records is logged to database with next batch.
+
+    Args:
+        buffer_size (Optional[int]): Max count of buffered documents.
+        batch_size (Optional[int]): Max count of documents in one insert.
+        flush_interval (Optional[float]): Max seconds between inserts.
+        overflow_policy (Optional[str]): Behavior when buffer is full.
+        **kwargs: Keyword arguments for 'MongoHandler'.
+    """
+
+    _block_timeout = 5
+
+    def __init__(
+        self,
+        buffer_size=10000,
+        batch_size=100,
+        flush_interval=1.0,
+        overflow_policy="drop_oldest",
+        **kwargs
+    ):
+        if overflow_policy not in ("drop_oldest", "drop_newest", "block"):
+            raise ValueError(
+                "Unknown overflow policy \"{}\"".format(overflow_policy))
+
+        super(BufferedMongoHandler, self).__init__(**kwargs)
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+
+        self._buffer = collections.deque()
+        self._dropped = 0
+        self._writing = False
+        self._stopped = False
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._write_loop, name="BufferedMongoHandler"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def emit(self, record):
+        if self.collection is None or self._stopped:
+            return
+
+        try:
+            document = self.format(record)
+        except Exception:
+            if not self.fail_silently:
+                self.handleError(record)
+            return
+
+        with self._condition:
+            if len(self._buffer) >= self.buffer_size:
+                if self.overflow_policy == "drop_newest":
+                    self._dropped += 1
+                    return
+
+                if self.overflow_policy == "block":
+                    self._condition.notify_all()
+                    self._condition.wait(self._block_timeout)
+
+                if len(self._buffer) >= self.buffer_size:
+                    self._buffer.popleft()
+                    self._dropped += 1
+
+            self._buffer.append(document)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+
+    def flush(self):
+        """Write all buffered documents."""
+        with self._condition:
+            while (
+                (self._buffer or self._writing)
+                and self._thread.is_alive()
+            ):
+                self._condition.notify_all()
+                self._condition.wait(self.flush_interval)
+
+        # Writer thread is not running (e.g. on interpreter shutdown)
+        if self._buffer:
+            self._write_buffer()
+
+    def close(self):
+        self.flush()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        super(BufferedMongoHandler, self).close()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                if (
+                    not self._stopped
+                    and len(self._buffer) < self.batch_size
+                ):
+                    self._condition.wait(self.flush_interval)
+
+                if self._stopped:
+                    return
+
+            self._write_buffer()
+
+    def _write_buffer(self):
+        while True:
+            with self._condition:
+                documents = []
+                while self._buffer and len(documents) < self.batch_size:
+                    documents.append(self._buffer.popleft())
+
+                if self._dropped:
+                    documents.append(self._get_dropped_document())
+                    self._dropped = 0
+
+                self._writing = bool(documents)
+                # Notify emit waiting for free space in buffer
+                self._condition.notify_all()
+
+            if not documents:
+                return
+
+            try:
+                self.collection.insert_many(documents, ordered=False)
+            except Exception:
+                if not self.fail_silently:
+                    traceback.print_exc()
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _get_dropped_document(self):
+        document = {
+            "timestamp": datetime.datetime.now(),
+            "level": "WARNING",
+            "message": (
+                "{} log records were dropped because log buffer was full"
+            ).format(self._dropped),
+            "loggerName": self.__class__.__name__,
+        }
+        document.update(Logger.get_process_data())
+        return document
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -220,6 +387,16 @@ class Logger:
     # Logging level - OPENPYPE_LOG_LEVEL
     log_level = None
 
+    # Options of buffered mongo handler
+    mongo_buffer_size = 10000
+    mongo_batch_size = 100
+    mongo_flush_interval = 1.0
+    mongo_overflow_policy = "drop_oldest"
+    # Mongo handler shared by all loggers in process
+    _mongo_handler = None
+    _mongo_handler_pid = None
+    _mongo_handler_lock = threading.Lock()
+
     # Data same for all record documents
     process_data = None
     # Cached process name or ability to set different process name
@@ -280,11 +457,32 @@ class Logger:
 
     @classmethod
     def _get_mongo_handler(cls):
+        """Mongo handler shared by all loggers.
+
+        Handler is created only once per process so there is single buffer
+        and single writer thread. New handler is created in forked process
+        as writer thread is not running there.
+        """
+
         cls.bootstrap_mongo_log()
 
         if not cls.use_mongo_logging:
             return
 
+        with cls._mongo_handler_lock:
+            handler = cls._mongo_handler
+            if (
+                handler is None
+                or handler._stopped
+                or cls._mongo_handler_pid != os.getpid()
+            ):
+                handler = cls._create_mongo_handler()
+                cls._mongo_handler = handler
+                cls._mongo_handler_pid = os.getpid()
+        return handler
+
+    @classmethod
+    def _create_mongo_handler(cls):
         components = get_default_components()
         kwargs = {
             "host": components["host"],
@@ -293,14 +491,18 @@ class Logger:
             "username": components["username"],
             "password": components["password"],
             "capped": True,
-            "formatter": MongoFormatter()
+            "formatter": MongoFormatter(),
+            "buffer_size": cls.mongo_buffer_size,
+            "batch_size": cls.mongo_batch_size,
+            "flush_interval": cls.mongo_flush_interval,
+            "overflow_policy": cls.mongo_overflow_policy,
         }
         if components["port"] is not None:
             kwargs["port"] = int(components["port"])
         if components["auth_db"]:
             kwargs["authentication_db"] = components["auth_db"]
 
-        return MongoHandler(**kwargs)
+        return BufferedMongoHandler(**kwargs)
 
     @classmethod
     def _get_console_handler(cls):
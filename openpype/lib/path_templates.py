@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import numbers
+import threading
 import collections
 
 import six
@@ -81,7 +82,17 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of templates are cached by template string so the same
+    template is parsed only once. Size of the cache is limited by
+    'compiled_cache_size', least recently used templates are removed.
+    """
+
+    compiled_cache_size = 1024
+    _compiled_cache = collections.OrderedDict()
+    _compiled_cache_lock = threading.Lock()
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +100,53 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts = self._get_compiled_parts(template)
+
+    @classmethod
+    def _get_compiled_parts(cls, template):
+        """Parsed parts of template from cache.
+
+        Parts are shared between template objects and must not be modified.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Template parts.
+        """
+
+        cache = StringTemplate._compiled_cache
+        with StringTemplate._compiled_cache_lock:
+            parts = cache.pop(template, None)
+            if parts is not None:
+                cache[template] = parts
+                return parts
+
+        parts = cls.compile_parts(template)
+        with StringTemplate._compiled_cache_lock:
+            cache[template] = parts
+            while len(cache) > cls.compiled_cache_size:
+                cache.popitem(last=False)
+        return parts
+
+    @classmethod
+    def clear_compiled_cache(cls):
+        """Clear cache of parsed templates."""
+
+        with StringTemplate._compiled_cache_lock:
+            StringTemplate._compiled_cache.clear()
+
+    @classmethod
+    def compile_parts(cls, template):
+        """Parse template string into parts.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Template parts.
+        """
+
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +177,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -151,6 +209,28 @@ class StringTemplate(object):
             TemplateResult: Filled or partially filled template containing all
                 data needed or missing for filling template.
         """
+        # Fast path for templates which can be fully solved with data
+        used_values = {}
+        output = self._format_solvable(self._parts, data, used_values)
+        if output is not None:
+            clean_used_values = {}
+            for path, value in used_values.values():
+                values = clean_used_values
+                for subkey in path[:-1]:
+                    if subkey not in values:
+                        values[subkey] = {}
+                    values = values[subkey]
+                values[path[-1]] = value
+
+            return TemplateResult(
+                output,
+                self.template,
+                True,
+                clean_used_values,
+                set(),
+                {}
+            )
+
         result = TemplatePartResult()
         for part in self._parts:
             if isinstance(part, six.string_types):
@@ -182,6 +262,64 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_list, strict=False):
+        """Format template with multiple data at once.
+
+        Args:
+            data_list (Iterable[dict]): Data used to fill the template.
+            strict (Optional[bool]): Validate that results are solved.
+
+        Returns:
+            list[TemplateResult]: Results in order of passed data.
+        """
+
+        if strict:
+            return [self.format_strict(data) for data in data_list]
+        return [self.format(data) for data in data_list]
+
+    @classmethod
+    def _format_solvable(cls, parts, data, used_values):
+        """Format parts without tracking of missing keys.
+
+        Optional parts which can't be filled are skipped the same way as
+        in full formatting.
+
+        Args:
+            parts (list[Union[str, FormattingPart, OptionalPart]]): Parts
+                to format.
+            data (dict): Data used to fill the template.
+            used_values (dict[str, tuple[list[str], str]]): Used formatted
+                values with their key path are stored here.
+
+        Returns:
+            Union[str, None]: Output or None if any required key can't be
+                filled.
+        """
+
+        output = []
+        for part in parts:
+            if isinstance(part, six.string_types):
+                output.append(part)
+
+            elif isinstance(part, OptionalPart):
+                part_used_values = {}
+                part_output = cls._format_solvable(
+                    part.parts, data, part_used_values
+                )
+                if part_output is not None:
+                    output.append(part_output)
+                    used_values.update(part_used_values)
+
+            else:
+                formatted_value = part.format_value(data)
+                if formatted_value is None:
+                    return None
+                used_values[part.existence_check] = (
+                    part.used_value_path, formatted_value
+                )
+                output.append(formatted_value)
+        return "".join(output)
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -704,10 +842,34 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Pre-parse the key so it's not done on each format
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        # Path of key in used values (see 'split_keys_to_subdicts')
+        used_value_key = existence_check
+        key_padding = list(KEY_PADDING_PATTERN.findall(used_value_key))
+        if key_padding:
+            used_value_key = key_padding[0]
+        self._used_value_path = list(SUB_DICT_PATTERN.findall(used_value_key))
+
     @property
     def template(self):
         return self._template
 
+    @property
+    def existence_check(self):
+        return self._existence_check
+
+    @property
+    def used_value_path(self):
+        return self._used_value_path
+
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
@@ -732,17 +894,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -784,17 +943,7 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
-
-            formatted_value = self.template.format(**fill_data)
+            formatted_value = self._format_key_value(used_keys, value)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
             result.add_output(formatted_value)
@@ -805,6 +954,40 @@ class FormattingPart:
 
         return result
 
+    def format_value(self, data):
+        """Format the key if it can be filled with data.
+
+        Args:
+            data(dict): Data that should be used for formatting.
+
+        Returns:
+            Union[str, None]: Formatted value or None if key is missing in
+                data or value has invalid type.
+        """
+
+        value = data
+        for sub_key in self._key_subdict:
+            if not hasattr(value, "items") or sub_key not in value:
+                return None
+            value = value.get(sub_key)
+
+        if not self.validate_value_type(value):
+            return None
+        return self._format_key_value(self._key_subdict, value)
+
+    def _format_key_value(self, used_keys, value):
+        fill_data = {}
+        first_value = True
+        for used_key in reversed(used_keys):
+            if first_value:
+                first_value = False
+                fill_data[used_key] = value
+            else:
+                _fill_data = {used_key: fill_data}
+                fill_data = _fill_data
+
+        return self.template.format(**fill_data)
+
 
 class OptionalPart:
     """Template part which contains optional formatting strings.
@@ -1,8 +1,15 @@
 import re
 import logging
+import threading
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Characters which make a filter value a regex instead of exact value
+_REGEX_CHARS = set(".^$*+?{}[]\\|()")
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -152,24 +159,15 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not logger:
         logger = log
 
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
+    keys_order = _get_keys_order(key_values, keys_order)
 
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    log_parts = None
+    if debug_enabled:
+        log_parts = _get_log_parts(key_values)
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
 
     matching_profiles = None
     highest_profile_points = -1
@@ -184,11 +182,12 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             value = key_values[key]
             match = validate_value_by_regexes(value, profile.get(key))
             if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
+                if debug_enabled:
+                    profile_value = profile.get(key) or []
+                    logger.debug(
+                        "\"{}\" not found in \"{}\": {}".format(
+                            value, key, profile_value)
+                    )
                 profile_points = -1
                 break
 
@@ -209,19 +208,294 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             matching_profiles.append((profile, profile_scores))
 
     if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
+        if debug_enabled:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
         return None
 
-    if len(matching_profiles) > 1:
+    if debug_enabled and len(matching_profiles) > 1:
         logger.debug(
             "More than one profile match your setup. {}".format(log_parts)
         )
 
     profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
+    if profile and debug_enabled:
         logger.debug(
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+def _get_log_parts(key_values):
+    return " | ".join([
+        "{}: \"{}\"".format(*item)
+        for item in key_values.items()
+    ])
+
+
+def _get_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
+class _ProfilesKeyIndex(object):
+    """Index of profiles filter values for single key.
+
+    Filter values without regex characters are stored in hash buckets by
+    value, other values are compiled to regexes once.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions.
+        key (str): Key of filter in profiles.
+    """
+
+    def __init__(self, profiles_data, key):
+        self.wildcard_indexes = set()
+        self.restricted_indexes = []
+        self._exact_indexes = collections.defaultdict(set)
+        # Same regex used in multiple profiles is evaluated only once
+        self._regex_items = collections.OrderedDict()
+        self._filter_values = {}
+
+        for idx, profile in enumerate(profiles_data):
+            in_list = profile.get(key)
+            if not in_list:
+                self.wildcard_indexes.add(idx)
+                continue
+
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" in in_list:
+                self.wildcard_indexes.add(idx)
+                continue
+
+            self.restricted_indexes.append(idx)
+            self._filter_values[idx] = in_list
+            for item in in_list:
+                if not item:
+                    continue
+                if (
+                    isinstance(item, six.string_types)
+                    and not _REGEX_CHARS.intersection(item)
+                ):
+                    self._exact_indexes[item].add(idx)
+                    continue
+
+                regex_item = self._regex_items.get(item)
+                if regex_item is None:
+                    regexes = compile_list_of_regexes([item])
+                    if not regexes:
+                        continue
+                    regex_item = (regexes[0], set())
+                    self._regex_items[item] = regex_item
+                regex_item[1].add(idx)
+
+    def get_matching_indexes(self, value):
+        """Indexes of restricted profiles matching the value."""
+        if not value:
+            return set()
+
+        if not isinstance(value, six.string_types):
+            # Keep behavior of 'validate_value_by_regexes' for other types
+            return {
+                idx
+                for idx in self.restricted_indexes
+                if validate_value_by_regexes(
+                    value, self._filter_values[idx]) == 1
+            }
+
+        output = set(self._exact_indexes.get(value, ()))
+        for regex, indexes in self._regex_items.values():
+            if indexes.issubset(output):
+                continue
+            if hasattr(regex, "fullmatch"):
+                result = regex.fullmatch(value)
+            else:
+                result = fullmatch(regex, value)
+            if result:
+                output |= indexes
+        return output
+
+
+class CompiledProfiles(object):
+    """Profiles prepared for repeated filtering.
+
+    Result of 'filter' is same as result of 'filter_profiles' with same
+    arguments. Filter values of profiles are indexed per key on first use
+    and results of recent queries are memoized.
+
+    Profiles must not be changed after the object is created. Use
+    'get_compiled_profiles' to reuse the object for same profiles list.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+        cache_size (Optional[int]): Count of memoized query results.
+    """
+
+    def __init__(self, profiles_data, cache_size=256):
+        self._profiles = list(profiles_data or [])
+        self._cache_size = cache_size
+        self._key_indexes = {}
+        self._results_cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def profiles(self):
+        return list(self._profiles)
+
+    def _get_key_index(self, key):
+        index = self._key_indexes.get(key)
+        if index is None:
+            index = _ProfilesKeyIndex(self._profiles, key)
+            self._key_indexes[key] = index
+        return index
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = _get_keys_order(key_values, keys_order)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        log_parts = None
+        if debug_enabled:
+            log_parts = _get_log_parts(key_values)
+            logger.debug(
+                "Looking for matching profile for: {}".format(log_parts)
+            )
+
+        cache_key = None
+        try:
+            cache_key = (
+                keys_order,
+                tuple(key_values[key] for key in keys_order)
+            )
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None:
+            with self._lock:
+                hit = cache_key in self._results_cache
+                if hit:
+                    # Move to the end of recently used results
+                    profile = self._results_cache.pop(cache_key)
+                    self._results_cache[cache_key] = profile
+
+            if hit:
+                self._log_result(profile, logger, log_parts)
+                return profile
+
+        profile = self._filter(key_values, keys_order)
+        self._log_result(profile, logger, log_parts)
+
+        if cache_key is not None:
+            with self._lock:
+                self._results_cache[cache_key] = profile
+                while len(self._results_cache) > self._cache_size:
+                    self._results_cache.popitem(last=False)
+        return profile
+
+    def _filter(self, key_values, keys_order):
+        candidates = set(range(len(self._profiles)))
+        matching_by_key = []
+        for key in keys_order:
+            index = self._get_key_index(key)
+            matching = index.get_matching_indexes(key_values[key])
+            candidates &= (index.wildcard_indexes | matching)
+            if not candidates:
+                return None
+            matching_by_key.append(matching)
+
+        matching_profiles = []
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [idx in matching for matching in matching_by_key]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+            matching_profiles.append((self._profiles[idx], profile_scores))
+
+        return _profile_exclusion(matching_profiles, log)
+
+    def _log_result(self, profile, logger, log_parts):
+        if log_parts is None:
+            return
+
+        if profile is None:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
+        else:
+            logger.debug("Profile selected: {}".format(profile))
+
+
+_COMPILED_PROFILES_CACHE = collections.OrderedDict()
+_COMPILED_PROFILES_CACHE_SIZE = 64
+_COMPILED_PROFILES_LOCK = threading.Lock()
+
+
+def get_compiled_profiles(profiles_data):
+    """Compiled profiles cached by identity of passed profiles.
+
+    Same 'CompiledProfiles' object is returned for same profiles list as
+    long as the list contains same profile objects. Profiles which are
+    changed in place must not be passed.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+
+    Returns:
+        CompiledProfiles: Compiled profiles.
+    """
+    if not profiles_data:
+        return CompiledProfiles(profiles_data)
+
+    key = id(profiles_data)
+    profile_ids = tuple(id(profile) for profile in profiles_data)
+    with _COMPILED_PROFILES_LOCK:
+        cached = _COMPILED_PROFILES_CACHE.get(key)
+        # Keep reference to profiles so their ids can't be reused
+        if (
+            cached is not None
+            and cached[0] is profiles_data
+            and cached[1] == profile_ids
+        ):
+            return cached[2]
+
+        compiled = CompiledProfiles(profiles_data)
+        _COMPILED_PROFILES_CACHE[key] = (
+            profiles_data, profile_ids, compiled
+        )
+        while len(_COMPILED_PROFILES_CACHE) > _COMPILED_PROFILES_CACHE_SIZE:
+            _COMPILED_PROFILES_CACHE.popitem(last=False)
+    return compiled
@@ -16,22 +16,48 @@ requirements. Possible requirement should be listed in 'pack_project' function.
 
 import os
 import json
+import ntpath
+import gzip
+import time
+import hashlib
 import platform
 import tempfile
 import shutil
 import datetime
+import threading
+import collections
 
 import zipfile
+from bson.json_util import loads, dumps, CANONICAL_JSON_OPTIONS
+
 from openpype.client.mongo import (
     load_json_file,
     get_project_connection,
     replace_project_documents,
-    store_project_documents,
 )
 
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
+MANIFEST_FILE_NAME = "manifest"
 PROJECT_FILES_DIR = "project_files"
+PACKAGE_DIR_SUFFIX = "_package"
+FILES_PART_TEMPLATE = "files_{:0>5}.zip"
+# Version of package created by 'pack_project'
+# - version 1 is single zip file with all data
+# - version 2 is directory with streamed documents, zip parts and manifest
+PACKAGE_VERSION = 2
+
+# Limits of one zip part with project files
+FILES_PART_MAX_SIZE = 4 * 1024 ** 3
+FILES_PART_MAX_COUNT = 10000
+DOCUMENTS_BATCH_SIZE = 1000
+COPY_CHUNK_SIZE = 1024 * 1024
+# Files which are already compressed and are stored without compression
+COMPRESSED_EXTENSIONS = {
+    ".exr", ".mov", ".mp4", ".mkv", ".avi", ".webm", ".mxf",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".rar",
+}
 
 
 def add_timestamp(filepath):
@@ -61,35 +87,276 @@ def get_project_document(project_name, database_name=None):
     return col.find_one({"type": "project"})
 
 
-def _pack_files_to_zip(zip_stream, source_path, root_path):
-    """Pack files to a zip stream.
+def _get_documents_filename():
+    return "{}.jsonl.gz".format(DOCUMENTS_FILE_NAME)
+
+
+def _get_manifest_filename():
+    return "{}.jsonl".format(MANIFEST_FILE_NAME)
+
+
+def _pack_documents(project_name, package_dir, database_name=None):
+    """Stream project documents to gzipped file with document per line.
+
+    Documents are never all loaded in memory. Output is written to temp file
+    which is renamed when all documents are stored.
+
+    Args:
+        project_name (str): Name of project.
+        package_dir (str): Directory of package.
+        database_name (Optional[str]): Name of mongo database where to look for
+            project.
+
+    Returns:
+        int: Count of stored documents.
+    """
+
+    filepath = os.path.join(package_dir, _get_documents_filename())
+    tmp_filepath = filepath + ".tmp"
+    collection = get_project_connection(project_name, database_name)
+    count = 0
+    with gzip.open(tmp_filepath, "wb") as stream:
+        cursor = collection.find({}).batch_size(DOCUMENTS_BATCH_SIZE)
+        for doc in cursor:
+            line = dumps(doc, json_options=CANONICAL_JSON_OPTIONS) + "\n"
+            stream.write(line.encode("utf-8"))
+            count += 1
+
+    if os.path.exists(filepath):
+        os.remove(filepath)
+    os.rename(tmp_filepath, filepath)
+    return count
+
+
+def _iter_package_documents(package_dir):
+    filepath = os.path.join(package_dir, _get_documents_filename())
+    with gzip.open(filepath, "rb") as stream:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield loads(line.decode("utf-8"))
+
+
+def _load_manifest(package_dir):
+    """Load manifest of already packed files.
+
+    Returns:
+        dict[str, dict[str, Any]]: Information about packed files by path
+            relative to root.
+    """
+
+    filepath = os.path.join(package_dir, _get_manifest_filename())
+    output = {}
+    if not os.path.exists(filepath):
+        return output
+
+    with open(filepath, "r") as stream:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                # Last line may be incomplete if packing was killed
+                continue
+            output[item["path"]] = item
+    return output
+
+
+def _get_files_parts(source_path, root_path, manifest, first_index):
+    """Split project files which are not packed yet into zip parts.
 
     Args:
-        zip_stream (zipfile.ZipFile): Stream to a zipfile.
         source_path (str): Path to a directory where files are.
         root_path (str): Path to a directory which is used for calculation
             of relative path.
+        manifest (dict[str, dict[str, Any]]): Already packed files.
+        first_index (int): Index of first part.
+
+    Returns:
+        list[tuple[str, list[tuple[str, str]]]]: Part filename with list of
+            filepaths and paths relative to root.
     """
 
+    parts = []
+    part_files = []
+    part_size = 0
+    index = first_index
     for root, _, filenames in os.walk(source_path):
         for filename in filenames:
             filepath = os.path.join(root, filename)
-            # TODO add one more folder
-            archive_name = os.path.join(
-                PROJECT_FILES_DIR,
-                os.path.relpath(filepath, root_path)
-            )
-            zip_stream.write(filepath, archive_name)
+            rel_path = os.path.relpath(filepath, root_path).replace("\\", "/")
+            stat = os.stat(filepath)
+            packed_item = manifest.get(rel_path)
+            if (
+                packed_item is not None
+                and packed_item["size"] == stat.st_size
+                and packed_item["mtime"] == stat.st_mtime
+            ):
+                continue
+
+            if part_files and (
+                part_size + stat.st_size > FILES_PART_MAX_SIZE
+                or len(part_files) >= FILES_PART_MAX_COUNT
+            ):
+                parts.append((FILES_PART_TEMPLATE.format(index), part_files))
+                index += 1
+                part_files = []
+                part_size = 0
+
+            part_files.append((filepath, rel_path))
+            part_size += stat.st_size
+
+    if part_files:
+        parts.append((FILES_PART_TEMPLATE.format(index), part_files))
+    return parts
+
+
+def _pack_file(zip_stream, filepath, rel_path):
+    """Write file to zip and calculate its hash during single read.
+
+    Returns:
+        dict[str, Any]: Manifest item of the file.
+    """
+
+    stat = os.stat(filepath)
+    zinfo = zipfile.ZipInfo.from_file(
+        filepath, rel_path, strict_timestamps=False
+    )
+    ext = os.path.splitext(filepath)[-1].lower()
+    if ext in COMPRESSED_EXTENSIONS:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as src_stream:
+        with zip_stream.open(zinfo, "w", force_zip64=True) as dst_stream:
+            while True:
+                chunk = src_stream.read(COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                file_hash.update(chunk)
+                dst_stream.write(chunk)
+
+    return {
+        "path": rel_path,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "sha256": file_hash.hexdigest(),
+    }
+
+
+class _FilesPacker:
+    """Pack zip parts with project files in worker threads.
+
+    Each part is written to temp file by one worker and renamed when is
+    complete. Files of complete part are added to manifest so interrupted
+    packing can be resumed.
+
+    Args:
+        package_dir (str): Directory of package.
+        parts (list[tuple[str, list[tuple[str, str]]]]): Parts to pack.
+        workers (int): Number of worker threads.
+    """
+
+    def __init__(self, package_dir, parts, workers):
+        self._package_dir = package_dir
+        self._parts = collections.deque(parts)
+        self._workers = max(1, min(workers, len(parts)))
+        self._lock = threading.Lock()
+        self._errors = []
+        self._done_parts = 0
+        self._parts_count = len(parts)
+
+    def pack(self):
+        threads = []
+        for _ in range(self._workers):
+            thread = threading.Thread(target=self._worker)
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+    def _worker(self):
+        while not self._errors:
+            with self._lock:
+                if not self._parts:
+                    return
+                part_name, files = self._parts.popleft()
+
+            try:
+                self._pack_part(part_name, files)
+            except Exception as exc:
+                with self._lock:
+                    self._errors.append(exc)
+                return
+
+    def _pack_part(self, part_name, files):
+        part_path = os.path.join(self._package_dir, part_name)
+        tmp_path = part_path + ".tmp"
+        manifest_items = []
+        with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as zip_stream:
+            for filepath, rel_path in files:
+                if self._errors:
+                    return
+                item = _pack_file(zip_stream, filepath, rel_path)
+                item["part"] = part_name
+                manifest_items.append(item)
+
+        os.rename(tmp_path, part_path)
+
+        manifest_path = os.path.join(
+            self._package_dir, _get_manifest_filename()
+        )
+        with self._lock:
+            with open(manifest_path, "a") as stream:
+                for item in manifest_items:
+                    stream.write(json.dumps(item) + "\n")
+                stream.flush()
+                os.fsync(stream.fileno())
+            self._done_parts += 1
+            print("Packed part {} ({}/{})".format(
+                part_name, self._done_parts, self._parts_count
+            ))
+
+
+def _get_parts_start_index(package_dir):
+    index = 0
+    for filename in os.listdir(package_dir):
+        if filename.endswith(".tmp"):
+            # Remove incomplete part from previous run
+            os.remove(os.path.join(package_dir, filename))
+            continue
+
+        if filename.startswith("files_") and filename.endswith(".zip"):
+            part_index = filename[len("files_"):-len(".zip")]
+            if part_index.isdigit():
+                index = max(index, int(part_index) + 1)
+    return index
 
 
 def pack_project(
     project_name,
     destination_dir=None,
     only_documents=False,
-    database_name=None
+    database_name=None,
+    workers=None,
+    resume=False
 ):
     """Make a package of a project with mongo documents and files.
 
+    Package is a directory with metadata, documents streamed to gzipped
+    file with document per line, project files in zip parts and manifest
+    with hashes of packed files. Zip parts are compressed in parallel
+    by worker threads. Already compressed media are stored without
+    compression.
+
     This function has few restrictions:
     - project must have only one root
     - project must have all templates starting with
@@ -97,12 +364,19 @@ def pack_project(
 
     Args:
         project_name (str): Project that should be packaged.
-        destination_dir (Optional[str]): Optional path where zip will be
+        destination_dir (Optional[str]): Optional path where package will be
             stored. Project's root is used if not passed.
         only_documents (Optional[bool]): Pack only Mongo documents and skip
             files.
         database_name (Optional[str]): Custom database name from which is
             project queried.
+        workers (Optional[int]): Number of threads packing files. Count of
+            CPUs is used if not passed.
+        resume (Optional[bool]): Continue in existing package. Files which
+            are in manifest and were not modified are not packed again.
+
+    Returns:
+        str: Path to package directory.
     """
 
     print("Creating package of project \"{}\"".format(project_name))
@@ -144,7 +418,7 @@ def pack_project(
         if not os.path.exists(project_source_path):
             raise ValueError("Didn't find source of project files")
 
-    # Determine zip filepath where data will be stored
+    # Determine package directory where data will be stored
     if not destination_dir:
         destination_dir = root_path
 
@@ -154,55 +428,55 @@ def pack_project(
         )
 
     destination_dir = os.path.normpath(destination_dir)
-    if not os.path.exists(destination_dir):
-        os.makedirs(destination_dir)
+    package_dir = os.path.join(
+        destination_dir, project_name + PACKAGE_DIR_SUFFIX
+    )
 
-    zip_path = os.path.join(destination_dir, project_name + ".zip")
+    print("Project will be packaged into \"{}\"".format(package_dir))
+    # Rename already existing package
+    if os.path.exists(package_dir) and not resume:
+        os.rename(package_dir, add_timestamp(package_dir))
 
-    print("Project will be packaged into \"{}\"".format(zip_path))
-    # Rename already existing zip
-    if os.path.exists(zip_path):
-        dst_filepath = add_timestamp(zip_path)
-        os.rename(zip_path, dst_filepath)
+    if not os.path.exists(package_dir):
+        os.makedirs(package_dir)
 
     # We can add more data
     metadata = {
         "project_name": project_name,
         "root": source_root,
-        "version": 1
+        "version": PACKAGE_VERSION
     }
-    # Create temp json file where metadata are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_metadata_json = s.name
-
-    with open(temp_metadata_json, "w") as stream:
+    metadata_path = os.path.join(package_dir, METADATA_FILE_NAME + ".json")
+    with open(metadata_path, "w") as stream:
         json.dump(metadata, stream)
 
-    # Create temp json file where database documents are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_docs_json = s.name
-
-    # Query all project documents and store them to temp json
-    store_project_documents(project_name, temp_docs_json, database_name)
-
-    print("Packing files into zip")
-    # Write all to zip file
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
-        # Add metadata file
-        zip_stream.write(temp_metadata_json, METADATA_FILE_NAME + ".json")
-        # Add database documents
-        zip_stream.write(temp_docs_json, DOCUMENTS_FILE_NAME + ".json")
+    print("Packing documents")
+    docs_count = _pack_documents(project_name, package_dir, database_name)
+    print("Packed {} documents".format(docs_count))
 
-        # Add project files to zip
-        if not only_documents:
-            _pack_files_to_zip(zip_stream, project_source_path, root_path)
-
-    print("Cleaning up")
-    # Cleanup
-    os.remove(temp_docs_json)
-    os.remove(temp_metadata_json)
+    if not only_documents:
+        manifest = _load_manifest(package_dir)
+        parts = _get_files_parts(
+            project_source_path,
+            root_path,
+            manifest,
+            _get_parts_start_index(package_dir)
+        )
+        if manifest:
+            print("Resuming package with {} packed files".format(
+                len(manifest)
+            ))
+
+        print("Packing files into {} zip parts".format(len(parts)))
+        if parts:
+            if not workers:
+                workers = os.cpu_count() or 1
+            start_time = time.time()
+            _FilesPacker(package_dir, parts, workers).pack()
+            print("Files packed in {:.2f}s".format(time.time() - start_time))
 
     print("*** Packing finished ***")
+    return package_dir
 
 
 def _unpack_project_files(unzip_dir, root_path, project_name):
@@ -225,6 +499,21 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
     if not os.path.exists(src_project_files_dir):
         return
 
+    dst_project_files_dir = _prepare_project_files_dir(root_path, project_name)
+
+    print("Moving project files from temp \"{}\" -> \"{}\"".format(
+        src_project_files_dir, dst_project_files_dir
+    ))
+    shutil.move(src_project_files_dir, dst_project_files_dir)
+
+
+def _prepare_project_files_dir(root_path, project_name):
+    """Make sure root exists and rename existing project folder.
+
+    Returns:
+        str: Path to project folder in root.
+    """
+
     # Make sure root path exists
     if not os.path.exists(root_path):
         os.makedirs(root_path)
@@ -238,33 +527,243 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
             dst_project_files_dir, new_path
         ))
         os.rename(dst_project_files_dir, new_path)
+    return dst_project_files_dir
 
-    print("Moving project files from temp \"{}\" -> \"{}\"".format(
-        src_project_files_dir, dst_project_files_dir
-    ))
-    shutil.move(src_project_files_dir, dst_project_files_dir)
+
+def _get_member_dst_path(root_path, member_name):
+    """Path where zip member is extracted.
+
+    Args:
+        root_path (str): Path to root where files are extracted.
+        member_name (str): Name of member in zip part.
+
+    Returns:
+        str: Normalized path to extracted file.
+
+    Raises:
+        ValueError: Member name is absolute, contains drive or points
+            outside of root.
+    """
+
+    if (
+        os.path.isabs(member_name)
+        or ntpath.isabs(member_name)
+        or ntpath.splitdrive(member_name)[0]
+    ):
+        raise ValueError(
+            "Package contains absolute path \"{}\"".format(member_name)
+        )
+
+    root_path = os.path.normpath(os.path.abspath(root_path))
+    dst_path = os.path.normpath(os.path.join(root_path, member_name))
+    if not dst_path.startswith(os.path.join(root_path, "")):
+        raise ValueError(
+            "Package contains path outside of root \"{}\"".format(
+                member_name
+            )
+        )
+    return dst_path
+
+
+def _unpack_part(part_path, root_path, manifest_items):
+    """Extract files of zip part to root and validate their hashes.
+
+    Args:
+        part_path (str): Path to zip part.
+        root_path (str): Path to root where files are extracted.
+        manifest_items (dict[str, dict[str, Any]]): Manifest items of files
+            which should be extracted from the part by path relative to root.
+    """
+
+    with zipfile.ZipFile(part_path, "r") as zip_stream:
+        for zinfo in zip_stream.infolist():
+            # File was packed again to other part during resumed packing
+            item = manifest_items.get(zinfo.filename)
+            if item is None:
+                continue
+
+            dst_path = _get_member_dst_path(root_path, zinfo.filename)
+            dst_dir = os.path.dirname(dst_path)
+            if not os.path.exists(dst_dir):
+                try:
+                    os.makedirs(dst_dir)
+                except OSError:
+                    # Created by other thread
+                    if not os.path.isdir(dst_dir):
+                        raise
+
+            file_hash = hashlib.sha256()
+            with zip_stream.open(zinfo, "r") as src_stream:
+                with open(dst_path, "wb") as dst_stream:
+                    while True:
+                        chunk = src_stream.read(COPY_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        file_hash.update(chunk)
+                        dst_stream.write(chunk)
+
+            if item["sha256"] != file_hash.hexdigest():
+                raise ValueError(
+                    "Hash of unpacked file does not match \"{}\"".format(
+                        dst_path
+                    )
+                )
+
+
+def _unpack_files_parts(package_dir, root_path, project_name, workers):
+    manifest = _load_manifest(package_dir)
+    items_by_part = collections.defaultdict(dict)
+    for item in manifest.values():
+        items_by_part[item["part"]][item["path"]] = item
+
+    part_names = collections.deque(sorted(items_by_part.keys()))
+    if not part_names:
+        return
+
+    _prepare_project_files_dir(root_path, project_name)
+
+    lock = threading.Lock()
+    errors = []
+
+    def _worker():
+        while not errors:
+            with lock:
+                if not part_names:
+                    return
+                part_name = part_names.popleft()
+            try:
+                _unpack_part(
+                    os.path.join(package_dir, part_name),
+                    root_path,
+                    items_by_part[part_name]
+                )
+            except Exception as exc:
+                errors.append(exc)
+                return
+            print("Unpacked part {}".format(part_name))
+
+    if not workers:
+        workers = os.cpu_count() or 1
+    threads = []
+    for _ in range(max(1, min(workers, len(part_names)))):
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _restore_package_documents(package_dir, project_name, database_name):
+    """Stream documents from package to mongo in batches.
+
+    Warnings:
+        Existing project collection is removed if exists in mongo.
+    """
+
+    collection = get_project_connection(project_name, database_name)
+    collection.drop()
+    count = 0
+    batch = []
+    for doc in _iter_package_documents(package_dir):
+        batch.append(doc)
+        if len(batch) >= DOCUMENTS_BATCH_SIZE:
+            collection.insert_many(batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        collection.insert_many(batch)
+        count += len(batch)
+    return count
+
+
+def _change_project_root(project_name, new_root, database_name):
+    low_platform = platform.system().lower()
+    project_doc = get_project_document(project_name, database_name)
+    roots = project_doc["config"]["roots"]
+    key = tuple(roots.keys())[0]
+    update_key = "config.roots.{}.{}".format(key, low_platform)
+    collection = get_project_connection(project_name, database_name)
+    collection.update_one(
+        {"_id": project_doc["_id"]},
+        {"$set": {
+            update_key: new_root
+        }}
+    )
+
+
+def _unpack_package_dir(
+    package_dir, new_root, database_only, database_name, workers
+):
+    metadata_json_path = os.path.join(
+        package_dir, METADATA_FILE_NAME + ".json"
+    )
+    with open(metadata_json_path, "r") as stream:
+        metadata = json.load(stream)
+
+    low_platform = platform.system().lower()
+    project_name = metadata["project_name"]
+    root_path = metadata["root"].get(low_platform)
+
+    count = _restore_package_documents(
+        package_dir, project_name, database_name
+    )
+    print("Creating project documents ({})".format(count))
+
+    # Skip change of root if is the same as the one stored in metadata
+    if (
+        new_root
+        and (os.path.normpath(new_root) == os.path.normpath(root_path))
+    ):
+        new_root = None
+
+    if new_root:
+        print("Using different root path {}".format(new_root))
+        root_path = new_root
+        _change_project_root(project_name, new_root, database_name)
+
+    if not database_only:
+        _unpack_files_parts(package_dir, root_path, project_name, workers)
+
+    print("*** Unpack finished ***")
 
 
 def unpack_project(
-    path_to_zip, new_root=None, database_only=None, database_name=None
+    path_to_zip,
+    new_root=None,
+    database_only=None,
+    database_name=None,
+    workers=None
 ):
-    """Unpack project zip file to recreate project.
+    """Unpack project package to recreate project.
 
     Args:
-        path_to_zip (str): Path to zip which was created using 'pack_project'
-            function.
+        path_to_zip (str): Path to package directory or zip which was
+            created using 'pack_project' function.
         new_root (str): Optional way how to set different root path for
             unpacked project.
-        database_only (Optional[bool]): Unpack only database from zip.
+        database_only (Optional[bool]): Unpack only database from package.
         database_name (str): Name of database where project will be recreated.
+        workers (Optional[int]): Number of threads unpacking files from
+            package directory. Count of CPUs is used if not passed.
     """
 
     if database_only is None:
         database_only = False
 
-    print("Unpacking project from zip {}".format(path_to_zip))
+    print("Unpacking project from {}".format(path_to_zip))
     if not os.path.exists(path_to_zip):
-        print("Zip file does not exists: {}".format(path_to_zip))
+        print("Package does not exists: {}".format(path_to_zip))
+        return
+
+    if os.path.isdir(path_to_zip):
+        _unpack_package_dir(
+            path_to_zip, new_root, database_only, database_name, workers
+        )
         return
 
     tmp_dir = tempfile.mkdtemp(prefix="unpack_")
@@ -304,18 +803,7 @@ def unpack_project(
     if new_root:
         print("Using different root path {}".format(new_root))
         root_path = new_root
-
-        project_doc = get_project_document(project_name)
-        roots = project_doc["config"]["roots"]
-        key = tuple(roots.keys())[0]
-        update_key = "config.roots.{}.{}".format(key, low_platform)
-        collection = get_project_connection(project_name, database_name)
-        collection.update_one(
-            {"_id": project_doc["_id"]},
-            {"$set": {
-                update_key: new_root
-            }}
-        )
+        _change_project_root(project_name, new_root, database_name)
 
     _unpack_project_files(tmp_dir, root_path, project_name)
 
@@ -45,11 +45,15 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+def modules_from_path(folder_path, cache=None):
     """Get python scripts as modules from a path.
 
     Arguments:
         path (str): Path to folder containing python scripts.
+        cache (Optional[dict]): Cache of imported modules. Files which
+            modification time and size did not change since the cache was
+            filled are not imported again. Content of the cache is handled
+            by this function.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -88,12 +92,30 @@ def modules_from_path(folder_path):
         if not os.path.isfile(full_path):
             continue
 
+        file_stat = None
+        if cache is not None:
+            stat = os.stat(full_path)
+            file_stat = (stat.st_mtime, stat.st_size)
+            cached = cache.get(full_path)
+            if cached is not None and cached[0] == file_stat:
+                _, module, exc_info = cached
+                if module is not None:
+                    modules.append((full_path, module))
+                else:
+                    crashed.append((full_path, exc_info))
+                continue
+
         try:
             module = import_filepath(full_path, mod_name)
             modules.append((full_path, module))
+            if cache is not None:
+                cache[full_path] = (file_stat, module, None)
 
         except Exception:
-            crashed.append((full_path, sys.exc_info()))
+            exc_info = sys.exc_info()
+            crashed.append((full_path, exc_info))
+            if cache is not None:
+                cache[full_path] = (file_stat, None, exc_info)
             log.warning(
                 "Failed to load path: \"{0}\"".format(full_path),
                 exc_info=True
@@ -1106,6 +1106,7 @@ def convert_colorspace(
     display=None,
     additional_command_args=None,
     logger=None,
+    threads=None,
 ):
     """Convert source file from one color space to another.
 
@@ -1128,6 +1129,8 @@ def convert_colorspace(
         additional_command_args (list): arguments for oiiotool (like binary
             depth for .dpx)
         logger (logging.Logger): Logger used for logging.
+        threads (Optional[int]): Limit of threads used by oiiotool. All
+            available cores are used if not set.
     Raises:
         ValueError: if misconfigured
     """
@@ -1146,6 +1149,8 @@ def convert_colorspace(
         "--nosoftwareattrib",
         "--colorconfig", config_path
     )
+    if threads:
+        oiio_cmd.extend(["--threads", str(threads)])
 
     oiio_cmd.extend([
         input_arg, input_path,
@@ -16,9 +16,12 @@ from .base import (
     OpenPypeAddOn,
 
     load_modules,
+    load_modules_by_name,
+    get_addons_manifest,
 
     ModulesManager,
     TrayModulesManager,
+    get_modules_manager,
 
     BaseModuleSettingsDef,
     ModuleSettingsDef,
@@ -44,9 +47,12 @@ __all__ = (
     "OpenPypeAddOn",
 
     "load_modules",
+    "load_modules_by_name",
+    "get_addons_manifest",
 
     "ModulesManager",
     "TrayModulesManager",
+    "get_modules_manager",
 
     "BaseModuleSettingsDef",
     "ModuleSettingsDef",
@@ -180,6 +180,17 @@ class _LoadCache:
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Paths of module sources which were already imported
+    loaded_sources = set()
+    shared_manager = None
+    shared_manager_lock = threading.Lock()
+
+
+# Source of OpenPype module which can be imported to 'openpype_modules'
+#   - 'source_type' is one of "default", "host", "dir" or "file"
+_ModuleSource = collections.namedtuple(
+    "_ModuleSource", ("basename", "dirpath", "filename", "source_type")
+)
 
 
 def get_default_modules_dir():
@@ -318,7 +329,7 @@ def load_modules(force=False):
 
     if not _LoadCache.modules_lock.locked():
         with _LoadCache.modules_lock:
-            _load_modules()
+            _load_modules(force)
             _LoadCache.modules_loaded = True
     else:
         # If lock is locked wait until is finished
@@ -326,6 +337,27 @@ def load_modules(force=False):
             time.sleep(0.1)
 
 
+def load_modules_by_name(module_names):
+    """Load only specific OpenPype modules as python modules.
+
+    Modules which are already loaded are not imported again. Function
+    'load_modules' imports the remaining modules later when is called.
+
+    Args:
+        module_names (Iterable[str]): Names of python modules in
+            'openpype_modules'.
+    """
+
+    if _LoadCache.modules_loaded:
+        return
+
+    load_interfaces()
+
+    with _LoadCache.modules_lock:
+        if not _LoadCache.modules_loaded:
+            _load_modules(module_names=set(module_names))
+
+
 def _get_ayon_bundle_data():
     con = get_ayon_server_api_connection()
     bundles = con.get_bundles()["bundles"]
@@ -515,20 +547,27 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
     return v3_addons_to_skip
 
 
-def _load_modules():
-    # Key under which will be modules imported in `sys.modules`
-    modules_key = "openpype_modules"
+def _get_modules_holder(modules_key, force):
+    openpype_modules = sys.modules.get(modules_key)
+    if force or not isinstance(openpype_modules, _ModuleClass):
+        # Change `sys.modules`
+        sys.modules[modules_key] = openpype_modules = _ModuleClass(
+            modules_key
+        )
+        _LoadCache.loaded_sources = set()
+    return openpype_modules
 
-    # Change `sys.modules`
-    sys.modules[modules_key] = openpype_modules = _ModuleClass(modules_key)
 
-    log = Logger.get_logger("ModulesLoader")
+def _get_module_sources(ignore_addon_names, log):
+    """Sources of OpenPype modules which can be imported.
 
-    ignore_addon_names = []
-    if AYON_SERVER_ENABLED:
-        ignore_addon_names = _load_ayon_addons(
-            openpype_modules, modules_key, log
-        )
+    Args:
+        ignore_addon_names (Iterable[str]): Names of modules to skip.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        list[_ModuleSource]: Module sources in order of import.
+    """
 
     # Look for OpenPype modules in paths defined with `get_module_dirs`
     #   - dynamically imported OpenPype modules and addons
@@ -550,6 +589,7 @@ def _load_modules():
     if AYON_SERVER_ENABLED:
         ignored_current_dir_filenames |= IGNORED_FILENAMES_IN_AYON
 
+    sources = []
     processed_paths = set()
     for dirpath in frozenset(module_dirs):
         # Skip already processed paths
@@ -605,48 +645,214 @@ def _load_modules():
 
             # TODO add more logic how to define if folder is module or not
             # - check manifest and content of manifest
+            if is_in_current_dir:
+                source_type = "default"
+            elif is_in_host_dir:
+                source_type = "host"
+            elif os.path.isdir(fullpath):
+                source_type = "dir"
+            else:
+                source_type = "file"
+            sources.append(
+                _ModuleSource(basename, dirpath, filename, source_type)
+            )
+    return sources
+
+
+def _import_module_source(source, openpype_modules, modules_key, log):
+    basename = source.basename
+    fullpath = os.path.join(source.dirpath, source.filename)
+    try:
+        # Don't import dynamically current directory modules
+        if source.source_type == "default":
+            import_str = "openpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+
+        elif source.source_type == "host":
+            import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
             try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(openpype_modules, basename, default_module)
 
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
+            except Exception:
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
 
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+        elif source.source_type == "dir":
+            import_module_from_dirpath(
+                source.dirpath, source.filename, modules_key
+            )
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+        else:
+            module = import_filepath(fullpath)
+            setattr(openpype_modules, basename, module)
 
-            except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+    except Exception:
+        if source.source_type == "default":
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+
+
+def _load_modules(force=False, module_names=None):
+    # Key under which will be modules imported in `sys.modules`
+    modules_key = "openpype_modules"
+
+    openpype_modules = _get_modules_holder(modules_key, force)
+
+    log = Logger.get_logger("ModulesLoader")
+
+    ignore_addon_names = []
+    if AYON_SERVER_ENABLED:
+        ignore_addon_names = _load_ayon_addons(
+            openpype_modules, modules_key, log
+        )
+
+    for source in _get_module_sources(ignore_addon_names, log):
+        if module_names is not None and source.basename not in module_names:
+            continue
+
+        fullpath = os.path.join(source.dirpath, source.filename)
+        if fullpath in _LoadCache.loaded_sources:
+            continue
+        _LoadCache.loaded_sources.add(fullpath)
+        _import_module_source(source, openpype_modules, modules_key, log)
+
+
+def _get_source_mtime(source):
+    """Modification time of module source used to validate manifest."""
+    fullpath = os.path.join(source.dirpath, source.filename)
+    if not os.path.isdir(fullpath):
+        return os.path.getmtime(fullpath)
+
+    # Directory mtime changes only when files are added or removed
+    mtimes = [os.path.getmtime(fullpath)]
+    for filename in os.listdir(fullpath):
+        if filename.endswith(".py"):
+            mtimes.append(os.path.getmtime(os.path.join(fullpath, filename)))
+    return max(mtimes)
+
+
+def _get_addons_manifest_path():
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "addons_manifest.json"
+    )
+
+
+def _get_sources_state():
+    log = Logger.get_logger("ModulesLoader")
+    state = {}
+    for source in _get_module_sources([], log):
+        fullpath = os.path.join(source.dirpath, source.filename)
+        try:
+            state[fullpath] = _get_source_mtime(source)
+        except OSError:
+            continue
+    return state
+
+
+def get_addons_manifest():
+    """Manifest of addon classes stored on disk if is still valid.
+
+    Manifest is created by 'ModulesManager' when all modules are
+    initialized. It is valid only until any module source is added, removed
+    or modified.
+
+    Manifest is not used in AYON mode where addons are defined by server.
+
+    Returns:
+        Union[dict[str, Any], None]: Information about addon classes by
+            addon name under "addons" with name of python module in
+            'openpype_modules' under "module" and class name under
+            "class_name". Names of python modules with settings definitions
+            are under "settings_defs". None if manifest is not available.
+    """
+
+    if AYON_SERVER_ENABLED:
+        return None
+
+    manifest_path = _get_addons_manifest_path()
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, "r") as stream:
+            manifest = json.load(stream)
+    except (IOError, ValueError):
+        return None
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("sources") != _get_sources_state()
+    ):
+        return None
+    return {
+        "addons": manifest["addons"],
+        "settings_defs": manifest["settings_defs"],
+    }
+
+
+def _save_addons_manifest(addons):
+    """Store manifest of addon classes to disk.
+
+    Args:
+        addons (dict[str, dict[str, str]]): Information about addon classes
+            by addon name.
+    """
+
+    if AYON_SERVER_ENABLED:
+        return
+
+    import openpype_modules
+
+    settings_defs = []
+    for module_name in openpype_modules.keys():
+        if _get_module_settings_defs(openpype_modules[module_name]):
+            settings_defs.append(module_name)
+
+    manifest = {
+        "sources": _get_sources_state(),
+        "addons": addons,
+        "settings_defs": settings_defs,
+    }
+    manifest_path = _get_addons_manifest_path()
+    try:
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as stream:
+                if json.load(stream) == manifest:
+                    return
+
+        dirpath = os.path.dirname(manifest_path)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        # Write to temp file first so other processes don't read partial file
+        tmp_path = "{}.{}.tmp".format(manifest_path, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(manifest, stream)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        os.rename(tmp_path, manifest_path)
+
+    except (IOError, OSError, ValueError):
+        Logger.get_logger("ModulesLoader").debug(
+            "Failed to store addons manifest.", exc_info=True
+        )
 
 
 @six.add_metaclass(ABCMeta)
@@ -812,9 +1018,16 @@ class OpenPypeAddOn(OpenPypeModule):
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
+    Manager can initialize only specific modules defined by 'addon_names'.
+    Python modules which contain them are found in addons manifest created
+    by previous full initialization. All modules are loaded if manifest is
+    not available or does not know some of the names.
+
     Args:
         system_settings (Optional[dict[str, Any]]): OpenPype system settings.
         ayon_settings (Optional[dict[str, Any]]): AYON studio settings.
+        addon_names (Optional[Iterable[str]]): Initialize only modules with
+            passed names.
     """
 
     # Helper attributes for report
@@ -822,11 +1035,16 @@ class ModulesManager:
     _system_settings = None
     _ayon_settings = None
 
-    def __init__(self, system_settings=None, ayon_settings=None):
+    def __init__(
+        self, system_settings=None, ayon_settings=None, addon_names=None
+    ):
         self.log = logging.getLogger(self.__class__.__name__)
 
         self._system_settings = system_settings
         self._ayon_settings = ayon_settings
+        if addon_names is not None:
+            addon_names = set(addon_names)
+        self._addon_names = addon_names
 
         self.modules = []
         self.modules_by_id = {}
@@ -872,10 +1090,39 @@ class ModulesManager:
             return module
         return default
 
+    def _get_manifest_classes(self):
+        """Classes of requested addons by python module name from manifest.
+
+        Returns:
+            Union[dict[str, set[str]], None]: Class names by python module
+                name or None if all modules must be loaded.
+        """
+
+        if self._addon_names is None:
+            return None
+
+        manifest = get_addons_manifest()
+        if manifest is None:
+            return None
+
+        class_names_by_module = collections.defaultdict(set)
+        for addon_name in self._addon_names:
+            addon_info = manifest["addons"].get(addon_name)
+            if addon_info is None:
+                return None
+            class_names_by_module[addon_info["module"]].add(
+                addon_info["class_name"]
+            )
+        return class_names_by_module
+
     def initialize_modules(self):
         """Import and initialize modules."""
+        class_names_by_module = self._get_manifest_classes()
         # Make sure modules are loaded
-        load_modules()
+        if class_names_by_module is None:
+            load_modules()
+        else:
+            load_modules_by_name(class_names_by_module.keys())
 
         import openpype_modules
 
@@ -900,9 +1147,19 @@ class ModulesManager:
         prev_start_time = time_start
 
         module_classes = []
-        for module in openpype_modules:
+        module_name_by_class = {}
+        for module_name in tuple(openpype_modules.keys()):
+            module = openpype_modules[module_name]
+            class_names = None
+            if class_names_by_module is not None:
+                class_names = class_names_by_module.get(module_name)
+                if class_names is None:
+                    continue
+
             # Go through globals in `pype.modules`
             for name in dir(module):
+                if class_names is not None and name not in class_names:
+                    continue
                 modules_item = getattr(module, name, None)
                 # Filter globals that are not classes which inherit from
                 #   AYONAddon
@@ -934,6 +1191,9 @@ class ModulesManager:
                     ).format(name, ", ".join(not_implemented)))
                     continue
                 module_classes.append(modules_item)
+                module_name_by_class.setdefault(modules_item, module_name)
+
+        addons_manifest = {}
 
         for modules_item in module_classes:
             is_openpype_module = issubclass(modules_item, OpenPypeModule)
@@ -948,6 +1208,10 @@ class ModulesManager:
                 self.modules.append(module)
                 self.modules_by_id[module.id] = module
                 self.modules_by_name[module.name] = module
+                addons_manifest[module.name] = {
+                    "module": module_name_by_class[modules_item],
+                    "class_name": name,
+                }
                 enabled_str = "X"
                 if not module.enabled:
                     enabled_str = " "
@@ -963,6 +1227,9 @@ class ModulesManager:
                     exc_info=True
                 )
 
+        if class_names_by_module is None:
+            _save_addons_manifest(addons_manifest)
+
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
@@ -1327,6 +1594,23 @@ class ModulesManager:
         print(output)
 
 
+def get_modules_manager():
+    """Modules manager shared in the process.
+
+    Initialization of all modules is expensive, shared manager should be used
+    where modules are only used and a new manager is not needed.
+
+    Returns:
+        ModulesManager: Manager wrapping discovered modules.
+    """
+
+    if _LoadCache.shared_manager is None:
+        with _LoadCache.shared_manager_lock:
+            if _LoadCache.shared_manager is None:
+                _LoadCache.shared_manager = ModulesManager()
+    return _LoadCache.shared_manager
+
+
 class TrayModulesManager(ModulesManager):
     # Define order of modules in menu
     modules_menu_order = (
@@ -1350,6 +1634,7 @@ class TrayModulesManager(ModulesManager):
         self.modules_by_id = {}
         self.modules_by_name = {}
         self._report = {}
+        self._addon_names = None
 
         self.tray_manager = None
 
@@ -1515,50 +1800,69 @@ def get_module_settings_defs():
     from `ModuleSettingsDef` in python module variables (imported
     in `__init__py`).
 
+    Only python modules with settings definitions are imported when addons
+    manifest is available.
+
     Returns:
         list: All valid and not abstract settings definitions from imported
             openpype addons and modules.
     """
+    manifest = get_addons_manifest()
     # Make sure modules are loaded
-    load_modules()
+    if manifest is None:
+        load_modules()
+    else:
+        load_modules_by_name(manifest["settings_defs"])
 
     import openpype_modules
 
+    settings_defs = []
+    for module_name in tuple(openpype_modules.keys()):
+        if manifest is not None and (
+            module_name not in manifest["settings_defs"]
+        ):
+            continue
+        settings_defs.extend(
+            _get_module_settings_defs(openpype_modules[module_name])
+        )
+    return settings_defs
+
+
+def _get_module_settings_defs(raw_module):
     settings_defs = []
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
-        for attr_name in dir(raw_module):
-            attr = getattr(raw_module, attr_name)
-            if (
-                not inspect.isclass(attr)
-                or attr is ModuleSettingsDef
-                or not issubclass(attr, ModuleSettingsDef)
-            ):
-                continue
+    for attr_name in dir(raw_module):
+        attr = getattr(raw_module, attr_name)
+        if (
+            not inspect.isclass(attr)
+            or attr is ModuleSettingsDef
+            or not issubclass(attr, ModuleSettingsDef)
+        ):
+            continue
 
-            if inspect.isabstract(attr):
-                # Find missing implementations by convention on `abc` module
-                not_implemented = []
-                for attr_name in dir(attr):
-                    attr = getattr(attr, attr_name, None)
-                    abs_method = getattr(
-                        attr, "__isabstractmethod__", None
-                    )
-                    if attr and abs_method:
-                        not_implemented.append(attr_name)
+        if inspect.isabstract(attr):
+            # Find missing implementations by convention on `abc` module
+            not_implemented = []
+            for attr_name in dir(attr):
+                attr = getattr(attr, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
 
-                # Log missing implementations
-                log.warning((
-                    "Skipping abstract Class: {} in module {}."
-                    " Missing implementations: {}"
-                ).format(
-                    attr_name, raw_module.__name__, ", ".join(not_implemented)
-                ))
-                continue
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {} in module {}."
+                " Missing implementations: {}"
+            ).format(
+                attr_name, raw_module.__name__, ", ".join(not_implemented)
+            ))
+            continue
 
-            settings_defs.append(attr)
+        settings_defs.append(attr)
 
     return settings_defs
 
@@ -1,10 +1,14 @@
 # /usr/bin/env python3
 # -*- coding: utf-8 -*-
 import os
+import stat
+import time
+import getpass
 import tempfile
 from datetime import datetime
 import subprocess
 import json
+import hashlib
 import platform
 import uuid
 import re
@@ -23,6 +27,12 @@ VERSION_REGEX = re.compile(
     r"(?:\+(?P<buildmetadata>[a-zA-Z\d\-.]*))?"
 )
 
+# Cached environments older than this are extracted again and removed
+#   (in seconds)
+ENV_CACHE_MAX_AGE = 60 * 60 * 12
+# How long wait for other task extracting the same environment (in seconds)
+ENV_CACHE_LOCK_TIMEOUT = 60 * 10
+
 
 class OpenPypeVersion:
     """Fake semver version class for OpenPype version purposes.
@@ -286,6 +296,249 @@ def get_requested_openpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def get_environments_cache_dir():
+    """Directory where extracted environments are shared by tasks of a job.
+
+    Directory is specific for user running the worker because environments
+    contain credentials.
+
+    Returns:
+        str: Path to directory.
+    """
+
+    if hasattr(os, "getuid"):
+        user_id = str(os.getuid())
+    else:
+        user_id = getpass.getuser()
+    return os.path.join(
+        tempfile.gettempdir(), "openpype_env_cache_{}".format(user_id)
+    )
+
+
+def _ensure_private_cache_dir(cache_dir):
+    """Create cache directory accessible only by current user.
+
+    Existing directory is used only if is owned by current user and other
+    users don't have access to it. Windows temp directory is already
+    specific for the user so ownership is not validated there.
+
+    Returns:
+        bool: Directory can be used for cache.
+    """
+
+    try:
+        os.makedirs(cache_dir, 0o700)
+    except OSError:
+        # Directory already exists
+        pass
+
+    try:
+        stat_result = os.lstat(cache_dir)
+    except OSError:
+        return False
+
+    if not stat.S_ISDIR(stat_result.st_mode):
+        return False
+
+    if hasattr(os, "getuid") and (
+        stat_result.st_uid != os.getuid()
+        or stat_result.st_mode & 0o077
+    ):
+        return False
+    return True
+
+
+def _remove_old_cache_files(cache_dir):
+    """Remove cached environments and leftovers older than max age."""
+    now = time.time()
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        try:
+            if now - os.path.getmtime(path) > ENV_CACHE_MAX_AGE:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def get_environments_cache_path(cache_dir, key_data):
+    """Path to cached environments file for passed key data.
+
+    Args:
+        cache_dir (str): Directory with cached environments.
+        key_data (dict[str, Any]): Data which define the environments.
+
+    Returns:
+        str: Path to json file named by hash of the data.
+    """
+
+    content = json.dumps(key_data, sort_keys=True)
+    key = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, "{}.json".format(key))
+
+
+def _load_cached_environments(cache_path):
+    try:
+        if time.time() - os.path.getmtime(cache_path) > ENV_CACHE_MAX_AGE:
+            return None
+        with open(cache_path, "r") as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def _acquire_environments_lock(lock_path):
+    """Create lock file or wait until other process releases it.
+
+    Returns:
+        bool: Lock was acquired by this process.
+    """
+
+    start_time = time.time()
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL))
+            return True
+        except OSError:
+            pass
+
+        try:
+            lock_age = time.time() - os.path.getmtime(lock_path)
+        except OSError:
+            # Lock was released in meantime
+            return False
+
+        if lock_age > ENV_CACHE_LOCK_TIMEOUT:
+            # Process holding the lock probably crashed
+            print(">>> Removing stale lock {}".format(lock_path))
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+            continue
+
+        if time.time() - start_time > ENV_CACHE_LOCK_TIMEOUT:
+            return False
+        time.sleep(1)
+
+
+def _release_environments_lock(lock_path):
+    try:
+        os.remove(lock_path)
+    except OSError:
+        pass
+
+
+def _run_extract_environments(deadlinePlugin, exe, args, export_url):
+    args = list(args)
+    args.insert(args.index("extractenvironments") + 1, export_url)
+    args_str = subprocess.list2cmdline(args)
+    print(">>> Executing: {} {}".format(exe, args_str))
+    process_exitcode = deadlinePlugin.RunProcess(
+        exe, args_str, os.path.dirname(exe), -1
+    )
+
+    if process_exitcode != 0:
+        raise RuntimeError(
+            "Failed to run process to extract environments."
+        )
+
+    print(">>> Loading file ...")
+    with open(export_url) as fp:
+        return json.load(fp)
+
+
+def _get_temp_file_name():
+    # tempfile.TemporaryFile cannot be used because of locking
+    return "{}_{}.json".format(
+        datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
+        str(uuid.uuid1())
+    )
+
+
+def extract_environments(deadlinePlugin, exe, args, key_data):
+    """Run 'extractenvironments' command or reuse its cached output.
+
+    Tasks of the same job share the same environments. Output of first task
+    on the worker is stored to per-user cache directory under hash of
+    'key_data' and other tasks load it instead of starting a new process.
+    Tasks started at the same time wait until the first one finishes. Cache
+    is not used if the directory is accessible by other users.
+
+    Args:
+        deadlinePlugin (DeadlinePlugin): Deadline plugin.
+        exe (str): Path to executable.
+        args (list[str]): Arguments for 'extractenvironments' without
+            output path.
+        key_data (dict[str, Any]): Data which define the environments.
+
+    Returns:
+        dict[str, str]: Extracted environments.
+    """
+
+    cache_dir = get_environments_cache_dir()
+    if not _ensure_private_cache_dir(cache_dir):
+        print((
+            ">>> Environments cache directory {} is accessible by other"
+            " users. Skipping cache."
+        ).format(cache_dir))
+        export_url = os.path.join(
+            tempfile.gettempdir(), _get_temp_file_name()
+        )
+        print(">>> Temporary path: {}".format(export_url))
+        try:
+            return _run_extract_environments(
+                deadlinePlugin, exe, args, export_url
+            )
+        finally:
+            if os.path.exists(export_url):
+                print(">>> Removing temporary file")
+                os.remove(export_url)
+
+    cache_path = get_environments_cache_path(cache_dir, key_data)
+    contents = _load_cached_environments(cache_path)
+    if contents is not None:
+        print(">>> Using cached environments {}".format(cache_path))
+        return contents
+
+    lock_path = cache_path + ".lock"
+    locked = _acquire_environments_lock(lock_path)
+    try:
+        # Other task could store the environments while waiting for lock
+        contents = _load_cached_environments(cache_path)
+        if contents is not None:
+            print(">>> Using cached environments {}".format(cache_path))
+            return contents
+
+        _remove_old_cache_files(cache_dir)
+
+        # Use cache directory so the file can be atomically moved to cache
+        export_url = os.path.join(cache_dir, _get_temp_file_name())
+        print(">>> Temporary path: {}".format(export_url))
+        try:
+            contents = _run_extract_environments(
+                deadlinePlugin, exe, args, export_url
+            )
+            # Readable only by current user
+            # - replace is atomic so other tasks never read partial file
+            print(">>> Storing environments to cache {}".format(cache_path))
+            try:
+                os.chmod(export_url, 0o600)
+                os.replace(export_url, cache_path)
+            except OSError:
+                print(">>> Failed to store environments to cache")
+
+        finally:
+            if os.path.exists(export_url):
+                print(">>> Removing temporary file")
+                os.remove(export_url)
+
+    finally:
+        if locked:
+            _release_environments_lock(lock_path)
+
+    return contents
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -321,18 +574,9 @@ def inject_openpype_environment(deadlinePlugin):
 
         print("--- OpenPype executable: {}".format(exe))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
         args = [
             "--headless",
-            "extractenvironments",
-            export_url
+            "extractenvironments"
         ]
 
         add_kwargs = {
@@ -367,20 +611,14 @@ def inject_openpype_environment(deadlinePlugin):
 
         os.environ["AVALON_TIMEOUT"] = "5000"
 
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
-        )
-
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run OpenPype process to extract environments."
-            )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
+        key_data = {
+            "job_id": job.JobId,
+            "exe": exe,
+            "args": args,
+            "version": requested_version,
+            "mongo": openpype_mongo or os.environ.get("OPENPYPE_MONGO"),
+        }
+        contents = extract_environments(deadlinePlugin, exe, args, key_data)
 
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
@@ -397,9 +635,6 @@ def inject_openpype_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
@@ -455,18 +690,9 @@ def inject_ayon_environment(deadlinePlugin):
                 "AYON_SERVER_URL and AYON_API_KEY"
             ))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
         args = [
             "--headless",
-            "extractenvironments",
-            export_url
+            "extractenvironments"
         ]
 
         add_kwargs = {
@@ -500,20 +726,14 @@ def inject_ayon_environment(deadlinePlugin):
             # Add the env var for current calls to `DeadlinePlugin.RunProcess`
             deadlinePlugin.SetProcessEnvironmentVariable(env, val)
 
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
-        )
-
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run Ayon process to extract environments."
-            )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
+        key_data = {
+            "job_id": job.JobId,
+            "exe": exe,
+            "args": args,
+            "bundle": ayon_bundle_name,
+            "server": ayon_server_url,
+        }
+        contents = extract_environments(deadlinePlugin, exe, args, key_data)
 
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
@@ -530,9 +750,6 @@ def inject_ayon_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
@@ -21,8 +21,7 @@ from openpype.pipeline.load import get_representation_path_with_anatomy
 from openpype.pipeline.delivery import (
     get_format_dict,
     check_destination_path,
-    deliver_single_file,
-    deliver_sequence,
+    DeliveryBatch,
 )
 
 
@@ -556,6 +555,7 @@ class Delivery(BaseAction):
         format_dict = get_format_dict(anatomy, location_path)
 
         datetime_data = get_datetime_data()
+        batch = DeliveryBatch(self.log)
         for repre in repres_to_deliver:
             source_path = repre.get("data", {}).get("path")
             debug_msg = "Processing representation {}".format(repre["_id"])
@@ -590,13 +590,17 @@ class Delivery(BaseAction):
                 anatomy_name,
                 anatomy_data,
                 format_dict,
-                report_items,
-                self.log
+                report_items
             )
             if not frame:
-                deliver_single_file(*args)
+                batch.add_single_file(*args)
             else:
-                deliver_sequence(*args)
+                batch.add_sequence(*args)
+
+        results = batch.process(report_items)
+        self.log.debug("Delivered {} files (copy time {:.2f}s)".format(
+            len(results), sum(result["duration"] for result in results)
+        ))
 
         return self.report(report_items)
 
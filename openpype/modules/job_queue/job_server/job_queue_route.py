@@ -13,6 +13,7 @@ class JobQueueResource:
 
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
+            ("POST", "/jobs/bulk", self.post_jobs),
             ("GET", "/jobs", self.get_jobs),
             ("GET", "/jobs/{job_id}", self.get_job)
         )
@@ -40,9 +41,57 @@ class JobQueueResource:
                 status=400, message="Key \"host_name\" not filled."
             )
 
-        job = self._job_queue.create_job(host_name, data)
+        job = self._job_queue.create_job(
+            host_name,
+            data,
+            priority=self._get_priority(data),
+            max_attempts=self._get_max_attempts(data)
+        )
         return Response(status=201, text=job.id)
 
+    async def post_jobs(self, request):
+        """Create multiple jobs with one request.
+
+        Expected body is a list of jobs data in same format as for
+        single job. Response contains list of created job ids in same order.
+        """
+        jobs_data = await request.json()
+        if not isinstance(jobs_data, list):
+            return Response(
+                status=400, text="Expected list of jobs."
+            )
+
+        jobs_info = []
+        for idx, data in enumerate(jobs_data):
+            host_name = data.get("host_name")
+            if not host_name:
+                return Response(
+                    status=400,
+                    text="Key \"host_name\" not filled in job {}.".format(
+                        idx)
+                )
+            jobs_info.append((
+                host_name,
+                data,
+                self._get_priority(data),
+                self._get_max_attempts(data)
+            ))
+
+        jobs = self._job_queue.create_jobs(jobs_info)
+        return Response(
+            status=201,
+            body=self.encode([job.id for job in jobs]),
+            content_type="application/json"
+        )
+
+    @staticmethod
+    def _get_priority(data):
+        return int(data.get("priority") or 0)
+
+    @staticmethod
+    def _get_max_attempts(data):
+        return int(data.get("max_attempts") or 1)
+
     async def get_job(self, request):
         job_id = request.match_info["job_id"]
         content = self._job_queue.get_job_status(job_id)
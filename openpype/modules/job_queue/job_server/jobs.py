@@ -1,17 +1,44 @@
+import heapq
 import datetime
+import itertools
 import collections
 from uuid import uuid4
 
+from .storage import MemoryJobStorage
+
+
+def _datetime_to_timestamp(value):
+    if value is None:
+        return None
+    return value.timestamp()
+
+
+def _timestamp_to_datetime(value):
+    if value is None:
+        return None
+    return datetime.datetime.fromtimestamp(value)
+
 
 class Job:
     """Job related to specific host name.
 
     Data must contain everything needed to finish the job.
+
+    Jobs with higher priority are assigned to workers first. Failed job is
+    queued again until reaches 'max_attempts'.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self,
+        host_name,
+        data,
+        job_id=None,
+        created_time=None,
+        priority=0,
+        max_attempts=1
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
@@ -22,6 +49,9 @@ class Job:
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = priority
+        self.max_attempts = max(1, max_attempts)
+        self._attempts = 0
         self._result_data = None
 
         self._started = False
@@ -30,6 +60,11 @@ class Job:
         self._message = None
         self._deleted = False
 
+        # Job is not assigned before this time (retry backoff)
+        self._available_time = None
+        # Job is considered as failed after this time (worker lease)
+        self._lease_expire_time = None
+
         self._worker = None
 
     def keep_in_memory(self):
@@ -44,10 +79,22 @@ class Job:
     def id(self):
         return self._id
 
+    @property
+    def created_time(self):
+        return self._created_time
+
     @property
     def done(self):
         return self._done
 
+    @property
+    def attempts(self):
+        return self._attempts
+
+    @property
+    def worker(self):
+        return self._worker
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -55,9 +102,28 @@ class Job:
         self._done_time = None
         self._errored = False
         self._message = None
+        self._lease_expire_time = None
 
         self._worker = None
 
+    def is_available(self, now=None):
+        """Job can be assigned to a worker (retry backoff passed)."""
+        if self._available_time is None:
+            return True
+        if now is None:
+            now = datetime.datetime.now()
+        return self._available_time <= now
+
+    def set_available_time(self, available_time):
+        self._available_time = available_time
+
+    def lease_expired(self, now=None):
+        if self._lease_expire_time is None:
+            return False
+        if now is None:
+            now = datetime.datetime.now()
+        return self._lease_expire_time <= now
+
     @property
     def started(self):
         return self._started
@@ -81,9 +147,23 @@ class Job:
         if worker is not None:
             worker.set_current_job(self)
 
-    def set_started(self):
+    def set_started(self, lease_timeout=None):
+        """Mark job as started.
+
+        Args:
+            lease_timeout (Optional[float]): Seconds after which is job
+                considered as failed when is not done.
+        """
         self._started_time = datetime.datetime.now()
         self._started = True
+        self._attempts += 1
+        self._available_time = None
+        self._lease_expire_time = None
+        if lease_timeout:
+            self._lease_expire_time = (
+                self._started_time
+                + datetime.timedelta(seconds=lease_timeout)
+            )
 
     def set_done(self, success=True, message=None, data=None):
         self._done = True
@@ -91,9 +171,66 @@ class Job:
         self._errored = not success
         self._message = message
         self._result_data = data
+        self._lease_expire_time = None
         if self._worker is not None:
             self._worker.set_current_job(None)
 
+    def to_data(self):
+        """Serializable data of job used by job storages."""
+        return {
+            "id": self.id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "priority": self.priority,
+            "max_attempts": self.max_attempts,
+            "attempts": self._attempts,
+            "state": self.state,
+            "message": self._message,
+            "result": self._result_data,
+            "created_time": _datetime_to_timestamp(self._created_time),
+            "done_time": _datetime_to_timestamp(self._done_time),
+            "available_time": _datetime_to_timestamp(self._available_time),
+        }
+
+    @classmethod
+    def from_data(cls, job_data):
+        """Create job from data stored by job storage.
+
+        Started jobs are restored as waiting because their worker was lost.
+        """
+        job = cls(
+            job_data["host_name"],
+            job_data["data"],
+            job_id=job_data["id"],
+            created_time=_timestamp_to_datetime(job_data["created_time"]),
+            priority=job_data["priority"],
+            max_attempts=job_data["max_attempts"],
+        )
+        job._attempts = job_data["attempts"]
+        job._available_time = _timestamp_to_datetime(
+            job_data["available_time"])
+
+        state = job_data["state"]
+        if state in ("done", "error"):
+            job._done = True
+            job._done_time = _timestamp_to_datetime(job_data["done_time"])
+            job._errored = state == "error"
+            job._message = job_data["message"]
+            job._result_data = job_data["result"]
+        return job
+
+    @property
+    def state(self):
+        if self._deleted:
+            return "deleted"
+        if self._errored:
+            return "error"
+        if self._done:
+            return "done"
+        if self._started:
+            return "started"
+        return "waiting"
+
     def status(self):
         worker_id = None
         if self._worker is not None:
@@ -101,23 +238,15 @@ class Job:
         output = {
             "id": self.id,
             "worker_id": worker_id,
-            "done": self._done
+            "done": self._done,
+            "priority": self.priority,
+            "attempts": self._attempts,
         }
         output["message"] = self._message or None
 
-        state = "waiting"
-        if self._deleted:
-            state = "deleted"
-        elif self._errored:
-            state = "error"
-        elif self._done:
-            state = "done"
-        elif self._started:
-            state = "started"
-
         output["result"] = self._result_data
 
-        output["state"] = state
+        output["state"] = self.state
 
         return output
 
@@ -125,18 +254,72 @@ class Job:
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Jobs of a host are assigned by priority
+    and then by creation order.
+
+    Args:
+        storage (Optional[JobStorage]): Storage where jobs are persisted.
+            Jobs are kept only in memory if not passed.
+        lease_timeout (Optional[float]): Seconds after which is started job
+            considered as failed if worker did not finish it. Disabled
+            when not set.
+        retry_delay (Optional[float]): Seconds before failed job is queued
+            again. Delay is doubled with each attempt.
+        missing_workers_timeout (Optional[float]): Seconds to wait for a
+            worker of a host before queued jobs of the host are failed.
     """
     old_jobs_check_minutes_interval = 30
 
-    def __init__(self):
+    def __init__(
+        self,
+        storage=None,
+        lease_timeout=None,
+        retry_delay=10,
+        missing_workers_timeout=60
+    ):
+        if storage is None:
+            storage = MemoryJobStorage()
+        self._storage = storage
+        self.lease_timeout = lease_timeout
+        self.retry_delay = retry_delay
+        self.missing_workers_timeout = missing_workers_timeout
+
         self._last_old_jobs_check = datetime.datetime.now()
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        self._job_counter = itertools.count()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._started_time = datetime.datetime.now()
+        self._host_last_seen = {}
+
+        self._restore_jobs()
+
+    def _restore_jobs(self):
+        jobs_data = self._storage.load_jobs()
+        waiting_jobs = []
+        for job_data in jobs_data:
+            job = Job.from_data(job_data)
+            self._jobs_by_id[job.id] = job
+            if not job.done:
+                self._push_job(job)
+                waiting_jobs.append(job)
+
+        if jobs_data:
+            print("Restored {} jobs ({} waiting)".format(
+                len(jobs_data), len(waiting_jobs)))
+
+        # Started jobs are stored as waiting
+        self._storage.save_jobs(job.to_data() for job in waiting_jobs)
+
+    def _push_job(self, job):
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (-job.priority, next(self._job_counter), job)
+        )
+
+    def _save_job(self, job):
+        self._storage.save_job(job.to_data())
 
     def workers(self):
         """All currently registered workers."""
@@ -159,7 +342,8 @@ class JobQueue:
             job.set_worker(None)
             job.reset()
             # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            self._push_job(job)
+            self._save_job(job)
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
@@ -174,30 +358,130 @@ class JobQueue:
 
         Error all jobs without needed worker.
         """
+        now = datetime.datetime.now()
+        self._check_leases(now)
+
         available_host_names = set()
         for worker in self._workers_by_id.values():
             host_name = worker.host_name
             available_host_names.add(host_name)
+            self._host_last_seen[host_name] = now
             if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
+                job = self._pop_job(host_name, now)
+                if job is not None:
+                    worker.set_current_job(job)
 
         for host_name in tuple(self._job_queue_by_host_name.keys()):
             if host_name in available_host_names:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
+            last_seen = self._host_last_seen.get(
+                host_name, self._started_time)
+            delta = now - last_seen
+            if delta.total_seconds() < self.missing_workers_timeout:
+                continue
+
+            jobs_queue = self._job_queue_by_host_name.pop(host_name)
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
+            errored_jobs = []
+            for _, _, job in jobs_queue:
                 if not job.deleted:
                     job.set_done(False, message)
+                    errored_jobs.append(job)
+            self._storage.save_jobs(job.to_data() for job in errored_jobs)
         self._remove_old_jobs()
 
+    def _pop_job(self, host_name, now):
+        """Pop job with highest priority which can be processed."""
+        jobs_queue = self._job_queue_by_host_name[host_name]
+        delayed = []
+        output = None
+        while jobs_queue:
+            item = heapq.heappop(jobs_queue)
+            job = item[-1]
+            if job.deleted or job.done:
+                continue
+            if not job.is_available(now):
+                delayed.append(item)
+                continue
+            output = job
+            break
+
+        for item in delayed:
+            heapq.heappush(jobs_queue, item)
+        return output
+
+    def _check_leases(self, now):
+        """Fail started jobs which exceeded lease timeout."""
+        for worker in tuple(self._workers_by_id.values()):
+            job = worker.current_job
+            if job is None or job.done or not job.lease_expired(now):
+                continue
+
+            print("Job \"{}\" lease expired on worker \"{}\"".format(
+                job.id, worker.id))
+            job.set_worker(None)
+            self._job_failed(job, "Job lease expired")
+
+    def job_sent(self, worker):
+        """Job of worker was sent to the worker."""
+        job = worker.current_job
+        worker.set_working()
+        if job is not None:
+            job.set_started(self.lease_timeout)
+            self._save_job(job)
+
+    def job_rejected(self, worker):
+        """Worker refused job because is still busy with a different job."""
+        job = worker.current_job
+        if job is None:
+            return
+        job.set_worker(None)
+        job.reset()
+        self._push_job(job)
+
+    def job_done(self, worker_id, job_id, success, message, data):
+        """Worker finished a job.
+
+        Result is ignored if job was meanwhile assigned to a different
+        worker (e.g. after lease timeout).
+        """
+        worker = self._workers_by_id.get(worker_id)
+        job = self._jobs_by_id.get(job_id)
+        if worker is not None and worker.current_job is job:
+            worker.set_current_job(None)
+
+        if job is None or job.done:
+            return
+
+        job_worker = job.worker
+        if job_worker is not None and job_worker.id != worker_id:
+            return
+
+        job.set_worker(None)
+        if success:
+            job.set_done(success, message, data)
+            self._save_job(job)
+        else:
+            self._job_failed(job, message, data)
+
+    def _job_failed(self, job, message, data=None):
+        """Queue failed job again or mark it as errored."""
+        if job.attempts >= job.max_attempts:
+            job.set_done(False, message, data)
+            self._save_job(job)
+            return
+
+        delay = self.retry_delay * (2 ** max(0, job.attempts - 1))
+        job.reset()
+        job.set_available_time(
+            datetime.datetime.now() + datetime.timedelta(seconds=delay)
+        )
+        print("Job \"{}\" failed ({}). Retry in {} seconds.".format(
+            job.id, message, delay))
+        self._push_job(job)
+        self._save_job(job)
+
     def get_jobs(self):
         return self._jobs_by_id.values()
 
@@ -205,23 +489,52 @@ class JobQueue:
         """Job by it's id."""
         return self._jobs_by_id.get(job_id)
 
-    def create_job(self, host_name, job_data):
+    def create_job(self, host_name, job_data, priority=0, max_attempts=1):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
-        self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
-        return job
+        return self.create_jobs([
+            (host_name, job_data, priority, max_attempts)
+        ])[0]
+
+    def create_jobs(self, jobs_info):
+        """Create multiple jobs at once and add them to queue.
+
+        Jobs are stored to storage in one batch.
+
+        Args:
+            jobs_info (Iterable[tuple[str, Any, int, int]]): Host name, job
+                data, priority and max attempts of each job.
+
+        Returns:
+            list[Job]: Created jobs.
+        """
+        jobs = []
+        for host_name, job_data, priority, max_attempts in jobs_info:
+            job = Job(
+                host_name,
+                job_data,
+                priority=priority,
+                max_attempts=max_attempts
+            )
+            self._jobs_by_id[job.id] = job
+            self._push_job(job)
+            jobs.append(job)
+        self._storage.save_jobs(job.to_data() for job in jobs)
+        return jobs
 
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
         delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        if delta.total_seconds() < self.old_jobs_check_minutes_interval * 60:
             return
 
+        self._last_old_jobs_check = datetime.datetime.now()
+        removed_ids = []
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                removed_ids.append(job_id)
+        self._storage.delete_jobs(removed_ids)
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -231,6 +544,7 @@ class JobQueue:
 
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        self._storage.delete_job(job.id)
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
@@ -238,3 +552,6 @@ class JobQueue:
         if job is None:
             return {}
         return job.status()
+
+    def close(self):
+        self._storage.close()
@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from .jobs import JobQueue
+from .storage import SQLiteJobStorage
 from .job_queue_route import JobQueueResource
 from .workers_rpc_route import WorkerRpc
 
@@ -12,14 +13,32 @@ log = logging.getLogger(__name__)
 
 
 class WebServerManager:
-    """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    """Manger that care about web server thread.
+
+    Args:
+        port (int): Server port.
+        host (str): Server host.
+        loop (Optional[asyncio.AbstractEventLoop]): Event loop of server.
+        jobs_db_path (Optional[str]): Path to SQLite database where jobs
+            are stored. Jobs are kept only in memory if not set.
+        lease_timeout (Optional[float]): Seconds after which is started job
+            considered as failed.
+    """
+    def __init__(
+        self, port, host, loop=None, jobs_db_path=None, lease_timeout=None
+    ):
         self.port = port
         self.host = host
         self.app = web.Application()
         if loop is None:
             loop = asyncio.new_event_loop()
 
+        storage = None
+        if jobs_db_path:
+            log.info("Jobs are stored to \"{}\"".format(jobs_db_path))
+            storage = SQLiteJobStorage(jobs_db_path)
+        self.job_queue = JobQueue(storage, lease_timeout=lease_timeout)
+
         # add route with multiple methods for single "external app"
         self.webserver_thread = WebServerThread(self, loop)
 
@@ -71,7 +90,7 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        job_queue = manager.job_queue
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -151,4 +170,5 @@ class WebServerThread(threading.Thread):
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
         await asyncio.sleep(0.07)
+        self.manager.job_queue.close()
         self.loop.stop()
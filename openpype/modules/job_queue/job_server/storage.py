@@ -0,0 +1,151 @@
+"""Storages of job queue jobs.
+
+Storage keeps jobs data so queued jobs survive restart of the job server.
+"""
+import os
+import json
+import sqlite3
+import threading
+from abc import ABCMeta, abstractmethod
+
+import six
+
+
+@six.add_metaclass(ABCMeta)
+class JobStorage:
+    """Storage of jobs data used by 'JobQueue'.
+
+    Jobs are stored in a format of 'Job.to_data' and restored with
+    'Job.from_data'.
+    """
+
+    @abstractmethod
+    def load_jobs(self):
+        """Load all stored jobs.
+
+        Returns:
+            list[dict[str, Any]]: Jobs data ordered by creation.
+        """
+        pass
+
+    @abstractmethod
+    def save_jobs(self, jobs_data):
+        """Create or update jobs.
+
+        Args:
+            jobs_data (Iterable[dict[str, Any]]): Jobs data to store.
+        """
+        pass
+
+    @abstractmethod
+    def delete_jobs(self, job_ids):
+        """Remove jobs from storage.
+
+        Args:
+            job_ids (Iterable[str]): Ids of jobs to remove.
+        """
+        pass
+
+    def save_job(self, job_data):
+        self.save_jobs([job_data])
+
+    def delete_job(self, job_id):
+        self.delete_jobs([job_id])
+
+    def close(self):
+        pass
+
+
+class MemoryJobStorage(JobStorage):
+    """Storage which does not persist anything.
+
+    Jobs are kept only in 'JobQueue' memory and are lost on restart.
+    """
+
+    def load_jobs(self):
+        return []
+
+    def save_jobs(self, jobs_data):
+        pass
+
+    def delete_jobs(self, job_ids):
+        pass
+
+
+class SQLiteJobStorage(JobStorage):
+    """Jobs stored in SQLite database file.
+
+    Args:
+        db_path (str): Path to database file. Is created if does not exist.
+    """
+
+    def __init__(self, db_path):
+        dirpath = os.path.dirname(db_path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            db_path, check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " host_name TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " priority INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " data TEXT NOT NULL"
+                ")"
+            )
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    def load_jobs(self):
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT data FROM jobs ORDER BY created"
+            )
+            rows = cursor.fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save_jobs(self, jobs_data):
+        rows = [
+            (
+                job_data["id"],
+                job_data["host_name"],
+                job_data["state"],
+                job_data["priority"],
+                job_data["created_time"],
+                json.dumps(job_data)
+            )
+            for job_data in jobs_data
+        ]
+        if not rows:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO jobs"
+                " (id, host_name, state, priority, created, data)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def delete_jobs(self, job_ids):
+        rows = [(job_id, ) for job_id in job_ids]
+        if not rows:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM jobs WHERE id = ?", rows
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
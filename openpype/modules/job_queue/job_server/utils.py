@@ -1,3 +1,4 @@
+import os
 import sys
 import signal
 import time
@@ -14,7 +15,18 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def get_default_jobs_db_path():
+    """Default path to database of jobs."""
+    import appdirs
+
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "job_queue",
+        "jobs.db"
+    )
+
+
+def main(port=None, host=None, jobs_db_path=None, lease_timeout=None):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -24,6 +36,10 @@ def main(port=None, host=None):
 
     port = int(port or 8079)
     host = str(host or "localhost")
+    if jobs_db_path is None:
+        jobs_db_path = get_default_jobs_db_path()
+    if lease_timeout:
+        lease_timeout = float(lease_timeout)
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as con:
         result_of_check = con.connect_ex((host, port))
@@ -35,7 +51,12 @@ def main(port=None, host=None):
         return 1
 
     print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    manager = WebServerManager(
+        port,
+        host,
+        jobs_db_path=jobs_db_path,
+        lease_timeout=lease_timeout
+    )
     manager.start_server()
 
     stopped = False
@@ -49,24 +49,24 @@ class WorkerRpc(JsonRpc):
             await asyncio.sleep(5)
 
     async def job_done(self, worker_id, job_id, success, message, data):
-        worker = self._job_queue.get_worker(worker_id)
-        if worker is not None:
-            worker.set_current_job(None)
-
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.job_done(worker_id, job_id, success, message, data)
         return True
 
     async def send_jobs(self):
         invalid_workers = []
-        for worker in self._job_queue.workers():
+        for worker in tuple(self._job_queue.workers()):
             if worker.job_assigned() and not worker.is_working():
                 try:
-                    await worker.send_job()
+                    accepted = await worker.send_job()
 
                 except ConnectionResetError:
                     invalid_workers.append(worker)
+                    continue
+
+                if accepted:
+                    self._job_queue.job_sent(worker)
+                else:
+                    self._job_queue.job_rejected(worker)
 
         for worker in invalid_workers:
             self._job_queue.remove_worker(worker)
@@ -27,6 +27,13 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are stored to SQLite database so queued jobs survive restart of the
+    server, path to database can be changed with '--jobs_db' (empty value
+    keeps jobs only in memory)
+- '--lease_timeout' defines seconds after which is started job considered
+    as failed (e.g. worker hangs)
+- jobs are assigned by 'priority' (higher first) and failed jobs are queued
+    again until 'max_attempts' is reached, both are optional keys of job data
 
 ### start_worker
 - start worker which will process jobs
@@ -136,15 +143,40 @@ class JobQueueModule(OpenPypeModule):
     def server_url(self):
         return self._server_url
 
-    def send_job(self, host_name, job_data):
+    def send_job(self, host_name, job_data, priority=None):
         import requests
 
         job_data = job_data or {}
         job_data["host_name"] = host_name
+        if priority is not None:
+            job_data["priority"] = priority
         api_path = "{}/api/jobs".format(self._server_url)
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
 
+    def send_jobs(self, host_name, jobs_data, priority=None):
+        """Send multiple jobs to server with one request.
+
+        Args:
+            host_name (str): Host name which should process the jobs.
+            jobs_data (list[dict[str, Any]]): Data of each job.
+            priority (Optional[int]): Priority of jobs which don't have
+                priority in their data.
+
+        Returns:
+            list[str]: Ids of created jobs.
+        """
+        import requests
+
+        for job_data in jobs_data:
+            job_data["host_name"] = host_name
+            if priority is not None:
+                job_data.setdefault("priority", priority)
+        api_path = "{}/api/jobs/bulk".format(self._server_url)
+        post_request = requests.post(api_path, data=json.dumps(jobs_data))
+        post_request.raise_for_status()
+        return post_request.json()
+
     def get_job_status(self, job_id):
         import requests
 
@@ -164,10 +196,12 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(
+        cls, port=None, host=None, jobs_db_path=None, lease_timeout=None
+    ):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, jobs_db_path, lease_timeout)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -226,8 +260,14 @@ def cli_main():
 )
 @click_wrap.option("--port", help="Server port")
 @click_wrap.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click_wrap.option(
+    "--jobs_db",
+    help="Path to SQLite database of jobs (empty keeps jobs in memory)")
+@click_wrap.option(
+    "--lease_timeout",
+    help="Seconds after which is started job considered as failed")
+def cli_start_server(port, host, jobs_db, lease_timeout):
+    JobQueueModule.start_server(port, host, jobs_db, lease_timeout)
 
 
 @cli_main.command(
@@ -144,7 +144,16 @@ def push_to_zou(login, password):
     default=False,
     help="Listen to events only without any syncing",
 )
-def sync_service(login, password, projects, listen_only):
+@click_wrap.option(
+    "-bi",
+    "--batch-interval",
+    "batch_interval",
+    type=float,
+    envvar="KITSU_EVENTS_BATCH_INTERVAL",
+    default=0,
+    help="Collect events for this amount of seconds and process them at once",
+)
+def sync_service(login, password, projects, listen_only, batch_interval):
     """Synchronize openpype database from Zou sever database.
 
     Args:
@@ -152,6 +161,8 @@ def sync_service(login, password, projects, listen_only):
         password (str): Kitsu user password
         projects (tuple): specific kitsu projects
         listen_only (bool): run listen only without any syncing
+        batch_interval (float): collect events for this amount of seconds
+            before processing them
     """
     from .utils.update_op_with_zou import sync_all_projects
     from .utils.sync_service import start_listeners
@@ -159,4 +170,4 @@ def sync_service(login, password, projects, listen_only):
     if not listen_only:
         sync_all_projects(login, password, filter_projects=projects)
 
-    start_listeners(login, password)
+    start_listeners(login, password, batch_interval)
@@ -0,0 +1,86 @@
+"""Cache of Kitsu entities which change rarely.
+
+Projects, task types, task statuses, entity types and persons are needed
+for each synchronized entity or task. They are kept in memory for limited
+time to avoid repeated requests to Kitsu server.
+"""
+import time
+import threading
+
+import gazu
+
+# Time in seconds for which cached entities are used
+DEFAULT_CACHE_TTL = 60
+
+
+class KitsuEntitiesCache:
+    """Time limited cache of Kitsu entities.
+
+    Args:
+        ttl (float): Time in seconds after which cached value is queried
+            again.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def _get_cached(self, key, fetch_func):
+        now = time.time()
+        with self._lock:
+            item = self._cache.get(key)
+        if item is not None and now - item[0] < self._ttl:
+            return item[1]
+
+        value = fetch_func()
+        with self._lock:
+            self._cache[key] = (now, value)
+        return value
+
+    def _get_by_id(self, key, fetch_func, entity_id):
+        entities_by_id = self._get_cached(
+            key,
+            lambda: {entity["id"]: entity for entity in fetch_func()}
+        )
+        return entities_by_id.get(entity_id)
+
+    def invalidate(self, key=None):
+        """Remove cached values.
+
+        Args:
+            key (Optional[Any]): Remove only this key. All cached values
+                are removed if not passed.
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def invalidate_project(self, project_id: str):
+        self.invalidate(("project", project_id))
+
+    def get_project(self, project_id: str) -> dict:
+        return self._get_cached(
+            ("project", project_id),
+            lambda: gazu.project.get_project(project_id)
+        )
+
+    def get_task_type(self, task_type_id: str) -> dict:
+        return self._get_by_id(
+            "task_types", gazu.task.all_task_types, task_type_id
+        )
+
+    def get_task_status(self, task_status_id: str) -> dict:
+        return self._get_by_id(
+            "task_statuses", gazu.task.all_task_statuses, task_status_id
+        )
+
+    def get_entity_type(self, entity_type_id: str) -> dict:
+        return self._get_by_id(
+            "entity_types", gazu.entity.all_entity_types, entity_type_id
+        )
+
+    def get_person(self, person_id: str) -> dict:
+        return self._get_by_id("persons", gazu.person.all_persons, person_id)
@@ -12,17 +12,19 @@ Features ToDo:
 
 import os
 import threading
+import collections
 
 import gazu
+from pymongo import UpdateOne
 
 from openpype.client import get_project, get_assets, get_asset_by_name
 from openpype.pipeline import AvalonMongoDB
 from openpype.lib import Logger
 from .credentials import validate_credentials
+from .entities_cache import KitsuEntitiesCache, DEFAULT_CACHE_TTL
 from .update_op_with_zou import (
     create_op_asset,
     set_op_project,
-    get_kitsu_project_name,
     write_project_to_op,
     update_op_assets,
 )
@@ -31,9 +33,21 @@ log = Logger.get_logger(__name__)
 
 
 class Listener:
-    """Host Kitsu listener."""
+    """Host Kitsu listener.
 
-    def __init__(self, login, password):
+    Events are processed one by one when they're received. With batch
+    interval events are collected for the interval and processed at once.
+    Multiple events of the same entity are merged to one and updates of
+    assets are written with one bulk write per project.
+    """
+
+    def __init__(
+        self,
+        login,
+        password,
+        batch_interval=0,
+        cache_ttl=DEFAULT_CACHE_TTL,
+    ):
         """Create client and add listeners to events without starting it.
 
             Run `listener.start()` to actually start the service.
@@ -41,6 +55,11 @@ class Listener:
         Args:
             login (str): Kitsu user login
             password (str): Kitsu user password
+            batch_interval (float): Collect events for this amount of
+                seconds before processing them. Events are processed
+                immediately if is '0'.
+            cache_ttl (float): Time in seconds for which are projects,
+                task types and statuses cached.
 
         Raises:
             AuthFailedException: Wrong user login and/or password
@@ -48,6 +67,13 @@ class Listener:
         self.dbcon = AvalonMongoDB()
         self.dbcon.install()
 
+        self.entities_cache = KitsuEntitiesCache(cache_ttl)
+        self._batch_interval = batch_interval
+        self._queued_events = collections.OrderedDict()
+        self._events_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+
         gazu.client.set_host(os.environ["KITSU_SERVER"])
 
         # Authenticate
@@ -61,65 +87,29 @@ class Listener:
         )
         self.event_client = gazu.events.init()
 
-        gazu.events.add_listener(
-            self.event_client, "project:new", self._new_project
-        )
-        gazu.events.add_listener(
-            self.event_client, "project:update", self._update_project
-        )
-        gazu.events.add_listener(
-            self.event_client, "project:delete", self._delete_project
-        )
+        self._add_listener("project:new", self._new_project)
+        self._add_listener("project:update", self._update_project)
+        self._add_listener("project:delete", self._delete_project)
 
-        gazu.events.add_listener(
-            self.event_client, "asset:new", self._new_asset
-        )
-        gazu.events.add_listener(
-            self.event_client, "asset:update", self._update_asset
-        )
-        gazu.events.add_listener(
-            self.event_client, "asset:delete", self._delete_asset
-        )
+        self._add_listener("asset:new", self._new_asset)
+        self._add_listener("asset:update", self._update_asset)
+        self._add_listener("asset:delete", self._delete_asset)
 
-        gazu.events.add_listener(
-            self.event_client, "episode:new", self._new_episode
-        )
-        gazu.events.add_listener(
-            self.event_client, "episode:update", self._update_episode
-        )
-        gazu.events.add_listener(
-            self.event_client, "episode:delete", self._delete_episode
-        )
+        self._add_listener("episode:new", self._new_episode)
+        self._add_listener("episode:update", self._update_episode)
+        self._add_listener("episode:delete", self._delete_episode)
 
-        gazu.events.add_listener(
-            self.event_client, "sequence:new", self._new_sequence
-        )
-        gazu.events.add_listener(
-            self.event_client, "sequence:update", self._update_sequence
-        )
-        gazu.events.add_listener(
-            self.event_client, "sequence:delete", self._delete_sequence
-        )
+        self._add_listener("sequence:new", self._new_sequence)
+        self._add_listener("sequence:update", self._update_sequence)
+        self._add_listener("sequence:delete", self._delete_sequence)
 
-        gazu.events.add_listener(
-            self.event_client, "shot:new", self._new_shot
-        )
-        gazu.events.add_listener(
-            self.event_client, "shot:update", self._update_shot
-        )
-        gazu.events.add_listener(
-            self.event_client, "shot:delete", self._delete_shot
-        )
+        self._add_listener("shot:new", self._new_shot)
+        self._add_listener("shot:update", self._update_shot)
+        self._add_listener("shot:delete", self._delete_shot)
 
-        gazu.events.add_listener(
-            self.event_client, "task:new", self._new_task
-        )
-        gazu.events.add_listener(
-            self.event_client, "task:update", self._update_task
-        )
-        gazu.events.add_listener(
-            self.event_client, "task:delete", self._delete_task
-        )
+        self._add_listener("task:new", self._new_task)
+        self._add_listener("task:update", self._update_task)
+        self._add_listener("task:delete", self._delete_task)
 
     def start(self):
         """Start listening for events."""
@@ -131,6 +121,170 @@ class Listener:
             return gazu.entity.get_entity(ep_id)
         return
 
+    def _add_listener(self, event_name, callback):
+        if self._batch_interval > 0:
+            def queue_callback(data):
+                self._queue_event(event_name, callback, data)
+
+            gazu.events.add_listener(
+                self.event_client, event_name, queue_callback
+            )
+        else:
+            gazu.events.add_listener(self.event_client, event_name, callback)
+
+    # == Batch processing ==
+    def _queue_event(self, event_name, callback, data):
+        """Queue event to be processed with other events of batch.
+
+        Only last event of an entity is kept on position of the first
+        received event of the entity, so parents are processed before their
+        children. Update following creation of the entity is merged to the
+        creation as it does update too.
+        """
+        entity_type, action = event_name.split(":")
+        key = (entity_type, data.get("{}_id".format(entity_type)))
+        with self._events_lock:
+            queued = self._queued_events.get(key)
+            if (
+                queued is not None
+                and queued[0] == "new"
+                and action == "update"
+            ):
+                action, callback = queued[:2]
+            self._queued_events[key] = (action, callback, data)
+
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self._batch_interval, self._flush_events
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_events(self):
+        with self._events_lock:
+            queued_events = self._queued_events
+            self._queued_events = collections.OrderedDict()
+            self._flush_timer = None
+
+        # Batches are processed one after another
+        with self._flush_lock:
+            log.debug("Processing {} Kitsu events...".format(
+                len(queued_events)
+            ))
+            self._process_events(queued_events)
+
+    def _process_events(self, queued_events):
+        """Process queued events in order they were received.
+
+        Updates of assets, episodes, sequences and shots are collected
+        and written together. Other events are processed by their callback
+        after collected updates are written to keep order of changes.
+        """
+        entities_by_project_id = collections.OrderedDict()
+        for key, (action, callback, data) in queued_events.items():
+            entity_type, entity_id = key
+            if action == "update" and entity_type in (
+                "asset", "episode", "sequence", "shot"
+            ):
+                entity = self._get_zou_entity(entity_type, entity_id)
+                if entity is not None:
+                    entities_by_project_id.setdefault(
+                        data["project_id"], []
+                    ).append(entity)
+                continue
+
+            self._write_entities_updates(entities_by_project_id)
+            entities_by_project_id.clear()
+            try:
+                callback(data)
+            except Exception:
+                log.warning(
+                    "Failed to process Kitsu event {}:{} {}".format(
+                        entity_type, action, entity_id
+                    ),
+                    exc_info=True
+                )
+
+        self._write_entities_updates(entities_by_project_id)
+
+    def _get_zou_entity(self, entity_type, entity_id):
+        if entity_type == "asset":
+            get_func = gazu.asset.get_asset
+        elif entity_type == "episode":
+            get_func = gazu.shot.get_episode
+        elif entity_type == "sequence":
+            get_func = gazu.shot.get_sequence
+        else:
+            get_func = gazu.shot.get_shot
+
+        try:
+            return get_func(entity_id)
+        except gazu.exception.RouteNotFoundException:
+            # Entity was removed in meantime
+            pass
+        except Exception:
+            log.warning(
+                "Failed to get Kitsu {} {}".format(entity_type, entity_id),
+                exc_info=True
+            )
+        return None
+
+    def _write_entities_updates(self, entities_by_project_id):
+        for project_id, entities in entities_by_project_id.items():
+            try:
+                bulk_writes = self._get_assets_updates(project_id, entities)
+                if bulk_writes:
+                    self.dbcon.bulk_write(bulk_writes)
+            except Exception:
+                log.warning(
+                    "Failed to update {} entities of project {}".format(
+                        len(entities), project_id
+                    ),
+                    exc_info=True
+                )
+
+    def _get_assets_updates(self, project_id, entities):
+        """Prepare updates of OP assets from zou entities of one project.
+
+        Args:
+            project_id (str): Project zou ID.
+            entities (List[dict]): Zou entities to update.
+
+        Returns:
+            List[UpdateOne]: Updates of asset documents.
+        """
+        set_op_project(self.dbcon, project_id, self.entities_cache)
+        project_name = self.dbcon.active_project()
+        project_doc = get_project(project_name)
+
+        # Query all assets of the local project
+        zou_ids_and_asset_docs = {
+            asset_doc["data"]["zou"]["id"]: asset_doc
+            for asset_doc in get_assets(project_name)
+            if asset_doc["data"].get("zou", {}).get("id")
+        }
+        zou_ids_and_asset_docs[project_id] = project_doc
+        gazu_project = self.entities_cache.get_project(project_id)
+
+        update_op_result = update_op_assets(
+            self.dbcon,
+            gazu_project,
+            project_doc,
+            entities,
+            zou_ids_and_asset_docs,
+            self.entities_cache,
+        )
+        return [
+            UpdateOne({"_id": asset_doc_id}, asset_update)
+            for asset_doc_id, asset_update in update_op_result or []
+        ]
+
+    def _update_entity(self, entity):
+        """Update one zou entity in OP DB."""
+        bulk_writes = self._get_assets_updates(entity["project_id"], [entity])
+        if bulk_writes:
+            self.dbcon.bulk_write(bulk_writes)
+
     # == Project ==
     def _new_project(self, data):
         """Create new project into OP DB."""
@@ -141,15 +295,14 @@ class Listener:
     def _update_project(self, data, new_project=False):
         """Update project into OP DB."""
         # Get project entity
+        self.entities_cache.invalidate_project(data["project_id"])
         project = gazu.project.get_project(data["project_id"])
 
         update_project = write_project_to_op(project, self.dbcon)
 
         # Write into DB
         if update_project:
-            self.dbcon.Session["AVALON_PROJECT"] = get_kitsu_project_name(
-                data["project_id"]
-            )
+            self.dbcon.Session["AVALON_PROJECT"] = project["name"]
             self.dbcon.bulk_write([update_project])
 
             if new_project:
@@ -175,7 +328,7 @@ class Listener:
     def _new_asset(self, data):
         """Create new asset into OP DB."""
         # Get project entity
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
 
         # Get asset entity
         asset = gazu.asset.get_asset(data["asset_id"])
@@ -203,38 +356,12 @@ class Listener:
 
     def _update_asset(self, data):
         """Update asset into OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
-        project_name = self.dbcon.active_project()
-        project_doc = get_project(project_name)
-
-        # Get gazu entity
         asset = gazu.asset.get_asset(data["asset_id"])
-
-        # Find asset doc
-        # Query all assets of the local project
-        zou_ids_and_asset_docs = {
-            asset_doc["data"]["zou"]["id"]: asset_doc
-            for asset_doc in get_assets(project_name)
-            if asset_doc["data"].get("zou", {}).get("id")
-        }
-        zou_ids_and_asset_docs[asset["project_id"]] = project_doc
-        gazu_project = gazu.project.get_project(asset["project_id"])
-
-        # Update
-        update_op_result = update_op_assets(
-            self.dbcon,
-            gazu_project,
-            project_doc,
-            [asset],
-            zou_ids_and_asset_docs,
-        )
-        if update_op_result:
-            asset_doc_id, asset_update = update_op_result[0]
-            self.dbcon.update_one({"_id": asset_doc_id}, asset_update)
+        self._update_entity(asset)
 
     def _delete_asset(self, data):
         """Delete asset of OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
 
         asset = self.dbcon.find_one({"data.zou.id": data["asset_id"]})
         if asset:
@@ -262,7 +389,7 @@ class Listener:
     def _new_episode(self, data):
         """Create new episode into OP DB."""
         # Get project entity
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
 
         # Get gazu entity
         ep = gazu.shot.get_episode(data["episode_id"])
@@ -281,38 +408,12 @@ class Listener:
 
     def _update_episode(self, data):
         """Update episode into OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
-        project_name = self.dbcon.active_project()
-        project_doc = get_project(project_name)
-
-        # Get gazu entity
         ep = gazu.shot.get_episode(data["episode_id"])
-
-        # Find asset doc
-        # Query all assets of the local project
-        zou_ids_and_asset_docs = {
-            asset_doc["data"]["zou"]["id"]: asset_doc
-            for asset_doc in get_assets(project_name)
-            if asset_doc["data"].get("zou", {}).get("id")
-        }
-        zou_ids_and_asset_docs[ep["project_id"]] = project_doc
-        gazu_project = gazu.project.get_project(ep["project_id"])
-
-        # Update
-        update_op_result = update_op_assets(
-            self.dbcon,
-            gazu_project,
-            project_doc,
-            [ep],
-            zou_ids_and_asset_docs,
-        )
-        if update_op_result:
-            asset_doc_id, asset_update = update_op_result[0]
-            self.dbcon.update_one({"_id": asset_doc_id}, asset_update)
+        self._update_entity(ep)
 
     def _delete_episode(self, data):
         """Delete shot of OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
 
         ep = self.dbcon.find_one({"data.zou.id": data["episode_id"]})
         if ep:
@@ -335,7 +436,7 @@ class Listener:
     def _new_sequence(self, data):
         """Create new sequnce into OP DB."""
         # Get project entity
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
 
         # Get gazu entity
         sequence = gazu.shot.get_sequence(data["sequence_id"])
@@ -362,38 +463,12 @@ class Listener:
 
     def _update_sequence(self, data):
         """Update sequence into OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
-        project_name = self.dbcon.active_project()
-        project_doc = get_project(project_name)
-
-        # Get gazu entity
         sequence = gazu.shot.get_sequence(data["sequence_id"])
-
-        # Find asset doc
-        # Query all assets of the local project
-        zou_ids_and_asset_docs = {
-            asset_doc["data"]["zou"]["id"]: asset_doc
-            for asset_doc in get_assets(project_name)
-            if asset_doc["data"].get("zou", {}).get("id")
-        }
-        zou_ids_and_asset_docs[sequence["project_id"]] = project_doc
-        gazu_project = gazu.project.get_project(sequence["project_id"])
-
-        # Update
-        update_op_result = update_op_assets(
-            self.dbcon,
-            gazu_project,
-            project_doc,
-            [sequence],
-            zou_ids_and_asset_docs,
-        )
-        if update_op_result:
-            asset_doc_id, asset_update = update_op_result[0]
-            self.dbcon.update_one({"_id": asset_doc_id}, asset_update)
+        self._update_entity(sequence)
 
     def _delete_sequence(self, data):
         """Delete sequence of OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
         sequence = self.dbcon.find_one({"data.zou.id": data["sequence_id"]})
         if sequence:
             # Delete
@@ -423,7 +498,7 @@ class Listener:
     def _new_shot(self, data):
         """Create new shot into OP DB."""
         # Get project entity
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
 
         # Get gazu entity
         shot = gazu.shot.get_shot(data["shot_id"])
@@ -451,39 +526,12 @@ class Listener:
 
     def _update_shot(self, data):
         """Update shot into OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
-        project_name = self.dbcon.active_project()
-        project_doc = get_project(project_name)
-
-        # Get gazu entity
         shot = gazu.shot.get_shot(data["shot_id"])
-
-        # Find asset doc
-        # Query all assets of the local project
-        zou_ids_and_asset_docs = {
-            asset_doc["data"]["zou"]["id"]: asset_doc
-            for asset_doc in get_assets(project_name)
-            if asset_doc["data"].get("zou", {}).get("id")
-        }
-        zou_ids_and_asset_docs[shot["project_id"]] = project_doc
-        gazu_project = gazu.project.get_project(shot["project_id"])
-
-        # Update
-        update_op_result = update_op_assets(
-            self.dbcon,
-            gazu_project,
-            project_doc,
-            [shot],
-            zou_ids_and_asset_docs,
-        )
-
-        if update_op_result:
-            asset_doc_id, asset_update = update_op_result[0]
-            self.dbcon.update_one({"_id": asset_doc_id}, asset_update)
+        self._update_entity(shot)
 
     def _delete_shot(self, data):
         """Delete shot of OP DB."""
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
         shot = self.dbcon.find_one({"data.zou.id": data["shot_id"]})
 
         if shot:
@@ -511,7 +559,7 @@ class Listener:
     def _new_task(self, data):
         """Create new task into OP DB."""
         # Get project entity
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
         project_name = self.dbcon.active_project()
 
         # Get gazu entity
@@ -574,7 +622,7 @@ class Listener:
     def _delete_task(self, data):
         """Delete task of OP DB."""
 
-        set_op_project(self.dbcon, data["project_id"])
+        set_op_project(self.dbcon, data["project_id"], self.entities_cache)
         project_name = self.dbcon.active_project()
         # Find asset doc
         asset_docs = list(get_assets(project_name))
@@ -619,12 +667,15 @@ class Listener:
                     return
 
 
-def start_listeners(login: str, password: str):
+def start_listeners(login: str, password: str, batch_interval: float = 0):
     """Start listeners to keep OpenPype up-to-date with Kitsu.
 
     Args:
         login (str): Kitsu user login
         password (str): Kitsu user password
+        batch_interval (float): Collect events for this amount of seconds
+            and process them at once. Events are processed immediately
+            if is '0'.
     """
 
     # Refresh token every week
@@ -636,5 +687,5 @@ def start_listeners(login: str, password: str):
     refresh_token_every_week()
 
     # Connect to server
-    listener = Listener(login, password)
+    listener = Listener(login, password, batch_interval)
     listener.start()
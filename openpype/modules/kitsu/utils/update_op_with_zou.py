@@ -15,6 +15,7 @@ from openpype.client import (
 )
 from openpype.pipeline import AvalonMongoDB
 from openpype.modules.kitsu.utils.credentials import validate_credentials
+from openpype.modules.kitsu.utils.entities_cache import KitsuEntitiesCache
 
 from openpype.lib import Logger
 
@@ -37,29 +38,115 @@ def create_op_asset(gazu_entity: dict) -> dict:
     }
 
 
-def get_kitsu_project_name(project_id: str) -> str:
+def get_kitsu_project_name(
+    project_id: str, entities_cache: KitsuEntitiesCache = None
+) -> str:
     """Get project name based on project id in kitsu.
 
     Args:
         project_id (str): UUID of project in Kitsu.
+        entities_cache (KitsuEntitiesCache, optional): Cache used to get
+            the project.
 
     Returns:
         str: Name of Kitsu project.
     """
 
-    project = gazu.project.get_project(project_id)
+    if entities_cache is not None:
+        project = entities_cache.get_project(project_id)
+    else:
+        project = gazu.project.get_project(project_id)
     return project["name"]
 
 
-def set_op_project(dbcon: AvalonMongoDB, project_id: str):
+def set_op_project(
+    dbcon: AvalonMongoDB,
+    project_id: str,
+    entities_cache: KitsuEntitiesCache = None,
+):
     """Set project context.
 
     Args:
         dbcon (AvalonMongoDB): Connection to DB
         project_id (str): Project zou ID
+        entities_cache (KitsuEntitiesCache, optional): Cache used to get
+            the project.
     """
 
-    dbcon.Session["AVALON_PROJECT"] = get_kitsu_project_name(project_id)
+    dbcon.Session["AVALON_PROJECT"] = get_kitsu_project_name(
+        project_id, entities_cache
+    )
+
+
+def _get_parent_entity(
+    entity_id: str, asset_doc_ids: Dict[str, dict], fetch_func
+) -> dict:
+    asset_doc = asset_doc_ids.get(entity_id)
+    if asset_doc and asset_doc["data"].get("zou"):
+        return asset_doc["data"]["zou"]
+    try:
+        return fetch_func(entity_id)
+    except gazu.exception.RouteNotFoundException:
+        return None
+
+
+def get_full_task(
+    task: dict,
+    entity: dict,
+    asset_doc_ids: Dict[str, dict],
+    entities_cache: KitsuEntitiesCache,
+) -> dict:
+    """Fill task with related entities as 'gazu.task.get_task' does.
+
+    Related entities are taken from cache and from already synchronized
+    entities instead of requesting full task from Kitsu for each task.
+
+    Args:
+        task (dict): Task from 'gazu.task.all_tasks_for_*' functions.
+        entity (dict): Zou entity of the task.
+        asset_doc_ids (Dict[str, dict]): Dicts of [{zou_id: asset_doc}, ...]
+        entities_cache (KitsuEntitiesCache): Cache of rarely changed
+            entities.
+
+    Returns:
+        dict: Task with related entities.
+    """
+
+    full_task = dict(task)
+    full_task.update(
+        {
+            "type": "Task",
+            "project": entities_cache.get_project(task["project_id"]),
+            "task_type": entities_cache.get_task_type(task["task_type_id"]),
+            "task_status": entities_cache.get_task_status(
+                task["task_status_id"]
+            ),
+            "entity": entity,
+            "entity_type": entities_cache.get_entity_type(
+                entity["entity_type_id"]
+            ),
+            "persons": [
+                entities_cache.get_person(person_id)
+                for person_id in task.get("assignees") or []
+            ],
+        }
+    )
+
+    sequence_id = entity.get("parent_id")
+    if sequence_id:
+        sequence = _get_parent_entity(
+            sequence_id, asset_doc_ids, gazu.shot.get_sequence
+        )
+        if sequence:
+            full_task["sequence"] = sequence
+            episode_id = sequence.get("parent_id")
+            if episode_id:
+                episode = _get_parent_entity(
+                    episode_id, asset_doc_ids, gazu.shot.get_episode
+                )
+                if episode:
+                    full_task["episode"] = episode
+    return full_task
 
 
 def update_op_assets(
@@ -68,6 +155,7 @@ def update_op_assets(
     project_doc: dict,
     entities_list: List[dict],
     asset_doc_ids: Dict[str, dict],
+    entities_cache: KitsuEntitiesCache = None,
 ) -> List[Dict[str, dict]]:
     """Update OpenPype assets.
     Set 'data' and 'parent' fields.
@@ -78,6 +166,8 @@ def update_op_assets(
         project_doc (dict): Dict of project,
         entities_list (List[dict]): List of zou entities to update
         asset_doc_ids (Dict[str, dict]): Dicts of [{zou_id: asset_doc}, ...]
+        entities_cache (KitsuEntitiesCache, optional): Cache of rarely
+            changed entities. New cache is used if not passed.
 
     Returns:
         List[Dict[str, dict]]: List of (doc_id, update_dict) tuples
@@ -86,6 +176,8 @@ def update_op_assets(
         return
 
     project_name = project_doc["name"]
+    if entities_cache is None:
+        entities_cache = KitsuEntitiesCache()
 
     assets_with_update = []
     for item in entities_list:
@@ -188,7 +280,9 @@ def update_op_assets(
         item_data["tasks"] = {
             t["task_type_name"]: {
                 "type": t["task_type_name"],
-                "zou": gazu.task.get_task(t["id"]),
+                "zou": get_full_task(
+                    t, item, asset_doc_ids, entities_cache
+                ),
             }
             for t in tasks_list
         }
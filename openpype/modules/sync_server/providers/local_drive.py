@@ -1,7 +1,8 @@
 from __future__ import print_function
+import os
 import os.path
+import sys
 import shutil
-import threading
 import time
 
 from openpype.lib import Logger
@@ -11,11 +12,147 @@ from .abstract_provider import AbstractProvider
 
 log = Logger.get_logger("SyncServer")
 
+# Partially copied files have this suffix until copy finishes
+PARTIAL_SUFFIX = ".part"
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _copy_file_range_chunk(src_fd, dst_fd, size):
+    # Uses and moves positions of both files
+    return os.copy_file_range(src_fd, dst_fd, size)
+
+
+def _sendfile_chunk(src_fd, dst_fd, size):
+    # 'sendfile' does not move position of source file
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    copied = os.sendfile(dst_fd, src_fd, offset, size)
+    os.lseek(src_fd, offset + copied, os.SEEK_SET)
+    return copied
+
+
+def _get_kernel_copy_funcs():
+    """Functions copying chunk between files without passing it to python.
+
+    Returns:
+        list[Callable[[int, int, int], int]]: Available functions.
+    """
+    funcs = []
+    if hasattr(os, "copy_file_range"):
+        funcs.append(_copy_file_range_chunk)
+    # 'sendfile' to regular file is supported only on linux
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        funcs.append(_sendfile_chunk)
+    return funcs
+
+
+def copy_file_chunked(
+    source_path,
+    target_path,
+    progress_callback=None,
+    chunk_size=COPY_CHUNK_SIZE,
+    fsync=False,
+    resume=True
+):
+    """Copy file in chunks and report progress after each chunk.
+
+    Content is written to '<target_path>.part' which is renamed to target
+    path when size of copied file is verified. Partial file left by
+    interrupted copy is resumed from its size if source did not change
+    since then. Chunks are copied by 'copy_file_range' or 'sendfile' when
+    possible, regular buffered copy is used otherwise.
+
+    Args:
+        source_path (str): Path to source file.
+        target_path (str): Path to target file.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            with copied and total size in bytes.
+        chunk_size (int): Size of copied chunks in bytes.
+        fsync (bool): Flush content to disk before rename.
+        resume (bool): Continue from existing partial file.
+
+    Returns:
+        int: Number of bytes copied in this call.
+
+    Raises:
+        IOError: Size of copied file does not match source.
+    """
+    source_stat = os.stat(source_path)
+    total = source_stat.st_size
+    partial_path = target_path + PARTIAL_SUFFIX
+
+    offset = 0
+    if resume and os.path.isfile(partial_path):
+        partial_stat = os.stat(partial_path)
+        if (
+            0 < partial_stat.st_size < total
+            and source_stat.st_mtime <= partial_stat.st_mtime
+        ):
+            offset = partial_stat.st_size
+
+    copied = offset
+    kernel_funcs = _get_kernel_copy_funcs()
+    buffer = None
+    with open(source_path, "rb") as src_stream:
+        with open(partial_path, "r+b" if offset else "wb") as dst_stream:
+            src_stream.seek(offset)
+            dst_stream.seek(offset)
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            while copied < total:
+                size = min(chunk_size, total - copied)
+                chunk_copied = None
+                while kernel_funcs and chunk_copied is None:
+                    try:
+                        chunk_copied = kernel_funcs[0](src_fd, dst_fd, size)
+                    except OSError:
+                        # Not supported for these files, e.g. across
+                        #   filesystems
+                        chunk_copied = None
+                    if not chunk_copied:
+                        # Failed or returned nothing before end of source
+                        #   (e.g. on some network filesystems), continue
+                        #   with next function from current position
+                        chunk_copied = None
+                        kernel_funcs.pop(0)
+                        src_stream.seek(copied)
+                        dst_stream.seek(copied)
+
+                if chunk_copied is None:
+                    if buffer is None:
+                        buffer = memoryview(bytearray(chunk_size))
+                    chunk_copied = src_stream.readinto(buffer[:size])
+                    dst_stream.write(buffer[:chunk_copied])
+
+                if not chunk_copied:
+                    break
+                copied += chunk_copied
+                if progress_callback is not None:
+                    progress_callback(copied, total)
+
+            dst_stream.flush()
+            if fsync:
+                os.fsync(dst_fd)
+            target_size = os.fstat(dst_fd).st_size
+
+    if target_size != total:
+        raise IOError(
+            "Copied file {} has size {} but source has {}".format(
+                target_path, target_size, total
+            )
+        )
+
+    shutil.copymode(source_path, partial_path)
+    os.replace(partial_path, target_path)
+    return copied - offset
+
 
 class LocalDriveHandler(AbstractProvider):
     CODE = 'local_drive'
     LABEL = 'Local drive'
 
+    # Flush copied files to disk before they are marked as synced
+    FSYNC_ON_COMPLETE = False
+
     """ Handles required operations on mounted disks with OS """
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -92,16 +229,13 @@ class LocalDriveHandler(AbstractProvider):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
 
-        if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(project_name, file, representation, server,
-                                site, source_path, target_path, direction)
-        else:
-            if os.path.exists(target_path):
-                raise ValueError("File {} exists, set overwrite".
-                                 format(target_path))
+        if not overwrite and os.path.exists(target_path):
+            raise ValueError("File {} exists, set overwrite".
+                             format(target_path))
+
+        self._copy(source_path, target_path, self._get_progress_callback(
+            project_name, file, representation, server, site, direction
+        ))
 
         return os.path.basename(target_path)
 
@@ -183,41 +317,51 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
-            print("same files, skipping")
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+    def _copy(self, source_path, target_path, progress_callback=None):
+        log.debug("copying {}->{}".format(source_path, target_path))
+        if (
+            os.path.exists(target_path)
+            and os.path.samefile(source_path, target_path)
+        ):
+            log.debug("same files, skipping")
+            return
+
+        copy_file_chunked(
+            source_path,
+            target_path,
+            progress_callback,
+            fsync=self.FSYNC_ON_COMPLETE
+        )
+
+    def _get_progress_callback(self, project_name, file, representation,
+                               server, site, direction):
+        """
+            Callback updating progress field in DB by values 0-1.
+
+            Progress is stored at most once per 'server.LOG_PROGRESS_SEC',
+            quickly copied files don't write any progress.
+        """
+        started = time.time()
+        # Time of last stored progress, list is used to be able to change it
+        #   from callback
+        last_tick = [started]
+
+        def progress_callback(copied, total):
+            now = time.time()
+            if now - last_tick[0] < server.LOG_PROGRESS_SEC:
+                return
+            last_tick[0] = now
+            status_val = copied / total
+            log.debug(direction + "ed %d%% in %ds." % (
+                int(status_val * 100), now - started))
+            server.update_db(project_name=project_name,
+                             new_file_id=None,
+                             file=file,
+                             representation=representation,
+                             site=site,
+                             progress=status_val
+                             )
+        return progress_callback
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
@@ -3,6 +3,7 @@ import os.path
 import time
 import threading
 import platform
+import contextlib
 
 from openpype.lib import Logger
 from openpype.settings import get_system_settings
@@ -19,6 +20,220 @@ except (ImportError, SyntaxError):
     # handle imports from Python 2 hosts - in those only basic methods are used
     log.warning("Import failed, imported from Python 2, operations will fail.")
 
+# Partially transferred files have this suffix until transfer finishes
+PARTIAL_SUFFIX = ".part"
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+
+
+class SFTPConnectionPool(object):
+    """Pool of SFTP connections shared by handlers with same credentials.
+
+    Connection is not thread safe so each acquired connection is used
+    exclusively by single thread until it is released back to the pool.
+    Idle connections are reused which avoids SSH handshake and
+    authentication for each operation.
+
+    Connection which was idle for longer than 'health_check_after' is
+    checked before it is returned. Connections idle for longer than
+    'idle_timeout' are closed.
+
+    Args:
+        connect_func (Callable[[], Any]): Creates new connection. May return
+            None if connection could not be created.
+        max_connections (int): Maximum number of open connections, acquire
+            waits for released connection when the limit is reached.
+        idle_timeout (float): Seconds after which idle connection is closed.
+        health_check_after (float): Check connection idle for more seconds
+            before it is reused.
+    """
+
+    def __init__(
+        self,
+        connect_func,
+        max_connections=10,
+        idle_timeout=300,
+        health_check_after=30
+    ):
+        self._connect_func = connect_func
+        self._max_connections = max_connections
+        self._idle_timeout = idle_timeout
+        self._health_check_after = health_check_after
+        self._condition = threading.Condition()
+        # List of (connection, released time), last released is last
+        self._idle = []
+        self._opened_count = 0
+
+    @property
+    def opened_count(self):
+        """Number of open connections (idle and acquired)."""
+        return self._opened_count
+
+    @property
+    def idle_count(self):
+        return len(self._idle)
+
+    def acquire(self):
+        """Get connection for exclusive use.
+
+        Returns:
+            Union[pysftp.Connection, None]: Connection or None if
+                connection could not be created.
+        """
+
+        while True:
+            with self._condition:
+                self._evict_idle()
+                conn = None
+                idle_time = 0
+                if self._idle:
+                    conn, released = self._idle.pop()
+                    idle_time = time.time() - released
+                elif self._opened_count < self._max_connections:
+                    self._opened_count += 1
+                else:
+                    self._condition.wait()
+                    continue
+
+            if conn is None:
+                return self._connect()
+
+            if self._is_healthy(conn, idle_time):
+                return conn
+            # Replace broken connection, slot stays reserved
+            self._close_connection(conn)
+            return self._connect()
+
+    def release(self, conn, broken=False):
+        """Return connection to the pool.
+
+        Args:
+            conn (Union[pysftp.Connection, None]): Acquired connection.
+            broken (bool): Connection should not be reused.
+        """
+
+        # Slot of connection which could not be created was already
+        #   returned by '_connect'
+        if conn is None:
+            return
+
+        if broken:
+            self._close(conn)
+            return
+
+        with self._condition:
+            self._evict_idle()
+            self._idle.append((conn, time.time()))
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Context manager acquiring connection and releasing it back.
+
+        Connection which was broken during usage is replaced on next
+        acquire by health check.
+        """
+
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def evict_idle(self):
+        """Close connections which were idle for too long."""
+        with self._condition:
+            self._evict_idle()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._condition:
+            idle = self._idle
+            self._idle = []
+        for conn, _ in idle:
+            self._close(conn)
+
+    def _connect(self):
+        conn = None
+        try:
+            conn = self._connect_func()
+        finally:
+            if conn is None:
+                with self._condition:
+                    self._opened_count -= 1
+                    self._condition.notify()
+        return conn
+
+    def _evict_idle(self):
+        # Expects to be called under lock
+        now = time.time()
+        expired = []
+        for item in tuple(self._idle):
+            if now - item[1] >= self._idle_timeout:
+                self._idle.remove(item)
+                expired.append(item[0])
+
+        for conn in expired:
+            self._close_connection(conn)
+            self._opened_count -= 1
+
+    def _close(self, conn):
+        self._close_connection(conn)
+        with self._condition:
+            self._opened_count -= 1
+            self._condition.notify()
+
+    def _close_connection(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            log.debug("Failed to close SFTP connection", exc_info=True)
+
+    def _is_healthy(self, conn, idle_time):
+        try:
+            transport = conn.sftp_client.get_channel().get_transport()
+            if not transport.is_active():
+                return False
+            if idle_time >= self._health_check_after:
+                # Round trip to server
+                conn.sftp_client.normalize(".")
+        except Exception:
+            return False
+        return True
+
+
+_CONNECTION_POOLS = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+
+
+def get_connection_pool(key, connect_func, **kwargs):
+    """Get connection pool shared for connection key.
+
+    Args:
+        key (Hashable): Identifier of connection parameters.
+        connect_func (Callable[[], Any]): Creates new connection.
+        **kwargs: Additional arguments for 'SFTPConnectionPool'.
+
+    Returns:
+        SFTPConnectionPool: Pool for the key.
+    """
+
+    with _CONNECTION_POOLS_LOCK:
+        pool = _CONNECTION_POOLS.get(key)
+        if pool is None:
+            pool = SFTPConnectionPool(connect_func, **kwargs)
+            _CONNECTION_POOLS[key] = pool
+    return pool
+
+
+class _TransferProgress(object):
+    """Progress of file transfer running in a thread."""
+
+    def __init__(self, size):
+        self.size = size
+        self.transferred = 0
+        self.error = None
+        self.done = threading.Event()
+
 
 class SFTPHandler(AbstractProvider):
     """
@@ -34,6 +249,9 @@ class SFTPHandler(AbstractProvider):
     CODE = 'sftp'
     LABEL = 'SFTP'
 
+    POOL_MAX_CONNECTIONS = 10
+    POOL_IDLE_TIMEOUT = 300
+
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
         self.project_name = project_name
@@ -66,13 +284,38 @@ class SFTPHandler(AbstractProvider):
 
         return self._conn
 
+    @property
+    def pool(self):
+        """Pool of connections shared by handlers with same credentials.
+
+        Returns:
+            SFTPConnectionPool: Connection pool.
+        """
+        key = (
+            self.sftp_host,
+            self.sftp_port,
+            self.sftp_user,
+            self.sftp_pass,
+            str(self.sftp_key),
+            self.sftp_key_pass
+        )
+        return get_connection_pool(
+            key,
+            self._get_conn,
+            max_connections=self.POOL_MAX_CONNECTIONS,
+            idle_timeout=self.POOL_IDLE_TIMEOUT
+        )
+
     def is_active(self):
         """
             Returns True if provider is activated, eg. has working credentials.
         Returns:
             (boolean)
         """
-        return self.presets.get("enabled") and self.conn is not None
+        if not self.presets.get("enabled"):
+            return False
+        with self.pool.connection() as conn:
+            return conn is not None
 
     @classmethod
     def get_system_settings_schema(cls):
@@ -218,7 +461,8 @@ class SFTPHandler(AbstractProvider):
         Returns:
             (string) folder id of lowest subfolder from 'path'
         """
-        self.conn.makedirs(path)
+        with self.pool.connection() as conn:
+            conn.makedirs(path)
 
         return os.path.basename(path)
 
@@ -254,18 +498,58 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
+        progress = _TransferProgress(os.path.getsize(source_path))
         thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
+                                  args=(source_path, target_path, progress))
         thread.start()
         self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+                            site, progress, "upload")
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.put(source_path, target_path)
+    def _upload(self, source_path, target_path, progress):
+        """Upload file in chunks with pipelined writes.
+
+        Data are written to partial file which is renamed to target path
+        when finished. Existing partial file of previous failed upload
+        is resumed from its size.
+        """
+        self.log.debug("copying {}->{}".format(source_path, target_path))
+        partial_path = target_path + PARTIAL_SUFFIX
+        try:
+            with self.pool.connection() as conn:
+                client = conn.sftp_client
+                offset = 0
+                try:
+                    partial_stat = client.stat(partial_path)
+                    if self._can_resume(
+                        partial_stat.st_size,
+                        partial_stat.st_mtime,
+                        progress.size,
+                        os.path.getmtime(source_path)
+                    ):
+                        offset = partial_stat.st_size
+                except IOError:
+                    pass
+
+                # Append flag is ignored by some servers, seek instead
+                mode = "r+b" if offset else "wb"
+                progress.transferred = offset
+                with open(source_path, "rb") as src_stream:
+                    src_stream.seek(offset)
+                    with client.open(partial_path, mode) as dst_stream:
+                        dst_stream.seek(offset)
+                        dst_stream.set_pipelined(True)
+                        self._copy_stream(src_stream, dst_stream, progress)
+
+                if conn.exists(target_path):
+                    client.remove(target_path)
+                client.rename(partial_path, target_path)
+
+        except Exception as exc:
+            progress.error = exc
+        finally:
+            progress.done.set()
 
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
@@ -291,27 +575,80 @@ class SFTPHandler(AbstractProvider):
             (string) file_id of created/modified file ,
                 throws FileExistsError, FileNotFoundError exceptions
         """
-        if not self.file_path_exists(source_path):
-            raise FileNotFoundError("Source file {} doesn't exist."
-                                    .format(source_path))
+        with self.pool.connection() as conn:
+            if not conn.isfile(source_path):
+                raise FileNotFoundError("Source file {} doesn't exist."
+                                        .format(source_path))
+            source_stat = conn.stat(source_path)
 
         if os.path.isfile(target_path):
             if not overwrite:
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
+        progress = _TransferProgress(source_stat.st_size)
+        thread = threading.Thread(
+            target=self._download,
+            args=(source_path, target_path, source_stat.st_mtime, progress)
+        )
         thread.start()
         self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+                            site, progress, "download")
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
-        print("downloading {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.get(source_path, target_path)
+    def _download(self, source_path, target_path, source_mtime, progress):
+        """Download file in chunks with prefetched reads.
+
+        Data are written to local partial file which is renamed to target
+        path when finished. Existing partial file of previous failed download
+        is resumed from its size.
+        """
+        self.log.debug("downloading {}->{}".format(source_path, target_path))
+        partial_path = target_path + PARTIAL_SUFFIX
+        try:
+            offset = 0
+            if os.path.isfile(partial_path) and self._can_resume(
+                os.path.getsize(partial_path),
+                os.path.getmtime(partial_path),
+                progress.size,
+                source_mtime
+            ):
+                offset = os.path.getsize(partial_path)
+
+            mode = "ab" if offset else "wb"
+            progress.transferred = offset
+            with self.pool.connection() as conn:
+                with conn.sftp_client.open(source_path, "rb") as src_stream:
+                    src_stream.seek(offset)
+                    src_stream.prefetch(progress.size)
+                    with open(partial_path, mode) as dst_stream:
+                        self._copy_stream(src_stream, dst_stream, progress)
+
+            os.replace(partial_path, target_path)
+
+        except Exception as exc:
+            progress.error = exc
+        finally:
+            progress.done.set()
+
+    @staticmethod
+    def _can_resume(partial_size, partial_mtime, source_size, source_mtime):
+        """Partial file can be resumed.
+
+        Source must be bigger than partial file and must not be modified
+        after partial file was written.
+        """
+        return 0 < partial_size < source_size and source_mtime <= partial_mtime
+
+    @staticmethod
+    def _copy_stream(src_stream, dst_stream, progress):
+        while True:
+            chunk = src_stream.read(TRANSFER_CHUNK_SIZE)
+            if not chunk:
+                break
+            dst_stream.write(chunk)
+            progress.transferred += len(chunk)
 
     def delete_file(self, path):
         """
@@ -323,11 +660,12 @@ class SFTPHandler(AbstractProvider):
         Returns:
             None
         """
-        if not self.file_path_exists(path):
-            raise FileNotFoundError("File {} to be deleted doesn't exist."
-                                    .format(path))
+        with self.pool.connection() as conn:
+            if not conn.isfile(path):
+                raise FileNotFoundError("File {} to be deleted doesn't exist."
+                                        .format(path))
 
-        self.conn.remove(path)
+            conn.remove(path)
 
     def list_folder(self, folder_path):
         """
@@ -352,7 +690,8 @@ class SFTPHandler(AbstractProvider):
         if not file_path:
             return False
 
-        return self.conn.isdir(file_path)
+        with self.pool.connection() as conn:
+            return conn.isdir(file_path)
 
     def file_path_exists(self, file_path):
         """
@@ -366,7 +705,8 @@ class SFTPHandler(AbstractProvider):
         if not file_path:
             return False
 
-        return self.conn.isfile(file_path)
+        with self.pool.connection() as conn:
+            return conn.isfile(file_path)
 
     @classmethod
     def get_presets(cls):
@@ -394,8 +734,9 @@ class SFTPHandler(AbstractProvider):
         """
             Returns fresh sftp connection.
 
-            It seems that connection cannot be cached into self.conn, at least
-            for get and put which run in separate threads.
+            Connection is not thread safe so it cannot be cached into
+            self.conn, at least for get and put which run in separate
+            threads. Use 'pool' to get connection for exclusive use.
 
         Returns:
             pysftp.Connection
@@ -427,38 +768,32 @@ class SFTPHandler(AbstractProvider):
             self.log.warning("Couldn't connect", exc_info=True)
 
     def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
+                       progress, direction):
         """
             Updates progress field in DB by values 0-1.
 
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+            Waits until transfer thread finishes and reports transferred
+            bytes. Error of the transfer is re-raised.
+        """
+        last_tick = None
+        while not progress.done.wait(0.5):
+            if (
+                last_tick
+                and time.time() - last_tick < server.LOG_PROGRESS_SEC
+            ):
+                continue
+            status_val = 0
+            if progress.size:
+                status_val = progress.transferred / progress.size
+            last_tick = time.time()
+            self.log.debug(direction + "ed %d%%." % int(status_val * 100))
+            server.update_db(project_name=project_name,
+                             new_file_id=None,
+                             file=file,
+                             representation=representation,
+                             site=site,
+                             progress=status_val
+                             )
+
+        if progress.error is not None:
+            raise progress.error
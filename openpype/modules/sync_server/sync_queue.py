@@ -0,0 +1,259 @@
+"""Incremental queue of representations waiting for synchronization."""
+import time
+import threading
+
+from pymongo.errors import PyMongoError
+
+from openpype.lib import Logger
+
+
+class SyncRepresentationsQueue(object):
+    """Representations to synchronize kept in memory between sync loops.
+
+    Queue is seeded by full aggregation from
+    'SyncServerModule.get_sync_representations' and then only changed
+    representations are re-queried. Changes are received from Mongo change
+    stream when the database supports it (replica set). Otherwise the queue
+    falls back to polling of representations created after last known
+    '_id' watermark, representations changed by this process and full
+    refresh each 'full_refresh_interval' seconds (changes made by other
+    processes are not visible sooner in polling mode).
+
+    Args:
+        module (SyncServerModule): Sync server module.
+        project_name (str): Project name.
+        active_site (str): Active site name.
+        remote_site (str): Remote site name.
+        full_refresh_interval (Optional[int]): Seconds after which is queue
+            seeded again in polling mode.
+    """
+
+    def __init__(
+        self,
+        module,
+        project_name,
+        active_site,
+        remote_site,
+        full_refresh_interval=600
+    ):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._module = module
+        self.project_name = project_name
+        self.active_site = active_site
+        self.remote_site = remote_site
+        self.full_refresh_interval = full_refresh_interval
+
+        self._lock = threading.Lock()
+        self._repres_by_id = {}
+        self._ordered_repres = None
+        self._changed_ids = set()
+        self._watermark_id = None
+        self._last_full_refresh = None
+        self._needs_full_refresh = True
+        self._query_settings = None
+
+        self._change_stream = None
+        self._watch_thread = None
+        self._stopped = False
+
+    @property
+    def uses_change_stream(self):
+        return self._change_stream is not None
+
+    def mark_changed(self, representation_ids):
+        """Mark representations to be re-queried on next refresh.
+
+        Args:
+            representation_ids (Iterable[ObjectId]): Changed representation
+                ids.
+        """
+
+        with self._lock:
+            self._changed_ids.update(representation_ids)
+
+    def invalidate(self):
+        """Seed whole queue again on next refresh."""
+
+        self._needs_full_refresh = True
+
+    def set_query_settings(self, query_settings):
+        """Set settings which affect queried representations.
+
+        Queued representations are queried again if settings changed, e.g.
+        retries count or default priority.
+
+        Args:
+            query_settings (dict[str, Any]): Settings used in query of
+                representations.
+        """
+
+        if query_settings != self._query_settings:
+            self._query_settings = query_settings
+            self.invalidate()
+
+    def get_representations(self):
+        """Representations to synchronize ordered by priority.
+
+        Returns:
+            list[dict[str, Any]]: Aggregated representation documents in
+                same shape as 'get_sync_representations' returns.
+        """
+
+        if self._needs_refresh_all():
+            self._refresh_all()
+        else:
+            self._refresh_changed()
+
+        if self._ordered_repres is None:
+            self._ordered_repres = sorted(
+                self._repres_by_id.values(),
+                key=lambda repre: (-repre["priority"], repre["_id"])
+            )
+        return list(self._ordered_repres)
+
+    def stop(self):
+        """Stop watching of changes."""
+
+        self._stopped = True
+        change_stream = self._change_stream
+        self._change_stream = None
+        if change_stream is not None:
+            try:
+                change_stream.close()
+            except PyMongoError:
+                pass
+
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+            self._watch_thread = None
+
+    def _needs_refresh_all(self):
+        if self._needs_full_refresh:
+            return True
+
+        # Change stream died, fallback to polling
+        if self._watch_thread is not None and (
+            not self._watch_thread.is_alive()
+        ):
+            self._watch_thread = None
+            self._change_stream = None
+            return True
+
+        if self.uses_change_stream:
+            return False
+
+        return (
+            time.time() - self._last_full_refresh
+            >= self.full_refresh_interval
+        )
+
+    def _refresh_all(self):
+        # Start watching before seeding so no change is missed
+        if not self._stopped and self._watch_thread is None:
+            self._start_watching()
+
+        with self._lock:
+            self._changed_ids = set()
+
+        self._repres_by_id = {
+            repre["_id"]: repre
+            for repre in self._module.get_sync_representations(
+                self.project_name, self.active_site, self.remote_site
+            )
+        }
+        self._ordered_repres = None
+        self._watermark_id = self._get_last_representation_id()
+        self._last_full_refresh = time.time()
+        self._needs_full_refresh = False
+
+    def _refresh_changed(self):
+        with self._lock:
+            changed_ids, self._changed_ids = self._changed_ids, set()
+
+        new_ids = set()
+        if not self.uses_change_stream:
+            new_ids = self._get_new_representation_ids()
+            changed_ids |= new_ids
+
+        if not changed_ids:
+            return
+
+        self.log.debug("Refreshing {} changed representations".format(
+            len(changed_ids)))
+        repres_by_id = {
+            repre["_id"]: repre
+            for repre in self._module.get_sync_representations(
+                self.project_name,
+                self.active_site,
+                self.remote_site,
+                representation_ids=list(changed_ids)
+            )
+        }
+        for repre_id in changed_ids:
+            repre = repres_by_id.get(repre_id)
+            if repre is None:
+                self._repres_by_id.pop(repre_id, None)
+            else:
+                self._repres_by_id[repre_id] = repre
+
+        if new_ids:
+            self._watermark_id = max(new_ids)
+        self._ordered_repres = None
+
+    def _get_collection(self):
+        return self._module.connection.database[self.project_name]
+
+    def _get_last_representation_id(self):
+        for doc in self._get_collection().find(
+            {"type": "representation"},
+            {"_id": True}
+        ).sort("_id", -1).limit(1):
+            return doc["_id"]
+        return None
+
+    def _get_new_representation_ids(self):
+        query = {"type": "representation"}
+        if self._watermark_id is not None:
+            query["_id"] = {"$gt": self._watermark_id}
+        return {
+            doc["_id"]
+            for doc in self._get_collection().find(query, {"_id": True})
+        }
+
+    def _start_watching(self):
+        try:
+            self._change_stream = self._get_collection().watch([
+                {"$match": {"operationType": {
+                    "$in": ["insert", "update", "replace", "delete"]
+                }}}
+            ])
+        except PyMongoError:
+            self.log.info((
+                "Change streams are not available for project '{}'."
+                " Using polling of changes."
+            ).format(self.project_name))
+            self._change_stream = None
+            return
+
+        self._watch_thread = threading.Thread(
+            target=self._watch_changes, daemon=True
+        )
+        self._watch_thread.start()
+
+    def _watch_changes(self):
+        change_stream = self._change_stream
+        try:
+            while not self._stopped and change_stream.alive:
+                change = change_stream.try_next()
+                if change is None:
+                    time.sleep(0.5)
+                    continue
+                self.mark_changed([change["documentKey"]["_id"]])
+
+        except PyMongoError:
+            if not self._stopped:
+                self.log.warning(
+                    "Change stream of project '{}' failed.".format(
+                        self.project_name),
+                    exc_info=True
+                )
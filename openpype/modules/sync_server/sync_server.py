@@ -1,5 +1,6 @@
 """Python 3 only implementation."""
 import os
+import time
 import asyncio
 import threading
 import concurrent.futures
@@ -285,6 +286,49 @@ def download_last_published_workfile(
     return last_published_workfile_path
 
 
+class SyncResultWriter(object):
+    """Collects results of synchronized files and stores them in bulk.
+
+    Results are written to DB by 'SyncServerModule.update_db_bulk' when
+    count of collected results reaches 'max_batch_size' or when
+    'flush_interval' seconds passed from last write.
+
+    Args:
+        module (SyncServerModule): Sync server module.
+        project_name (str): Project name of processed representations.
+        flush_interval (Optional[float]): Max seconds between writes.
+        max_batch_size (Optional[int]): Max results written at once.
+    """
+
+    def __init__(
+        self, module, project_name, flush_interval=5, max_batch_size=500
+    ):
+        self.module = module
+        self.project_name = project_name
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._results = []
+        self._last_flush = time.time()
+
+    def add(self, new_file_id, file, representation, site, error=None):
+        self._results.append(
+            (new_file_id, file, representation, site, error)
+        )
+        if len(self._results) >= self.max_batch_size:
+            self.flush()
+
+    def flush_if_needed(self):
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.time()
+        if not self._results:
+            return
+        results, self._results = self._results, []
+        self.module.update_db_bulk(self.project_name, results)
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
@@ -336,7 +380,6 @@ class SyncServerThread(threading.Thread):
         """
         while self.is_running and not self.module.is_paused():
             try:
-                import time
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
                 project_name = None
@@ -349,14 +392,21 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
-                    )
+                    if self.module.is_incremental_queue_enabled(
+                        project_name
+                    ):
+                        sync_queue = self.module.get_sync_queue(
+                            project_name, local_site, remote_site)
+                        sync_repres = sync_queue.get_representations()
+                    else:
+                        sync_repres = self.module.get_sync_representations(
+                            project_name,
+                            local_site,
+                            remote_site
+                        )
 
                     task_files_to_process = []
-                    files_processed_info = []
+                    files_processed_info = {}
                     # process only unique file paths in one batch
                     # multiple representation could have same file path
                     # (textures),
@@ -405,11 +455,9 @@ class SyncServerThread(threading.Thread):
                                                site_preset))
                                     task_files_to_process.append(task)
                                     # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
+                                    files_processed_info[task] = (
+                                        file, sync, remote_site
+                                    )
                                     processed_file_path.add(file_path)
                                 if status == SyncStatus.DO_DOWNLOAD:
                                     tree = handler.get_tree()
@@ -425,32 +473,19 @@ class SyncServerThread(threading.Thread):
                                                  site_preset))
                                     task_files_to_process.append(task)
 
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
+                                    files_processed_info[task] = (
+                                        file, sync, local_site
+                                    )
                                     processed_file_path.add(file_path)
 
                     self.log.debug("Sync tasks count {}".format(
                         len(task_files_to_process)
                     ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                    await self._process_sync_tasks(
+                        project_name,
+                        task_files_to_process,
+                        files_processed_info
+                    )
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -478,6 +513,40 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    async def _process_sync_tasks(self, project_name, tasks, tasks_info):
+        """Wait for sync tasks and store their results in bulk.
+
+        Results of finished tasks are collected by 'SyncResultWriter' which
+        writes them to DB in batches, at least once per flush interval.
+
+        Args:
+            project_name (str): Project name.
+            tasks (list[asyncio.Task]): Running upload/download tasks.
+            tasks_info (dict[asyncio.Task, tuple]): File, representation
+                and site processed by task.
+        """
+        writer = SyncResultWriter(self.module, project_name)
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=writer.flush_interval,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                file, representation, site = tasks_info[task]
+                file_id = None
+                error = None
+                if task.cancelled():
+                    error = "Synchronization was cancelled"
+                elif task.exception() is not None:
+                    error = str(task.exception())
+                else:
+                    file_id = task.result()
+                writer.add(file_id, file, representation, site, error)
+            writer.flush_if_needed()
+        writer.flush()
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
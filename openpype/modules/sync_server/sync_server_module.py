@@ -8,6 +8,7 @@ import signal
 from collections import deque, defaultdict
 
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -37,6 +38,7 @@ from openpype.settings.constants import (
 
 from .providers.local_drive import LocalDriveHandler
 from .providers import lib
+from .sync_queue import SyncRepresentationsQueue
 
 from .utils import (
     time_function,
@@ -139,6 +141,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self._anatomies = {}
 
         self._connection = None
+        # incremental queues of representations to sync by project name
+        self._sync_queues = {}
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -1460,6 +1464,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             self.log.info("Stopping sync server server")
             self.sync_server_thread.is_running = False
             self.sync_server_thread.stop()
+            self._stop_sync_queues()
             self.log.info("Sync server stopped")
         except Exception:
             self.log.warning(
@@ -1686,7 +1691,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 representation_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1702,6 +1708,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (list): limit query only to these
+                representations, used for incremental updates of queue
 
         Returns:
             (list) of dictionaries
@@ -1751,6 +1759,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             ]
         }
 
+        if representation_ids is not None:
+            match["_id"] = {"$in": representation_ids}
+
         aggr = [
             {"$match": match},
             {'$unwind': '$files'},
@@ -1795,6 +1806,63 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         return representations
 
+    def get_sync_queue(self, project_name, active_site, remote_site):
+        """
+            Get incremental queue of representations to be synced.
+
+            Queue is created on first call and kept between sync loops,
+            new queue is created if sites of project changed. Queue is
+            seeded again if retries count or default priority changed.
+        Args:
+            project_name (string):
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+
+        Returns:
+            (SyncRepresentationsQueue)
+        """
+        sync_queue = self._sync_queues.get(project_name)
+        if sync_queue is not None and (
+            sync_queue.active_site != active_site
+            or sync_queue.remote_site != remote_site
+        ):
+            sync_queue.stop()
+            sync_queue = None
+
+        if sync_queue is None:
+            sync_queue = SyncRepresentationsQueue(
+                self, project_name, active_site, remote_site
+            )
+            self._sync_queues[project_name] = sync_queue
+        # Queue is seeded again when settings used in query changed
+        sync_queue.set_query_settings({
+            "retries": self._get_retries_arr(project_name),
+            "default_priority": self.DEFAULT_PRIORITY,
+        })
+        return sync_queue
+
+    def is_incremental_queue_enabled(self, project_name):
+        """
+            Incremental queue is used for project instead of full
+            aggregation of representations in each loop.
+        Returns:
+            (bool)
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        return bool(config.get("incremental_queue"))
+
+    def _mark_representations_changed(self, project_name,
+                                      representation_ids):
+        """Notify incremental queue of project about changed repres."""
+        sync_queue = self._sync_queues.get(project_name)
+        if sync_queue is not None:
+            sync_queue.mark_changed(representation_ids)
+
+    def _stop_sync_queues(self):
+        for sync_queue in self._sync_queues.values():
+            sync_queue.stop()
+        self._sync_queues = {}
+
     def check_status(self, file, local_site, remote_site, config_preset):
         """
             Check synchronization status for single 'file' of single
@@ -1907,10 +1975,94 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             upsert=True,
             array_filters=arr_filter
         )
+        self._mark_representations_changed(
+            project_name, [representation_id])
 
         if progress is not None or priority is not None:
             return
 
+        self._log_file_result(representation_id, file, new_file_id, error)
+
+    def update_db_bulk(self, project_name, results):
+        """
+            Store results of multiple file synchronizations at once.
+
+            Results are grouped by representation so each representation
+            is updated by single operation and all operations are sent to
+            DB in one 'bulk_write' call.
+
+        Args:
+            project_name (string): name of project
+            results (list): of tuples (new_file_id, file, representation,
+                site, error), same meaning as arguments of 'update_db'
+
+        Returns:
+            None
+        """
+        if not results:
+            return
+
+        updates_by_repre_id = {}
+        for new_file_id, file, representation, site, error in results:
+            representation_id = representation.get("_id")
+            repre_update = updates_by_repre_id.get(representation_id)
+            if repre_update is None:
+                repre_update = {
+                    "update": defaultdict(dict),
+                    "array_filters": [],
+                    "site_keys": {},
+                    "file_keys": {},
+                }
+                updates_by_repre_id[representation_id] = repre_update
+
+            site_keys = repre_update["site_keys"]
+            site_key = site_keys.get(site)
+            if site_key is None:
+                site_key = "s{}".format(len(site_keys))
+                site_keys[site] = site_key
+                repre_update["array_filters"].append(
+                    {"{}.name".format(site_key): site})
+
+            file_id = ObjectId(file["_id"])
+            file_keys = repre_update["file_keys"]
+            file_key = file_keys.get(file_id)
+            if file_key is None:
+                file_key = "f{}".format(len(file_keys))
+                file_keys[file_id] = file_key
+                repre_update["array_filters"].append(
+                    {"{}._id".format(file_key): file_id})
+
+            update = repre_update["update"]
+            if new_file_id:
+                update["$set"].update(self._get_success_dict(
+                    new_file_id, file_key, site_key))
+                # reset previous errors if any
+                update["$unset"].update(self._get_error_dict(
+                    "", "", "", file_key, site_key))
+            else:
+                tries = self._get_tries_count(file, site) + 1
+                update["$set"].update(self._get_error_dict(
+                    error, tries, file_key=file_key, site_key=site_key))
+
+            self._log_file_result(representation_id, file, new_file_id, error)
+
+        operations = [
+            UpdateOne(
+                {"_id": representation_id},
+                dict(repre_update["update"]),
+                array_filters=repre_update["array_filters"]
+            )
+            for representation_id, repre_update in (
+                updates_by_repre_id.items()
+            )
+        ]
+        self.connection.database[project_name].bulk_write(
+            operations, ordered=False
+        )
+        self._mark_representations_changed(
+            project_name, list(updates_by_repre_id.keys()))
+
+    def _log_file_result(self, representation_id, file, new_file_id, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -2042,6 +2194,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             self._add_site(project_name, representation, elem, site_name,
                            force=force)
 
+        self._mark_representations_changed(
+            project_name, [representation["_id"]])
+
     def _update_site(self, project_name, representation_id,
                      update, arr_filter):
         """
@@ -2302,7 +2457,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self.enabled = no_errors
         self.widget.show()
 
-    def _get_success_dict(self, new_file_id):
+    def _get_success_dict(self, new_file_id, file_key="f", site_key="s"):
         """
             Provide success metadata ("id", "created_dt") to be stored in Db.
             Used in $set: "DICT" part of query.
@@ -2310,27 +2465,34 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             file and site are needed for upgrade in DB.
         Args:
             new_file_id: id of created file
+            file_key (str): identifier of file in array filters
+            site_key (str): identifier of site in array filters
         Returns:
             (dictionary)
         """
-        val = {"files.$[f].sites.$[s].id": new_file_id,
-               "files.$[f].sites.$[s].created_dt": datetime.now()}
+        prefix = "files.$[{}].sites.$[{}]".format(file_key, site_key)
+        val = {"{}.id".format(prefix): new_file_id,
+               "{}.created_dt".format(prefix): datetime.now()}
         return val
 
-    def _get_error_dict(self, error="", tries="", progress=""):
+    def _get_error_dict(self, error="", tries="", progress="",
+                        file_key="f", site_key="s"):
         """
             Provide error metadata to be stored in Db.
             Used for set (error and tries provided) or unset mode.
         Args:
             error: (string) - message
             tries: how many times failed
+            file_key (str): identifier of file in array filters
+            site_key (str): identifier of site in array filters
         Returns:
             (dictionary)
         """
-        val = {"files.$[f].sites.$[s].last_failed_dt": datetime.now(),
-               "files.$[f].sites.$[s].error": error,
-               "files.$[f].sites.$[s].tries": tries,
-               "files.$[f].sites.$[s].progress": progress
+        prefix = "files.$[{}].sites.$[{}]".format(file_key, site_key)
+        val = {"{}.last_failed_dt".format(prefix): datetime.now(),
+               "{}.error".format(prefix): error,
+               "{}.tries".format(prefix): tries,
+               "{}.progress".format(prefix): progress
                }
         return val
 
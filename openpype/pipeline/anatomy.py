@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import platform
+import threading
 import collections
 import numbers
 
@@ -418,12 +419,29 @@ class CacheItem:
 
 
 class Anatomy(BaseAnatomy):
+    """Anatomy of a project with cached data.
+
+    Anatomy data, templates and roots are shared between all Anatomy objects
+    created for the same project and root overrides of the site. The shared
+    snapshot is created again only when project document changes. Project
+    document is re-fetched from database when its cache expires and is
+    compared to cached document to detect the change.
+
+    Shared data are not modified by Anatomy, site root overrides are applied
+    on a copy of project data. Each Anatomy object has own templates and roots
+    objects, solved templates are copied from the snapshot on first use so
+    changes made on one object don't affect other objects.
+    """
+
     _sync_server_addon_cache = CacheItem()
     _project_cache = collections.defaultdict(CacheItem)
+    _project_versions = collections.defaultdict(int)
     _default_site_id_cache = collections.defaultdict(CacheItem)
     _root_overrides_cache = collections.defaultdict(
         lambda: collections.defaultdict(CacheItem)
     )
+    _snapshots_cache = {}
+    _snapshots_lock = threading.Lock()
 
     def __init__(self, project_name=None, site_name=None):
         if not project_name:
@@ -435,22 +453,95 @@ class Anatomy(BaseAnatomy):
                 " to load data for specific project."
             ))
 
-        project_doc = self.get_project_doc_from_cache(project_name)
         root_overrides = self._get_site_root_overrides(project_name, site_name)
-
-        super(Anatomy, self).__init__(project_doc, root_overrides)
+        snapshot = self._get_anatomy_snapshot(project_name, root_overrides)
+
+        self.project_name = snapshot.project_name
+        self.project_code = snapshot.project_code
+        # Anatomy data are accessible only as copies
+        self._data = snapshot._data
+        self._templates_obj = AnatomyTemplates(
+            self, snapshot._templates_obj
+        )
+        self._roots_obj = Roots(self)
 
     @classmethod
     def get_project_doc_from_cache(cls, project_name):
+        project_doc, _ = cls._get_cached_project_doc(project_name)
+        return copy.deepcopy(project_doc)
+
+    @classmethod
+    def clear_cache(cls, project_name=None):
+        """Clear cached project documents and anatomy snapshots.
+
+        Args:
+            project_name (Optional[str]): Clear cache only of the project.
+        """
+
+        with cls._snapshots_lock:
+            if project_name is None:
+                cls._project_cache.clear()
+                cls._snapshots_cache.clear()
+            else:
+                cls._project_cache.pop(project_name, None)
+                cls._snapshots_cache.pop(project_name, None)
+
+    @classmethod
+    def _get_cached_project_doc(cls, project_name):
+        """Cached project document with its version.
+
+        Version is increased each time re-fetched project document differs
+        from cached document.
+
+        Returns:
+            tuple[dict[str, Any], int]: Project document which must not be
+                modified and its version.
+        """
+
         project_cache = cls._project_cache[project_name]
         if project_cache.is_outdated:
-            project_cache.update_data(get_project(project_name))
-        return copy.deepcopy(project_cache.data)
+            project_doc = get_project(project_name)
+            if project_doc != project_cache.data:
+                cls._project_versions[project_name] += 1
+            project_cache.update_data(project_doc)
+        return project_cache.data, cls._project_versions[project_name]
+
+    @classmethod
+    def _get_anatomy_snapshot(cls, project_name, root_overrides):
+        """Shared anatomy for project document version and root overrides.
+
+        Args:
+            project_name (str): Project name.
+            root_overrides (Union[dict[str, str], None]): Root overrides of
+                site.
+
+        Returns:
+            BaseAnatomy: Anatomy which data must not be modified.
+        """
+
+        project_doc, version = cls._get_cached_project_doc(project_name)
+        overrides_key = None
+        if root_overrides:
+            overrides_key = tuple(sorted(root_overrides.items()))
+
+        with cls._snapshots_lock:
+            cached_version, snapshots = cls._snapshots_cache.get(
+                project_name, (None, {}))
+            if cached_version != version:
+                snapshots = {}
+                cls._snapshots_cache[project_name] = (version, snapshots)
+            snapshot = snapshots.get(overrides_key)
+
+        if snapshot is None:
+            snapshot = BaseAnatomy(project_doc, root_overrides)
+            with cls._snapshots_lock:
+                snapshots.setdefault(overrides_key, snapshot)
+        return snapshot
 
     @classmethod
     def get_sync_server_addon(cls):
         if cls._sync_server_addon_cache.is_outdated:
-            manager = ModulesManager()
+            manager = ModulesManager(addon_names=["sync_server"])
             cls._sync_server_addon_cache.update_data(
                 manager.get_enabled_module("sync_server")
             )
@@ -645,10 +736,12 @@ class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
     inner_key_name_pattern = re.compile(r"\{@(.*?[^{}0]*)\}")
 
-    def __init__(self, anatomy):
+    def __init__(self, anatomy, shared_templates_obj=None):
         super(AnatomyTemplates, self).__init__()
         self.anatomy = anatomy
         self.loaded_project = None
+        # Templates object of shared anatomy with the same templates
+        self._shared_templates_obj = shared_templates_obj
 
     def reset(self):
         self._raw_templates = None
@@ -744,7 +837,19 @@ class AnatomyTemplates(TemplatesDict):
                 " Trying to use default."
             ).format(self.project_name))
 
-        self.set_templates(self.anatomy["templates"])
+        shared_templates_obj = self._shared_templates_obj
+        if shared_templates_obj is None:
+            self.set_templates(self.anatomy["templates"])
+            return
+
+        # Solved templates are copied, template objects must be created
+        #   again to be connected to this object
+        templates = copy.deepcopy(shared_templates_obj.templates)
+        self._raw_templates = copy.deepcopy(
+            shared_templates_obj._raw_templates
+        )
+        self._templates = templates
+        self._objected_templates = self.create_objected_templates(templates)
 
     @classmethod
     def replace_inner_keys(cls, matches, value, key_values, key):
@@ -1,10 +1,13 @@
 import re
 import os
 import json
+import atexit
 import contextlib
 import functools
 import platform
 import tempfile
+import threading
+import subprocess
 import warnings
 from copy import deepcopy
 
@@ -13,6 +16,9 @@ from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -420,10 +426,130 @@ def get_data_subprocess(config_path, data_type):
     )
 
 
+class _OCIOWrapperServer:
+    """Long-lived process of ocio wrapper answering requests over pipes.
+
+    Process is started on first request and is reused by all following
+    requests, so process startup is paid only once per session. Parsed
+    configs are cached in the process by path and modification time.
+
+    Process ends when stdin is closed, which happens at exit of current
+    process at the latest.
+    """
+    enabled = os.environ.get("OPENPYPE_OCIO_WRAPPER_SERVER") != "0"
+    # Must match 'SERVER_RESPONSE_PREFIX' in ocio wrapper script
+    response_prefix = "ocio_wrapper_response:"
+
+    _process = None
+    _request_id = 0
+    _lock = threading.Lock()
+    _failed = False
+
+    @classmethod
+    def request(cls, command_group, command, kwargs):
+        """Send request to the process and wait for result.
+
+        Raises:
+            RuntimeError: Process is not available or request failed.
+        """
+        with cls._lock:
+            if cls._failed:
+                raise RuntimeError("OCIO wrapper server is not available")
+
+            process = cls._get_process()
+            cls._request_id += 1
+            request_id = cls._request_id
+            request = json.dumps({
+                "id": request_id,
+                "command_group": command_group,
+                "command": command,
+                "kwargs": kwargs,
+            })
+            try:
+                process.stdin.write(request + "\n")
+                process.stdin.flush()
+                response = cls._read_response(process, request_id)
+
+            except (IOError, OSError, RuntimeError):
+                cls._stop_process()
+                cls._failed = True
+                raise RuntimeError("OCIO wrapper server crashed")
+
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    @classmethod
+    def _read_response(cls, process, request_id):
+        prefix = cls.response_prefix
+        while True:
+            line = process.stdout.readline()
+            if not line:
+                raise RuntimeError("OCIO wrapper server ended")
+
+            if not line.startswith(prefix):
+                continue
+
+            response = json.loads(line[len(prefix):])
+            if response["id"] == request_id:
+                return response
+
+    @classmethod
+    def _get_process(cls):
+        if cls._process is not None and cls._process.poll() is None:
+            return cls._process
+
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "server"
+        )
+        env = clean_envs_for_openpype_process(os.environ)
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+
+        log.info("Starting OCIO wrapper server: {}".format(" ".join(args)))
+        cls._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={str(k): str(v) for k, v in env.items()},
+            universal_newlines=True,
+            **kwargs
+        )
+        return cls._process
+
+    @classmethod
+    def _stop_process(cls):
+        process = cls._process
+        cls._process = None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait()
+        except (IOError, OSError):
+            process.kill()
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            cls._stop_process()
+
+
+atexit.register(_OCIOWrapperServer.stop)
+
+
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Requests are processed by long-lived
+    process of ocio wrapper and single-use process is used only when the
+    long-lived process is not available or the request failed.
 
     Args:
         command_group (str): command group name
@@ -433,6 +559,16 @@ def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     Returns:
         Any[dict, None]: data
     """
+    if _OCIOWrapperServer.enabled:
+        try:
+            return _OCIOWrapperServer.request(
+                command_group, command, kwargs
+            )
+        except RuntimeError as exc:
+            log.debug(
+                "OCIO wrapper server request failed: {}".format(exc)
+            )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
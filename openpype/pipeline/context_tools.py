@@ -22,7 +22,7 @@ from openpype.client import (
     get_ayon_server_api_connection,
 )
 from openpype.lib.events import emit_event
-from openpype.modules import load_modules, ModulesManager
+from openpype.modules import load_modules, get_modules_manager
 from openpype.settings import get_project_settings
 from openpype.tests.lib import is_in_tests
 
@@ -75,7 +75,7 @@ def _get_modules_manager():
 
     global _modules_manager
     if _modules_manager is None:
-        _modules_manager = ModulesManager()
+        _modules_manager = get_modules_manager()
     return _modules_manager
 
 
@@ -1,7 +1,7 @@
 import os
 
 from openpype.settings import get_project_settings
-from openpype.lib import filter_profiles, prepare_template_data
+from openpype.lib import get_compiled_profiles, prepare_template_data
 from openpype.pipeline import legacy_io
 
 from .constants import DEFAULT_SUBSET_TEMPLATE
@@ -57,7 +57,8 @@ def get_subset_name_template(
         "task_types": task_type
     }
 
-    matching_profile = filter_profiles(profiles, filtering_criteria)
+    matching_profile = get_compiled_profiles(profiles).filter(
+        filtering_criteria)
     template = None
     if matching_profile:
         template = matching_profile["template"]
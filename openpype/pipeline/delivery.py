@@ -1,30 +1,325 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
+import time
 import shutil
 import glob
-import clique
+import threading
 import collections
 
+import clique
+from six.moves import queue
+
 from openpype.lib import create_hard_link
 
+# 'FICLONE' ioctl request creating reflink (copy-on-write clone) on Linux
+_FICLONE = 0x40049409
+
+
+def _reflink_file(src_path, dst_path):
+    """Create copy-on-write clone of file (Btrfs, XFS, ...).
+
+    Raises:
+        OSError: Reflink is not supported by filesystem or platform.
+    """
+
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("Reflink is not supported on this platform")
+
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            try:
+                fcntl.ioctl(dst_stream.fileno(), _FICLONE, src_stream.fileno())
+            except (IOError, OSError):
+                dst_stream.close()
+                os.remove(dst_path)
+                raise
+
+
+def _copy_file_range(src_path, dst_path):
+    """Copy file content in kernel without passing it through python.
+
+    Raises:
+        OSError: 'copy_file_range' is not available or did not copy whole
+            file.
+    """
+
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("'copy_file_range' is not available")
+
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            remaining = os.fstat(src_fd).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+
+                # Some filesystems (FUSE, NFS, ...) report end of file
+                #   before whole content is copied
+                if remaining > 0:
+                    raise OSError(
+                        "'copy_file_range' stopped with {} bytes"
+                        " remaining".format(remaining)
+                    )
+            except OSError:
+                dst_stream.close()
+                os.remove(dst_path)
+                raise
+    shutil.copymode(src_path, dst_path)
+
 
 def _copy_file(src_path, dst_path):
     """Hardlink file if possible(to save space), copy if not.
 
     Because of using hardlinks should not be function used in other parts
     of pipeline.
+
+    Fast paths are tried in order hardlink, reflink and 'copy_file_range'.
+    Regular copy is used if none of them is possible.
+
+    Returns:
+        str: Used method "exists", "hardlink", "reflink",
+            "copy_file_range" or "copy".
     """
 
     if os.path.exists(dst_path):
-        return
+        return "exists"
     try:
         create_hard_link(
             src_path,
             dst_path
         )
-    except OSError:
-        shutil.copyfile(src_path, dst_path)
+        return "hardlink"
+    except (OSError, NotImplementedError):
+        pass
+
+    for method, func in (
+        ("reflink", _reflink_file),
+        ("copy_file_range", _copy_file_range),
+    ):
+        try:
+            func(src_path, dst_path)
+            return method
+        except (IOError, OSError):
+            pass
+
+    shutil.copyfile(src_path, dst_path)
+    return "copy"
+
+
+class DeliveryBatch(object):
+    """Plan deliveries of files and execute them in parallel.
+
+    All deliveries are planned first. Destination paths are calculated
+    once per file or once per sequence. Deliveries to the same destination
+    are processed only once. Files are copied by a bounded pool of threads
+    and result of each file is returned.
+
+    Args:
+        log (logging.Logger): Logger used for debug messages.
+        workers (Optional[int]): Number of threads copying files.
+    """
+
+    default_workers = 8
+
+    def __init__(self, log, workers=None):
+        if not workers:
+            workers = self.default_workers
+        self.log = log
+        self._workers = workers
+        self._src_by_dst = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._src_by_dst)
+
+    def add(self, src_path, dst_path, report_items):
+        """Add single file delivery to batch.
+
+        Args:
+            src_path (str): Source path.
+            dst_path (str): Destination path.
+            report_items (collections.defaultdict): To return error messages.
+
+        Returns:
+            bool: Delivery was added. False if the same destination is
+                already planned.
+        """
+
+        key = os.path.normcase(os.path.normpath(dst_path))
+        planned_src = self._src_by_dst.get(key)
+        if planned_src is None:
+            self._src_by_dst[key] = (src_path, dst_path)
+            return True
+
+        if (
+            os.path.normcase(os.path.normpath(planned_src[0]))
+            != os.path.normcase(os.path.normpath(src_path))
+        ):
+            msg = "Multiple files are delivered to the same path"
+            report_items[msg].append("{} -> {}".format(src_path, dst_path))
+            self.log.warning("{} <{}>".format(msg, dst_path))
+        return False
+
+    def add_single_file(
+        self,
+        src_path,
+        repre,
+        anatomy,
+        template_name,
+        anatomy_data,
+        format_dict,
+        report_items
+    ):
+        """Plan delivery of single file.
+
+        Arguments are same as for 'deliver_single_file'.
+
+        Returns:
+            int: Number of planned files.
+        """
+
+        return _deliver_single_file(
+            self,
+            src_path,
+            repre,
+            anatomy,
+            template_name,
+            anatomy_data,
+            format_dict,
+            report_items,
+            self.log
+        )
+
+    def add_sequence(
+        self,
+        src_path,
+        repre,
+        anatomy,
+        template_name,
+        anatomy_data,
+        format_dict,
+        report_items,
+        has_renumbered_frame=False,
+        new_frame_start=0
+    ):
+        """Plan delivery of sequence.
+
+        Arguments are same as for 'deliver_sequence'.
+
+        Returns:
+            int: Number of planned files.
+        """
+
+        return _deliver_sequence(
+            self,
+            src_path,
+            repre,
+            anatomy,
+            template_name,
+            anatomy_data,
+            format_dict,
+            report_items,
+            self.log,
+            has_renumbered_frame,
+            new_frame_start
+        )
+
+    def process(self, report_items, progress_callback=None):
+        """Copy all planned files.
+
+        Callback is called in thread which called this method.
+
+        Args:
+            report_items (collections.defaultdict): To return error messages.
+            progress_callback (Optional[Callable[[dict[str, Any]], None]]):
+                Called with result of each processed file.
+
+        Returns:
+            list[dict[str, Any]]: Result of each file with "src", "dst",
+                "method", "size", "duration" and "error" keys.
+        """
+
+        items = collections.deque(self._src_by_dst.values())
+        self._src_by_dst = collections.OrderedDict()
+        if not items:
+            return []
+
+        expected = len(items)
+        results_queue = queue.Queue()
+        lock = threading.Lock()
+        created_dirs = set()
+
+        def _worker():
+            while True:
+                with lock:
+                    if not items:
+                        return
+                    src_path, dst_path = items.popleft()
+                results_queue.put(
+                    self._process_item(src_path, dst_path, created_dirs)
+                )
+
+        threads = []
+        for _ in range(min(self._workers, len(items))):
+            thread = threading.Thread(target=_worker)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        results = []
+        while len(results) < expected:
+            result = results_queue.get()
+            results.append(result)
+            if result["error"]:
+                msg = "Failed to deliver file"
+                report_items[msg].append("{} -> {}: {}".format(
+                    result["src"], result["dst"], result["error"]
+                ))
+            if progress_callback is not None:
+                progress_callback(result)
+
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _process_item(self, src_path, dst_path, created_dirs):
+        start = time.time()
+        result = {
+            "src": src_path,
+            "dst": dst_path,
+            "method": None,
+            "size": None,
+            "duration": None,
+            "error": None,
+        }
+        try:
+            dst_dir = os.path.dirname(dst_path)
+            if dst_dir not in created_dirs:
+                if not os.path.exists(dst_dir):
+                    try:
+                        os.makedirs(dst_dir)
+                    except OSError:
+                        # Created by other thread
+                        if not os.path.isdir(dst_dir):
+                            raise
+                created_dirs.add(dst_dir)
+
+            self.log.debug("Copying single: {} -> {}".format(
+                src_path, dst_path))
+            result["method"] = _copy_file(src_path, dst_path)
+            result["size"] = os.path.getsize(dst_path)
+
+        except Exception as exc:
+            result["error"] = str(exc)
+        result["duration"] = time.time() - start
+        return result
 
 
 def get_format_dict(anatomy, location_path):
@@ -139,13 +434,39 @@ def deliver_single_file(
         (collections.defaultdict, int)
     """
 
+    batch = DeliveryBatch(log)
+    batch.add_single_file(
+        src_path,
+        repre,
+        anatomy,
+        template_name,
+        anatomy_data,
+        format_dict,
+        report_items
+    )
+    results = batch.process(report_items)
+    uploaded = len([result for result in results if not result["error"]])
+    return report_items, uploaded
+
+
+def _deliver_single_file(
+    batch,
+    src_path,
+    repre,
+    anatomy,
+    template_name,
+    anatomy_data,
+    format_dict,
+    report_items,
+    log
+):
     # Make sure path is valid for all platforms
     src_path = os.path.normpath(src_path.replace("\\", "/"))
 
     if not os.path.exists(src_path):
         msg = "{} doesn't exist for {}".format(src_path, repre["_id"])
         report_items["Source file was not found"].append(msg)
-        return report_items, 0
+        return 0
 
     if format_dict:
         anatomy_data = copy.deepcopy(anatomy_data)
@@ -160,14 +481,9 @@ def deliver_single_file(
     # Remove newlines from the end of the string to avoid OSError during copy
     delivery_path = delivery_path.rstrip()
 
-    delivery_folder = os.path.dirname(delivery_path)
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
-    log.debug("Copying single: {} -> {}".format(src_path, delivery_path))
-    _copy_file(src_path, delivery_path)
-
-    return report_items, 1
+    if batch.add(src_path, delivery_path, report_items):
+        return 1
+    return 0
 
 
 def deliver_sequence(
@@ -205,6 +521,38 @@ def deliver_sequence(
         (collections.defaultdict, int)
     """
 
+    batch = DeliveryBatch(log)
+    planned = batch.add_sequence(
+        src_path,
+        repre,
+        anatomy,
+        template_name,
+        anatomy_data,
+        format_dict,
+        report_items,
+        has_renumbered_frame,
+        new_frame_start
+    )
+    if not planned:
+        return report_items, 0
+    results = batch.process(report_items)
+    uploaded = len([result for result in results if not result["error"]])
+    return report_items, uploaded
+
+
+def _deliver_sequence(
+    batch,
+    src_path,
+    repre,
+    anatomy,
+    template_name,
+    anatomy_data,
+    format_dict,
+    report_items,
+    log,
+    has_renumbered_frame,
+    new_frame_start
+):
     src_path = os.path.normpath(src_path.replace("\\", "/"))
 
     def hash_path_exist(myPath):
@@ -218,7 +566,7 @@ def deliver_sequence(
         msg = "{} doesn't exist for {}".format(
             src_path, repre["_id"])
         report_items["Source file was not found"].append(msg)
-        return report_items, 0
+        return 0
 
     delivery_templates = anatomy.templates.get("delivery") or {}
     delivery_template = delivery_templates.get(template_name)
@@ -228,7 +576,7 @@ def deliver_sequence(
             " was not found"
         ).format(template_name, anatomy.project_name)
         report_items[""].append(msg)
-        return report_items, 0
+        return 0
 
     # Check if 'frame' key is available in template which is required
     #   for sequence delivery
@@ -239,7 +587,7 @@ def deliver_sequence(
             " can't be processed."
         ).format(template_name, anatomy.project_name)
         report_items[""].append(msg)
-        return report_items, 0
+        return 0
 
     dir_path, file_name = os.path.split(str(src_path))
 
@@ -250,7 +598,7 @@ def deliver_sequence(
         msg = "Source extension not found, cannot find collection"
         report_items[msg].append(src_path)
         log.warning("{} <{}>".format(msg, context))
-        return report_items, 0
+        return 0
 
     ext = "." + ext
     # context.representation could be .psd
@@ -269,7 +617,7 @@ def deliver_sequence(
         msg = "Source collection of files was not found"
         report_items[msg].append(src_path)
         log.warning("{} <{}>".format(msg, src_path))
-        return report_items, 0
+        return 0
 
     frame_indicator = "@####@"
 
@@ -281,7 +629,6 @@ def deliver_sequence(
     delivery_path = template_obj.format_strict(anatomy_data)
 
     delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
-    delivery_folder = os.path.dirname(delivery_path)
     dst_head, dst_tail = delivery_path.split(frame_indicator)
     dst_padding = src_collection.padding
     dst_collection = clique.Collection(
@@ -290,12 +637,9 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
     src_head = src_collection.head
     src_tail = src_collection.tail
-    uploaded = 0
+    planned = []
     first_frame = min(src_collection.indexes)
     for index in src_collection.indexes:
         src_padding = src_collection.format("{padding}") % index
@@ -314,12 +658,13 @@ def deliver_sequence(
                 msg = "Renumber frame has a smaller number than original frame"     # noqa
                 report_items[msg].append(src_file_name)
                 log.warning("{} <{}>".format(msg, context))
-                return report_items, 0
+                return 0
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
-        log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
-
-        uploaded += 1
+        planned.append((src, dst))
 
-    return report_items, uploaded
+    uploaded = 0
+    for src, dst in planned:
+        if batch.add(src, dst, report_items):
+            uploaded += 1
+    return uploaded
@@ -1,4 +1,5 @@
 import os
+import copy
 import inspect
 import traceback
 
@@ -10,6 +11,51 @@ from openpype.lib.python_module_tools import (
 
 log = Logger.get_logger(__name__)
 
+# Values of these types are copied to class attributes snapshot so
+#   in-place changes are reverted too
+_MUTABLE_TYPES = (list, dict, set)
+
+
+def _copy_attribute_value(value):
+    """Copy mutable value of class attribute.
+
+    Returns:
+        tuple[Any, bool]: Value and if the value is a copy.
+    """
+
+    if isinstance(value, _MUTABLE_TYPES):
+        try:
+            return copy.deepcopy(value), True
+        except Exception:
+            pass
+    return value, False
+
+
+def _get_class_attributes(cls):
+    return {
+        key: _copy_attribute_value(value)
+        for key, value in cls.__dict__.items()
+    }
+
+
+def _restore_class_attributes(cls, attributes):
+    """Revert changes of class attributes made after snapshot.
+
+    Discovered classes are modified by settings (e.g. 'apply_settings'),
+    the cached classes would keep values from previous discover otherwise.
+    """
+
+    for key in tuple(cls.__dict__.keys()):
+        if key not in attributes:
+            delattr(cls, key)
+
+    for key, (value, is_copy) in attributes.items():
+        if is_copy:
+            value = copy.deepcopy(value)
+        elif cls.__dict__.get(key) is value:
+            continue
+        setattr(cls, key, value)
+
 
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
@@ -100,17 +146,76 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Imported modules and their classes are cached by
+    file path, modification time and size so only changed files are
+    imported again and discover calls return the same class objects for
+    unchanged files. Attributes of cached classes are restored to values
+    they had after import so changes made by settings of previous discover
+    are not kept. Use 'invalidate_cache' to force re-import of files.
+
+    Args:
+        use_cache (Optional[bool]): Cache imported modules between discover
+            calls.
     """
 
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self._registered_plugins = {}
         self._registered_plugin_paths = {}
         self._last_discovered_plugins = {}
         # Store the last result to memory
         self._last_discovered_results = {}
 
+        self._use_cache = use_cache
+        # Imported modules by filepath
+        self._modules_cache = {}
+        # Classes of module with their attributes by superclass and filepath
+        self._classes_cache = {}
+
+    def invalidate_cache(self, path=None):
+        """Invalidate cache of imported modules.
+
+        Args:
+            path (Optional[str]): Invalidate only cache of the file or of
+                files in the directory. Whole cache is invalidated if not
+                passed.
+        """
+
+        if path is None:
+            self._modules_cache.clear()
+            self._classes_cache.clear()
+            return
+
+        path = os.path.normpath(path)
+        for filepath in tuple(self._modules_cache.keys()):
+            if (
+                filepath == path
+                or os.path.dirname(filepath) == path
+            ):
+                self._modules_cache.pop(filepath)
+
+        for key in tuple(self._classes_cache.keys()):
+            if key[1] not in self._modules_cache:
+                self._classes_cache.pop(key)
+
+    def _get_module_classes(self, superclass, filepath, module):
+        if not self._use_cache:
+            return classes_from_module(superclass, module)
+
+        key = (superclass, filepath)
+        cached = self._classes_cache.get(key)
+        if cached is not None and cached[0] is module:
+            classes_with_attributes = cached[1]
+            for cls, attributes in classes_with_attributes:
+                _restore_class_attributes(cls, attributes)
+            return [cls for cls, _ in classes_with_attributes]
+
+        classes = classes_from_module(superclass, module)
+        self._classes_cache[key] = (
+            module,
+            [(cls, _get_class_attributes(cls)) for cls in classes]
+        )
+        return classes
+
     def get_last_discovered_plugins(self, superclass):
         """Access last discovered plugin by a subperclass.
 
@@ -167,8 +272,12 @@ class PluginDiscoverContext(object):
             result.plugins.append(cls)
 
         # Include plug-ins from registered paths
+        modules_cache = None
+        if self._use_cache:
+            modules_cache = self._modules_cache
+
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = modules_from_path(path, modules_cache)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -176,7 +285,10 @@ class PluginDiscoverContext(object):
             for item in modules:
                 filepath, module = item
                 result.add_module(module)
-                for cls in classes_from_module(superclass, module):
+                classes = self._get_module_classes(
+                    superclass, filepath, module
+                )
+                for cls in classes:
                     if cls is superclass or cls in ignore_classes:
                         result.ignored_plugins.add(cls)
                         continue
@@ -299,6 +411,18 @@ def discover(
     )
 
 
+def invalidate_discover_cache(path=None):
+    """Invalidate cache of modules imported by discover.
+
+    Args:
+        path (Optional[str]): Invalidate only cache of the file or of
+            files in the directory. Whole cache is invalidated if not passed.
+    """
+
+    context = _GlobalDiscover.get_context()
+    context.invalidate_cache(path)
+
+
 def get_last_discovered_plugins(superclass):
     context = _GlobalDiscover.get_context()
     return context.get_last_discovered_plugins(superclass)
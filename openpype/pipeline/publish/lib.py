@@ -13,6 +13,7 @@ from openpype.lib import (
     Logger,
     import_filepath,
     filter_profiles,
+    get_compiled_profiles,
     is_func_signature_supported,
 )
 from openpype.settings import (
@@ -154,7 +155,8 @@ def get_publish_template_name(
         )
         default_template = DEFAULT_PUBLISH_TEMPLATE
 
-    profile = filter_profiles(profiles, filter_criteria, logger=logger)
+    profile = get_compiled_profiles(profiles).filter(
+        filter_criteria, logger=logger)
     if profile:
         template = profile["template_name"]
     return template or default_template
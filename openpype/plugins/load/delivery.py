@@ -17,8 +17,7 @@ from openpype.pipeline.load import get_representation_path_with_anatomy
 from openpype.pipeline.delivery import (
     get_format_dict,
     check_destination_path,
-    deliver_single_file,
-    deliver_sequence,
+    DeliveryBatch,
 )
 
 
@@ -193,6 +192,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        batch = DeliveryBatch(self.log)
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -219,8 +219,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 template_name,
                 anatomy_data,
                 format_dict,
-                report_items,
-                self.log
+                report_items
             ]
 
             if repre.get("files"):
@@ -256,20 +255,20 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
                     if frame is not None:
                         anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
-                    report_items.update(new_report_items)
-                    self._update_progress(uploaded)
+                    batch.add_single_file(*args)
             else:  # fallback for Pype2 and representations without files
                 frame = repre['context'].get('frame')
                 if frame:
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
                 if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    batch.add_single_file(*args)
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
-                report_items.update(new_report_items)
-                self._update_progress(uploaded)
+                    batch.add_sequence(*args)
+
+        # Progress is based on count of planned files
+        self.files_selected = len(batch) or 1
+        batch.process(report_items, self._on_file_delivered)
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -349,6 +348,10 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
+    def _on_file_delivered(self, result):
+        self._update_progress(1)
+        QtWidgets.QApplication.processEvents()
+
     def _update_progress(self, uploaded):
         """Update progress bar after each repre copied."""
         self.currently_uploaded += uploaded
@@ -1,5 +1,9 @@
 import os
 import copy
+import collections
+import threading
+import multiprocessing
+
 import clique
 import pyblish.api
 
@@ -50,6 +54,12 @@ class ExtractOIIOTranscode(publish.Extractor):
     'colorspace' denotes target colorspace to be transcoded into. Could be
     empty if transcoding should be only into display and viewer colorspace.
     (In that case both 'display' and 'view' must be filled.)
+
+    Frame sequences are split into chunks of frames which are transcoded by
+    'workers' parallel oiiotool processes (1 by default). Value 0 of
+    'workers' uses all available cores, threads of each oiiotool process
+    are limited so the processes together don't use more cores than
+    available.
     """
 
     label = "Transcode color spaces"
@@ -63,6 +73,8 @@ class ExtractOIIOTranscode(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    workers = 1
+    frames_per_task = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -141,9 +153,16 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
-                files_to_convert = self._translate_to_sequence(
-                    files_to_convert)
-                for file_name in files_to_convert:
+                workers_count = self._get_workers_count()
+                convert_tasks = self._get_convert_tasks(
+                    files_to_convert, workers_count)
+                workers_count = min(workers_count, len(convert_tasks))
+                threads = None
+                if workers_count > 1:
+                    threads = max(
+                        1, multiprocessing.cpu_count() // workers_count)
+
+                def _convert(file_name):
                     input_path = os.path.join(original_staging_dir,
                                               file_name)
                     output_path = self._get_output_file_path(input_path,
@@ -158,9 +177,13 @@ class ExtractOIIOTranscode(publish.Extractor):
                         view,
                         display,
                         additional_command_args,
-                        self.log
+                        self.log,
+                        threads=threads
                     )
 
+                self._run_convert_tasks(
+                    convert_tasks, _convert, workers_count, output_name)
+
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
                     transcoded_file_path = os.path.join(new_staging_dir,
@@ -264,38 +287,123 @@ class ExtractOIIOTranscode(publish.Extractor):
             renamed_files.append(file_name)
         new_repre["files"] = renamed_files
 
-    def _translate_to_sequence(self, files_to_convert):
-        """Returns original list or list with filename formatted in single
-        sequence format.
+    def _get_workers_count(self):
+        """Count of parallel oiiotool processes capped by available cores."""
+        cpu_count = multiprocessing.cpu_count()
+        if not self.workers or self.workers < 1:
+            return cpu_count
+        return min(self.workers, cpu_count)
+
+    def _get_convert_tasks(self, files_to_convert, workers_count):
+        """Split files to convert into tasks for parallel processing.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
-        If sequence not found, it returns original list
+        Frame sequence is split into chunks of consecutive frames in format
+        of oiiotool sequence (FRAMESTART-FRAMEEND#). Chunk size is defined by
+        'frames_per_task' or frames are split evenly between workers.
+        Files which are not part of a sequence are converted one by one.
 
         Args:
-            files_to_convert (list): list of file names
+            files_to_convert (list[str]): List of file names.
+            workers_count (int): Count of parallel workers.
+
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            list[tuple[str, int]]: File names with count of frames.
         """
         pattern = [clique.PATTERNS["frames"]]
-        collections, remainder = clique.assemble(
+        collections_, remainder = clique.assemble(
             files_to_convert, patterns=pattern,
             assume_padded_when_ambiguous=True)
 
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
+        if len(collections_) > 1:
+            raise ValueError(
+                "Too many collections {}".format(collections_))
+
+        tasks = [(file_name, 1) for file_name in remainder]
+        if not collections_:
+            return tasks
+
+        collection = collections_[0]
+        frames = sorted(collection.indexes)
+        chunk_size = self.frames_per_task
+        if not chunk_size or chunk_size < 1:
+            chunk_size = -(-len(frames) // workers_count)
+
+        # Consecutive frames of sequence with holes are split too
+        chunks = []
+        for frame in frames:
+            if (
+                chunks
+                and chunks[-1][-1] + 1 == frame
+                and len(chunks[-1]) < chunk_size
+            ):
+                chunks[-1].append(frame)
+            else:
+                chunks.append([frame])
+
+        for chunk in chunks:
+            file_name = "{}{}-{}#{}".format(
+                collection.head, chunk[0], chunk[-1], collection.tail)
+            tasks.append((file_name, len(chunk)))
+        return tasks
+
+    def _run_convert_tasks(self, tasks, convert_func, workers_count,
+                           output_name):
+        """Run conversion tasks in parallel threads.
+
+        Each task runs oiiotool subprocess so threads are enough to run
+        conversions in parallel. Remaining tasks are skipped when any task
+        fails and the first error is raised.
 
-        return files_to_convert
+        Args:
+            tasks (list[tuple[str, int]]): File names with frames count.
+            convert_func (Callable[[str], None]): Convert single task.
+            workers_count (int): Count of parallel workers.
+            output_name (str): Name of output definition for progress logs.
+        """
+        frames_total = sum(frames_count for _, frames_count in tasks)
+        self.log.debug((
+            "Transcoding {} frames of output '{}' in {} tasks"
+            " using {} workers."
+        ).format(frames_total, output_name, len(tasks), workers_count))
+
+        queue = collections.deque(tasks)
+        lock = threading.Lock()
+        progress = {"frames": 0}
+        errors = []
+
+        def _worker():
+            while not errors:
+                try:
+                    file_name, frames_count = queue.popleft()
+                except IndexError:
+                    return
+
+                try:
+                    convert_func(file_name)
+                except Exception as exc:
+                    errors.append(exc)
+                    return
+
+                with lock:
+                    progress["frames"] += frames_count
+                    self.log.debug(
+                        "Output '{}': transcoded {}/{} frames".format(
+                            output_name, progress["frames"], frames_total))
+
+        if workers_count < 2:
+            _worker()
+        else:
+            threads = [
+                threading.Thread(target=_worker)
+                for _ in range(workers_count)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
@@ -13,7 +13,7 @@ import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_args,
-    filter_profiles,
+    get_compiled_profiles,
     path_to_subprocess_arg,
     run_subprocess,
 )
@@ -109,8 +109,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.debug("Host: \"{}\"".format(host_name))
         self.log.debug("Family: \"{}\"".format(family))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_compiled_profiles(self.profiles).filter(
             {
                 "hosts": host_name,
                 "families": family,
@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import copy
+import time
 import datetime
 
 import clique
@@ -21,13 +22,15 @@ from openpype.client.operations import (
 
 from openpype.client import (
     get_representations,
+    get_representation_files_by_content_hash,
     get_subset_by_name,
     get_version_by_name,
 )
 from openpype.lib import source_hash
 from openpype.lib.file_transaction import (
     FileTransaction,
-    DuplicateDestinationError
+    DuplicateDestinationError,
+    get_files_hashes,
 )
 from openpype.pipeline.publish import (
     KnownPublishError,
@@ -146,6 +149,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # File transfer options
+    # - number of threads used to transfer files, '1' means serial transfer
+    transfer_workers = 1
+    # - limit of concurrent transfers to one destination volume, '0' means
+    #   no limit
+    transfer_workers_per_volume = 0
+    # - verification of copied files ("none", "size" or "hash")
+    transfer_verify = "none"
+    # - hash content of published files and hardlink files with content
+    #   identical to already published files instead of copying them
+    content_dedup = False
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -176,9 +191,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_workers,
+            max_workers_per_volume=self.transfer_workers_per_volume,
+            verify=self._get_transfer_verify_mode()
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -199,6 +219,20 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _get_transfer_verify_mode(self):
+        verify_modes = {
+            "none": FileTransaction.VERIFY_NONE,
+            "size": FileTransaction.VERIFY_SIZE,
+            "hash": FileTransaction.VERIFY_HASH,
+        }
+        verify = verify_modes.get(self.transfer_verify)
+        if verify is None:
+            self.log.warning(
+                "Unknown transfer verification '{}'. Skipping.".format(
+                    self.transfer_verify))
+            verify = FileTransaction.VERIFY_NONE
+        return verify
+
     def filter_representations(self, instance):
         # Prepare repsentations that should be integrated
         repres = instance.data.get("representations")
@@ -312,6 +346,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                       "written to database..".format(subset=subset,
                                                      version=version))
 
+        content_hashes = {}
+        if self.content_dedup:
+            content_hashes = self._deduplicate_transfers(
+                project_name, anatomy, file_transactions
+            )
+
         # Process all file transfers of all integrations now
         self.log.debug("Integrating source files to destination ...")
         file_transactions.process()
@@ -338,9 +378,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
-        resource_file_infos = self.get_files_info(resource_destinations,
-                                                  sites=sites,
-                                                  anatomy=anatomy)
+        resource_file_infos = self.get_files_info(
+            resource_destinations,
+            sites=sites,
+            anatomy=anatomy,
+            content_hashes=content_hashes
+        )
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -351,7 +394,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                content_hashes=content_hashes
             )
 
             # Add the version resource file infos to each representation
@@ -955,25 +1001,37 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_files_info(
+        self, destinations, sites, anatomy, content_hashes=None
+    ):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            content_hashes (Optional[dict[str, str]]): Content hash by
+                normalized destination path.
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if content_hashes is None:
+            content_hashes = {}
+
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            content_hash = content_hashes.get(
+                os.path.normpath(os.path.abspath(file_path))
+            )
+            file_info = self.prepare_file_info(
+                file_path, anatomy, sites=sites, content_hash=content_hash
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, content_hash=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -982,18 +1040,86 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            content_hash (Optional[str]): sha256 of file content, stored
+                only when passed
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        file_info = {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
         }
+        if content_hash:
+            file_info["content_hash"] = content_hash
+        return file_info
+
+    def _deduplicate_transfers(self, project_name, anatomy, file_transactions):
+        """Hardlink already published files with identical content.
+
+        Sources of queued transfers are hashed and representations of the
+        project are searched for published files with the same content hash.
+        Copy of such file is replaced by hardlink of the published file.
+        Copy is used if hardlink can't be created.
+
+        Published files are never modified in place (existing files are
+        replaced with a new file) so sharing data between versions is safe.
+
+        Returns:
+            dict[str, str]: Content hash by normalized destination path.
+        """
+
+        transfers = file_transactions.queued_transfers
+        destinations = {dst for _, dst, _ in transfers}
+        start = time.time()
+        hashes_by_src = get_files_hashes(
+            [src for src, _, _ in transfers],
+            max_workers=self.transfer_workers
+        )
+        content_hashes = {
+            dst: hashes_by_src[src]
+            for src, dst, _ in transfers
+        }
+        files_by_hash = get_representation_files_by_content_hash(
+            project_name, content_hashes.values()
+        )
+
+        deduplicated = 0
+        for src, dst, mode in transfers:
+            if mode != FileTransaction.MODE_COPY:
+                continue
+
+            for file_info in files_by_hash.get(content_hashes[dst], []):
+                path = os.path.normpath(
+                    os.path.abspath(anatomy.fill_root(file_info["path"]))
+                )
+                # Skip files that are replaced by this publish
+                if (
+                    path in destinations
+                    or not os.path.isfile(path)
+                    or os.path.getsize(path) != file_info["size"]
+                ):
+                    continue
+
+                self.log.debug("Content of {} is published in {}".format(
+                    src, path))
+                file_transactions.set_transfer_source(
+                    dst, path, FileTransaction.MODE_HARDLINK_OR_COPY
+                )
+                deduplicated += 1
+                break
+
+        self.log.debug(
+            "Hashed {} files in {:.2f}s, {} have identical content"
+            " with published files".format(
+                len(hashes_by_src), time.time() - start, deduplicated
+            )
+        )
+        return content_hashes
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
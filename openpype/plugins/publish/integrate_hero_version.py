@@ -1,5 +1,8 @@
 import os
+import sys
 import copy
+import uuid
+import ctypes
 import clique
 import errno
 import shutil
@@ -20,11 +23,48 @@ from openpype.client.operations import (
     prepare_representation_update_data,
 )
 from openpype.lib import create_hard_link
+from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline import (
     schema
 )
 from openpype.pipeline.publish import get_publish_template_name
 
+# 'renameat2' arguments
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 1 << 1
+
+
+def _exchange_paths(src_path, dst_path):
+    """Atomically exchange two existing paths.
+
+    Uses 'renameat2' with 'RENAME_EXCHANGE' flag which is available only on
+    linux (kernel 3.15+, glibc 2.28+) and not on all filesystems.
+
+    Returns:
+        bool: Paths were exchanged.
+    """
+
+    if not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False
+
+    renameat2.argtypes = [
+        ctypes.c_int, ctypes.c_char_p,
+        ctypes.c_int, ctypes.c_char_p,
+        ctypes.c_uint
+    ]
+    renameat2.restype = ctypes.c_int
+    result = renameat2(
+        _AT_FDCWD, os.fsencode(src_path),
+        _AT_FDCWD, os.fsencode(dst_path),
+        _RENAME_EXCHANGE
+    )
+    return result == 0
+
 
 class IntegrateHeroVersion(pyblish.api.InstancePlugin):
     label = "Integrate Hero Version"
@@ -56,6 +96,12 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
     _default_template_name = "hero"
 
+    # Prepare hero files in staging folder and swap it with current hero
+    #   folder at once
+    staged_swap = False
+    # Number of threads used to hardlink or copy files to staging folder
+    transfer_workers = 1
+
     def process(self, instance):
         self.log.debug(
             "--- Integration of Hero version for subset `{}` begins.".format(
@@ -258,52 +304,10 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             archived_repres_by_name[repre_name_low] = repre
 
         backup_hero_publish_dir = None
-        if os.path.exists(hero_publish_dir):
-            backup_hero_publish_dir = hero_publish_dir + ".BACKUP"
-            max_idx = 10
-            idx = 0
-            _backup_hero_publish_dir = backup_hero_publish_dir
-            while os.path.exists(_backup_hero_publish_dir):
-                self.log.debug((
-                    "Backup folder already exists."
-                    " Trying to remove \"{}\""
-                ).format(_backup_hero_publish_dir))
-
-                try:
-                    shutil.rmtree(_backup_hero_publish_dir)
-                    backup_hero_publish_dir = _backup_hero_publish_dir
-                    break
-                except Exception:
-                    self.log.info(
-                        "Could not remove previous backup folder."
-                        " Trying to add index to folder name."
-                    )
-
-                _backup_hero_publish_dir = (
-                    backup_hero_publish_dir + str(idx)
-                )
-                if not os.path.exists(_backup_hero_publish_dir):
-                    backup_hero_publish_dir = _backup_hero_publish_dir
-                    break
-
-                if idx > max_idx:
-                    raise AssertionError((
-                        "Backup folders are fully occupied to max index \"{}\""
-                    ).format(max_idx))
-                    break
-
-                idx += 1
-
-            self.log.debug("Backup folder path is \"{}\"".format(
-                backup_hero_publish_dir
-            ))
-            try:
-                os.rename(hero_publish_dir, backup_hero_publish_dir)
-            except PermissionError:
-                raise AssertionError((
-                    "Could not create hero version because it is not"
-                    " possible to replace current hero files."
-                ))
+        if not self.staged_swap and os.path.exists(hero_publish_dir):
+            backup_hero_publish_dir = self._backup_hero_publish_dir(
+                hero_publish_dir
+            )
         try:
             src_to_dst_file_paths = []
             path_template_obj = anatomy.templates_obj[template_key]["path"]
@@ -455,14 +459,22 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
             self.path_checks = []
 
-            # Copy(hardlink) paths of source and destination files
-            # TODO should we *only* create hardlinks?
-            # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
+            if self.staged_swap:
+                # Previous hero is moved to backup folder by the swap
+                backup_hero_publish_dir = self._integrate_staged(
+                    hero_publish_dir,
+                    src_to_dst_file_paths + other_file_paths_mapping
+                )
+            else:
+                # Copy(hardlink) paths of source and destination files
+                # TODO should we *only* create hardlinks?
+                # TODO should we keep files for deletion until this is
+                #   successful?
+                for src_path, dst_path in src_to_dst_file_paths:
+                    self.copy_file(src_path, dst_path)
 
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+                for src_path, dst_path in other_file_paths_mapping:
+                    self.copy_file(src_path, dst_path)
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -517,6 +529,145 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             instance.data.get("subset", str(instance))
         ))
 
+    def _get_backup_dir(self, hero_publish_dir):
+        backup_hero_publish_dir = hero_publish_dir + ".BACKUP"
+        max_idx = 10
+        idx = 0
+        _backup_hero_publish_dir = backup_hero_publish_dir
+        while os.path.exists(_backup_hero_publish_dir):
+            self.log.debug((
+                "Backup folder already exists."
+                " Trying to remove \"{}\""
+            ).format(_backup_hero_publish_dir))
+
+            try:
+                shutil.rmtree(_backup_hero_publish_dir)
+                backup_hero_publish_dir = _backup_hero_publish_dir
+                break
+            except Exception:
+                self.log.info(
+                    "Could not remove previous backup folder."
+                    " Trying to add index to folder name."
+                )
+
+            _backup_hero_publish_dir = (
+                backup_hero_publish_dir + str(idx)
+            )
+            if not os.path.exists(_backup_hero_publish_dir):
+                backup_hero_publish_dir = _backup_hero_publish_dir
+                break
+
+            if idx > max_idx:
+                raise AssertionError((
+                    "Backup folders are fully occupied to max index \"{}\""
+                ).format(max_idx))
+
+            idx += 1
+
+        self.log.debug("Backup folder path is \"{}\"".format(
+            backup_hero_publish_dir
+        ))
+        return backup_hero_publish_dir
+
+    def _backup_hero_publish_dir(self, hero_publish_dir):
+        """Move current hero folder to backup folder.
+
+        Returns:
+            str: Path to backup folder.
+        """
+
+        backup_hero_publish_dir = self._get_backup_dir(hero_publish_dir)
+        try:
+            os.rename(hero_publish_dir, backup_hero_publish_dir)
+        except PermissionError:
+            raise AssertionError((
+                "Could not create hero version because it is not"
+                " possible to replace current hero files."
+            ))
+        return backup_hero_publish_dir
+
+    def _integrate_staged(self, hero_publish_dir, src_to_dst_file_paths):
+        """Prepare hero files in staging folder and swap it with hero folder.
+
+        Files are hardlinked (copied if hardlink is not possible) to staging
+        folder next to hero folder in parallel. Current hero files stay
+        untouched until the staging folder replaces the hero folder. On
+        linux is the swap atomic, otherwise current hero folder is renamed
+        to backup folder right before staging folder is renamed.
+
+        Files outside of hero folder can't be staged and are copied to
+        their destination before the swap.
+
+        Args:
+            hero_publish_dir (str): Path to hero folder.
+            src_to_dst_file_paths (list[tuple[str, str]]): Source and
+                destination paths of hero files.
+
+        Returns:
+            Union[str, None]: Path to folder with previous hero files which
+                should be removed when integration is finished.
+        """
+
+        staging_dir = "{}.staging_{}".format(
+            hero_publish_dir, uuid.uuid4().hex[:8]
+        )
+        dir_prefix = os.path.join(hero_publish_dir, "")
+        dir_prefix_low = os.path.normcase(dir_prefix)
+        transaction = FileTransaction(
+            log=self.log,
+            max_workers=self.transfer_workers
+        )
+        outside_file_paths = []
+        for src_path, dst_path in src_to_dst_file_paths:
+            dst_path = os.path.normpath(str(dst_path))
+            if not os.path.normcase(dst_path).startswith(dir_prefix_low):
+                outside_file_paths.append((src_path, dst_path))
+                continue
+
+            staging_path = os.path.join(
+                staging_dir, dst_path[len(dir_prefix):]
+            )
+            transaction.add(
+                src_path,
+                staging_path,
+                mode=FileTransaction.MODE_HARDLINK_OR_COPY
+            )
+
+        self.log.debug("Staging hero files in \"{}\"".format(staging_dir))
+        try:
+            transaction.process()
+            if not os.path.exists(staging_dir):
+                os.makedirs(staging_dir)
+
+            for src_path, dst_path in outside_file_paths:
+                self.copy_file(src_path, dst_path)
+
+            return self._swap_staging_dir(staging_dir, hero_publish_dir)
+
+        except Exception:
+            if os.path.exists(staging_dir):
+                shutil.rmtree(staging_dir)
+            raise
+
+    def _swap_staging_dir(self, staging_dir, hero_publish_dir):
+        if not os.path.exists(hero_publish_dir):
+            os.rename(staging_dir, hero_publish_dir)
+            return None
+
+        if _exchange_paths(staging_dir, hero_publish_dir):
+            self.log.debug("Staging folder swapped with hero folder.")
+            return staging_dir
+
+        backup_hero_publish_dir = self._backup_hero_publish_dir(
+            hero_publish_dir
+        )
+        try:
+            os.rename(staging_dir, hero_publish_dir)
+        except Exception:
+            os.rename(backup_hero_publish_dir, hero_publish_dir)
+            raise
+        return backup_hero_publish_dir
+
     def get_all_files_from_path(self, path):
         files = []
         for (dir_path, dir_names, file_names) in os.walk(path):
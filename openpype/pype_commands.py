@@ -171,15 +171,17 @@ class PypeCommands:
         """Produces json file with environment based on project and app.
 
         Called by Deadline plugin to propagate environment into render jobs.
+        Environments of the same context are reused from cache, see
+        'get_cached_app_environments_for_context'.
         """
 
         from openpype.lib.applications import (
-            get_app_environments_for_context,
+            get_cached_app_environments_for_context,
             LaunchTypes,
         )
 
         if all((project, asset, task, app)):
-            env = get_app_environments_for_context(
+            env = get_cached_app_environments_for_context(
                 project,
                 asset,
                 task,
@@ -293,7 +295,7 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath, database_only):
+    def pack_project(self, project_name, dirpath, database_only, resume):
         from openpype.lib.project_backpack import pack_project
 
         if database_only and not dirpath:
@@ -303,7 +305,40 @@ class PypeCommands:
                 " to specify directory."
             ))
 
-        pack_project(project_name, dirpath, database_only)
+        pack_project(project_name, dirpath, database_only, resume=resume)
+
+    def ensure_project_indexes(self, project_names, explain):
+        from openpype.client import get_projects
+        from openpype.client.mongo import (
+            ensure_project_indexes,
+            get_project_queries_report,
+        )
+
+        if not project_names:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(
+                    inactive=True, fields=["name"]
+                )
+            ]
+
+        for project_name in project_names:
+            print(">>> Project: {}".format(project_name))
+            result = ensure_project_indexes(project_name)
+            for index_name, index_result in result.items():
+                print("    {}: {}".format(index_name, index_result))
+
+            if not explain:
+                continue
+
+            print(">>> Query plans:")
+            for item in get_project_queries_report(project_name):
+                status = "OK"
+                if item["collection_scan"]:
+                    status = "COLLECTION SCAN"
+                print("    [{}] {}: {}".format(
+                    status, item["label"], " <- ".join(item["stages"])
+                ))
 
     def unpack_project(self, zip_filepath, new_root, database_only):
         from openpype.lib.project_backpack import unpack_project
@@ -17,13 +17,45 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- server - console command - python 2
+         - long-lived process answering requests of other commands
+           received as json lines on stdin.
 """
 
+import os
+import sys
 import click
 import json
 from pathlib import Path
 import PyOpenColorIO as ocio
 
+# Prefix of response lines written by 'server' command to stdout
+SERVER_RESPONSE_PREFIX = "ocio_wrapper_response:"
+
+# Parsed configs by path with modification time and size of the file
+_CONFIGS_CACHE = {}
+
+
+def _get_config(config_path):
+    """Parsed OCIO config cached by path and modification time.
+
+    Args:
+        config_path (Union[str, Path]): Path to config file.
+
+    Returns:
+        ocio.Config: Parsed config.
+    """
+    config_path = str(config_path)
+    stat = os.stat(config_path)
+    key = (stat.st_mtime, stat.st_size)
+    cached = _CONFIGS_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    config = ocio.Config.CreateFromFile(config_path)
+    _CONFIGS_CACHE[config_path] = (key, config)
+    return config
+
 
 @click.group()
 def main():
@@ -104,7 +136,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -201,7 +233,7 @@ def _get_views_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -274,7 +306,7 @@ def _get_version_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -347,7 +379,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(str(filepath))
@@ -376,7 +408,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(str(config_path))
+    config = _get_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -429,5 +461,92 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+# Functions available through 'server' command with their arguments
+_SERVER_COMMANDS = {
+    ("config", "get_colorspace"): (
+        _get_colorspace_data, ("in_path", )
+    ),
+    ("config", "get_views"): (
+        _get_views_data, ("in_path", )
+    ),
+    ("config", "get_version"): (
+        _get_version_data, ("config_path", )
+    ),
+    ("config", "get_display_view_colorspace_name"): (
+        _get_display_view_colorspace_name, ("in_path", "display", "view")
+    ),
+    ("colorspace", "get_config_file_rules_colorspace_from_filepath"): (
+        _get_config_file_rules_colorspace_from_filepath,
+        ("config_path", "filepath")
+    ),
+}
+
+
+def _process_server_request(request):
+    """Process single request received by 'server' command.
+
+    Args:
+        request (dict[str, Any]): Request with 'id', 'command_group',
+            'command' and 'kwargs' keys.
+
+    Returns:
+        dict[str, Any]: Response with 'id' and 'result' or 'error'.
+    """
+    response = {"id": request.get("id")}
+    key = (request.get("command_group"), request.get("command"))
+    command_info = _SERVER_COMMANDS.get(key)
+    if command_info is None:
+        response["error"] = "Unknown command '{} {}'".format(*key)
+        return response
+
+    func, arg_names = command_info
+    kwargs = request.get("kwargs") or {}
+    try:
+        response["result"] = func(*[kwargs[name] for name in arg_names])
+    except Exception as exc:
+        response["error"] = "{}: {}".format(exc.__class__.__name__, exc)
+    return response
+
+
+@main.command(
+    name="server",
+    help=(
+        "run long-lived process answering requests from stdin "
+        "(one json per line) with responses to stdout"
+    )
+)
+def server():
+    """Answer requests of other commands until stdin is closed.
+
+    Wrapper command for processes without access to OpenColorIO which
+    need to query configs multiple times. Parsed configs are cached
+    between requests.
+
+    Request is json line with keys 'id', 'command_group', 'command' and
+    'kwargs' (same as options of the console command without 'out_path').
+    Response is json line prefixed with 'ocio_wrapper_response:'.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py server
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {"id": None, "error": "Invalid request"}
+        else:
+            response = _process_server_request(request)
+
+        sys.stdout.write(
+            SERVER_RESPONSE_PREFIX + json.dumps(response) + "\n"
+        )
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
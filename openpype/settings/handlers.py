@@ -281,6 +281,22 @@ class SettingsHandler(object):
         """
         pass
 
+    @abstractmethod
+    def get_project_settings_revision(self, project_name):
+        """Revision of project settings overrides.
+
+        Revision changes when overrides of project change. Can be used to
+        find out if values resolved from overrides are still valid.
+
+        Args:
+            project_name(Union[str, None]): Name of project. Studio overrides
+                of default project settings are used when is 'None'.
+
+        Returns:
+            int: Revision of overrides.
+        """
+        pass
+
     @abstractmethod
     def get_project_anatomy_overrides(self, project_name, return_version):
         """Studio overrides of project anatomy for specific project.
@@ -556,6 +572,10 @@ class LocalSettingsHandler:
 
 
 class CacheValues:
+    """Cached values with lifetime.
+
+    Revision is increased each time cached data change.
+    """
     cache_lifetime = 10
 
     def __init__(self):
@@ -563,17 +583,23 @@ class CacheValues:
         self.creation_time = None
         self.version = None
         self.last_saved_info = None
+        self.revision = 0
 
     def data_copy(self):
         if not self.data:
             return {}
         return copy.deepcopy(self.data)
 
-    def update_data(self, data, version):
+    def _set_data(self, data, version):
+        if self.revision == 0 or data != self.data:
+            self.revision += 1
         self.data = data
         self.creation_time = datetime.datetime.now()
         self.version = version
 
+    def update_data(self, data, version):
+        self._set_data(data, version)
+
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
 
@@ -587,8 +613,7 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
-        self.data = data
-        self.version = version
+        self._set_data(data, version)
 
     def to_json_string(self):
         return json.dumps(self.data or {})
@@ -601,7 +626,7 @@ class CacheValues:
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -1393,22 +1418,21 @@ class MongoSettingsHandler(SettingsHandler):
 
         return self.system_settings_cache.last_saved_info.copy()
 
-    def _get_project_settings_overrides(self, project_name, return_version):
-        if self.project_settings_cache[project_name].is_outdated:
+    def _update_project_settings_cache(self, project_name):
+        cache = self.project_settings_cache[project_name]
+        if cache.is_outdated:
             document, version = self._get_project_settings_overrides_doc(
                 project_name
             )
-            self.project_settings_cache[project_name].update_from_document(
-                document, version
-            )
+            cache.update_from_document(document, version)
             last_saved_info = SettingsStateInfo.from_document(
                 version, PROJECT_SETTINGS_KEY, document
             )
-            self.project_settings_cache[project_name].update_last_saved_info(
-                last_saved_info
-            )
+            cache.update_last_saved_info(last_saved_info)
+        return cache
 
-        cache = self.project_settings_cache[project_name]
+    def _get_project_settings_overrides(self, project_name, return_version):
+        cache = self._update_project_settings_cache(project_name)
         data = cache.data_copy()
         if return_version:
             return data, cache.version
@@ -1441,6 +1465,13 @@ class MongoSettingsHandler(SettingsHandler):
         """Studio overrides of default project settings."""
         return self._get_project_settings_overrides(None, return_version)
 
+    def get_project_settings_revision(self, project_name):
+        """Revision of project settings overrides.
+
+        Overrides are re-queried only when cached overrides are outdated.
+        """
+        return self._update_project_settings_cache(project_name).revision
+
     def get_project_settings_overrides(self, project_name, return_version):
         """Studio overrides of project settings for specific project.
 
@@ -47,6 +47,9 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Resolved project settings with state of their sources
+_PROJECT_SETTINGS_CACHE = {}
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -246,6 +249,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    clear_project_settings_cache()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -539,6 +543,29 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    clear_project_settings_cache()
+
+
+def clear_project_settings_cache():
+    """Clear cache of resolved project settings."""
+    _PROJECT_SETTINGS_CACHE.clear()
+
+
+def _copy_settings(value):
+    """Copy of settings values.
+
+    Faster alternative of 'copy.deepcopy' for json serializable data.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _copy_settings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_settings(item) for item in value]
+    if isinstance(value, (tuple, set)):
+        return copy.deepcopy(value)
+    return value
 
 
 def _get_default_settings():
@@ -1024,16 +1051,59 @@ def get_anatomy_settings(
     return result
 
 
+@require_handler
+def _get_project_settings_state(project_name, exclude_locals):
+    """State of sources used to resolve project settings.
+
+    Local settings are part of the state only if they are applied.
+    """
+    local_settings_key = None
+    if not exclude_locals:
+        local_settings = get_local_settings() or {}
+        local_settings_key = json.dumps(
+            local_settings.get("projects"), sort_keys=True
+        )
+
+    return (
+        _SETTINGS_HANDLER.get_project_settings_revision(None),
+        _SETTINGS_HANDLER.get_project_settings_revision(project_name),
+        local_settings_key,
+    )
+
+
 def _get_project_settings(
     project_name, clear_metadata=True, exclude_locals=None
 ):
-    """Project settings with applied studio and project overrides."""
+    """Project settings with applied studio and project overrides.
+
+    Resolved settings are cached per process until overrides of project,
+    studio overrides or applied local settings change. Each call returns
+    new copy of the cached settings.
+    """
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
+    # Default behavior is based on `clear_metadata` value
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    cache_key = (project_name, clear_metadata, exclude_locals)
+    state = _get_project_settings_state(project_name, exclude_locals)
+    cached = _PROJECT_SETTINGS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == state:
+        return _copy_settings(cached[1])
+
+    result = _resolve_project_settings(
+        project_name, clear_metadata, exclude_locals
+    )
+    _PROJECT_SETTINGS_CACHE[cache_key] = (state, _copy_settings(result))
+    return result
+
+
+def _resolve_project_settings(project_name, clear_metadata, exclude_locals):
     studio_overrides = get_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
@@ -1046,9 +1116,6 @@ def _get_project_settings(
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
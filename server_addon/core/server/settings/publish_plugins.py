@@ -280,6 +280,25 @@ class ExtractOIIOTranscodeProfileModel(BaseSettingsModel):
 
 class ExtractOIIOTranscodeModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
+    workers: int = SettingsField(
+        1,
+        title="Workers",
+        ge=0,
+        le=256,
+        description=(
+            "Parallel oiiotool processes, default is 1"
+            " (0 uses all cores)"
+        )
+    )
+    frames_per_task: int = SettingsField(
+        0,
+        title="Frames per task",
+        ge=0,
+        description=(
+            "Frames transcoded by one oiiotool process"
+            " (0 splits frames evenly between workers)"
+        )
+    )
     profiles: list[ExtractOIIOTranscodeProfileModel] = SettingsField(
         default_factory=list, title="Profiles"
     )
@@ -702,12 +721,63 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+def _integrate_transfer_verify_enum():
+    return [
+        {"value": "none", "label": "Don't verify"},
+        {"value": "size", "label": "File size"},
+        {"value": "hash", "label": "File hash"}
+    ]
+
+
+class IntegrateAssetModel(BaseSettingsModel):
+    _isGroup = True
+    transfer_workers: int = SettingsField(
+        1,
+        title="Transfer threads",
+        ge=1,
+        le=64
+    )
+    transfer_workers_per_volume: int = SettingsField(
+        0,
+        title="Transfer threads per volume (0 is unlimited)",
+        ge=0,
+        le=64
+    )
+    transfer_verify: str = SettingsField(
+        "none",
+        title="Verify copied files",
+        enum_resolver=_integrate_transfer_verify_enum
+    )
+    content_dedup: bool = SettingsField(
+        False,
+        title="Deduplicate published files",
+        description=(
+            "Content of published files is hashed and files identical to"
+            " already published files are hardlinked instead of copied."
+        )
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
     optional: bool = SettingsField(False, title="Optional")
     active: bool = SettingsField(True, title="Active")
     families: list[str] = SettingsField(default_factory=list, title="Families")
+    staged_swap: bool = SettingsField(
+        False,
+        title="Staged swap",
+        description=(
+            "Prepare new hero files next to current hero folder and replace"
+            " the folder at once, so the hero is never seen incomplete."
+        )
+    )
+    transfer_workers: int = SettingsField(
+        1,
+        title="Transfer threads",
+        ge=1,
+        le=64
+    )
 
 
 class CleanUpModel(BaseSettingsModel):
@@ -785,6 +855,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -867,6 +941,8 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
+        "workers": 1,
+        "frames_per_task": 0,
         "profiles": []
     },
     "ExtractReview": {
@@ -1044,6 +1120,12 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_workers": 1,
+        "transfer_workers_per_volume": 0,
+        "transfer_verify": "none",
+        "content_dedup": False
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
@@ -1058,7 +1140,9 @@ DEFAULT_PUBLISH_VALUES = {
             "layout",
             "mayaScene",
             "simpleUnrealTexture"
-        ]
+        ],
+        "staged_swap": False,
+        "transfer_workers": 1
     },
     "CleanUp": {
         "paterns": [],
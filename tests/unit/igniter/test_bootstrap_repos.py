@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test suite for repos bootstrapping (install)."""
+import hashlib
 import os
 import sys
 from collections import namedtuple
@@ -12,6 +13,7 @@ import pytest
 
 from igniter.bootstrap_repos import BootstrapRepos
 from igniter.bootstrap_repos import OpenPypeVersion
+from igniter.bootstrap_repos import ValidationCache
 from igniter.user_settings import OpenPypeSettingsRegistry
 
 
@@ -388,3 +390,37 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def test_validate_version_cache(tmp_path):
+    """Test validation of version directory and zip with cache."""
+    version_dir = tmp_path / "openpype-v3.0.0"
+    version_dir.mkdir()
+    checksums = []
+    for idx in range(5):
+        content = f"content {idx}".encode()
+        (version_dir / f"file_{idx}.py").write_bytes(content)
+        checksums.append(
+            f"{hashlib.sha256(content).hexdigest()}:file_{idx}.py")
+    checksums_str = "\n".join(checksums) + "\n"
+    (version_dir / "checksums").write_text(checksums_str)
+
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        for idx in range(5):
+            zip_file.writestr(f"file_{idx}.py", f"content {idx}")
+        zip_file.writestr("checksums", checksums_str)
+
+    cache = ValidationCache(tmp_path / "cache.json")
+    assert BootstrapRepos._validate_dir(version_dir, cache) == (
+        True, "All ok")
+    assert BootstrapRepos._validate_dir(version_dir, cache) == (
+        True, "All ok (cached)")
+    assert BootstrapRepos._validate_zip(zip_path, cache) == (True, "All ok")
+    assert BootstrapRepos._validate_zip(zip_path, cache) == (
+        True, "All ok (cached)")
+
+    # changed file invalidates cached result
+    (version_dir / "file_2.py").write_bytes(b"changed")
+    assert BootstrapRepos._validate_dir(version_dir, cache) == (
+        False, "Invalid checksum on file_2.py")
@@ -176,3 +176,50 @@ def test_events_partial_callbacks():
     event_system.emit("test", {}, "test")
 
     assert result == ["regular", "bar", "regular"]
+
+
+def test_wildcard_events_order():
+    """
+    Validate if callbacks of exact and wildcard topics are triggered by their
+        order and order of their register.
+    """
+
+    result = []
+
+    def function_a():
+        result.append("A")
+
+    def function_b():
+        result.append("B")
+
+    def function_c():
+        result.append("C")
+
+    def function_d():
+        result.append("D")
+
+    event_system = EventSystem()
+    event_system.add_callback("test.*", function_a)
+    event_system.add_callback("test.topic", function_b)
+    event_system.add_callback("*", function_c, order=10)
+    callback_d = event_system.add_callback("other", function_d)
+
+    event_system.emit("test.topic", {}, "test")
+    event_system.emit("test.other", {}, "test")
+    event_system.emit("other", {}, "test")
+    assert result == ["C", "A", "B", "C", "A", "C", "D"]
+
+    # Changed order and new callback are used for already emitted topics
+    result[:] = []
+    event_system.add_callback("test.topic", function_d, order=0)
+    callback_d.order = 0
+    event_system.emit("test.topic", {}, "test")
+    event_system.emit("other", {}, "test")
+    assert result == ["D", "C", "A", "B", "D", "C"]
+
+    # Deregistered callback is removed
+    result[:] = []
+    callback_d.deregister()
+    event_system.emit("other", {}, "test")
+    event_system.emit("other", {}, "test")
+    assert result == ["C", "C"]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction."""
+import os
+
+import pytest
+
+from openpype.lib.file_transaction import (
+    FileTransaction,
+    TransferVerificationError,
+    get_files_hashes,
+)
+
+
+def _create_sources(root, count):
+    src_dir = os.path.join(root, "src")
+    os.makedirs(src_dir)
+    sources = []
+    for idx in range(count):
+        path = os.path.join(src_dir, "file.{:04d}.exr".format(idx))
+        with open(path, "wb") as stream:
+            stream.write(os.urandom(1024 + idx))
+        sources.append(path)
+    return sources
+
+
+def test_parallel_transfer(tmp_path):
+    sources = _create_sources(str(tmp_path), 20)
+    dst_dir = os.path.join(str(tmp_path), "dst")
+    reports = []
+
+    transaction = FileTransaction(
+        max_workers=4,
+        max_workers_per_volume=2,
+        verify=FileTransaction.VERIFY_HASH,
+        progress_callback=reports.append
+    )
+    for src in sources:
+        transaction.add(src, os.path.join(dst_dir, os.path.basename(src)))
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(sources)
+    assert len(reports) == len(sources)
+    assert sorted(report["processed"] for report in reports) == list(
+        range(1, len(sources) + 1))
+    for src in sources:
+        dst = os.path.join(dst_dir, os.path.basename(src))
+        with open(src, "rb") as src_stream, open(dst, "rb") as dst_stream:
+            assert src_stream.read() == dst_stream.read()
+
+
+def test_parallel_transfer_rollback(tmp_path):
+    sources = _create_sources(str(tmp_path), 10)
+    dst_dir = os.path.join(str(tmp_path), "dst")
+    os.makedirs(dst_dir)
+    existing_dst = os.path.join(dst_dir, os.path.basename(sources[0]))
+    with open(existing_dst, "wb") as stream:
+        stream.write(b"original")
+
+    transaction = FileTransaction(max_workers=4)
+    for src in sources:
+        transaction.add(src, os.path.join(dst_dir, os.path.basename(src)))
+    # Missing source file makes the transfer fail
+    transaction.add(
+        os.path.join(str(tmp_path), "missing.exr"),
+        os.path.join(dst_dir, "missing.exr")
+    )
+
+    with pytest.raises(EnvironmentError):
+        transaction.process()
+    transaction.rollback()
+
+    assert os.listdir(dst_dir) == [os.path.basename(existing_dst)]
+    with open(existing_dst, "rb") as stream:
+        assert stream.read() == b"original"
+
+
+def test_transfer_size_verification(tmp_path, monkeypatch):
+    sources = _create_sources(str(tmp_path), 1)
+    dst = os.path.join(str(tmp_path), "dst", "file.exr")
+
+    def _broken_copy(src, dst):
+        with open(dst, "wb") as stream:
+            stream.write(b"broken")
+
+    monkeypatch.setattr(
+        "openpype.lib.file_transaction.copyfile", _broken_copy)
+
+    transaction = FileTransaction(verify=FileTransaction.VERIFY_SIZE)
+    transaction.add(sources[0], dst)
+    with pytest.raises(TransferVerificationError):
+        transaction.process()
+
+    transaction.rollback()
+    assert not os.path.exists(dst)
+
+
+def test_files_hashes_and_hardlink_source(tmp_path):
+    sources = _create_sources(str(tmp_path), 5)
+    published = os.path.join(str(tmp_path), "published.exr")
+    with open(sources[0], "rb") as stream:
+        content = stream.read()
+    with open(published, "wb") as stream:
+        stream.write(content)
+
+    hashes = get_files_hashes(sources + [published], max_workers=3)
+    assert hashes == get_files_hashes(sources + [published])
+    assert hashes[published] == hashes[sources[0]]
+    assert len(set(hashes.values())) == len(sources)
+
+    dst = os.path.join(str(tmp_path), "dst", "file.exr")
+    transaction = FileTransaction()
+    transaction.add(sources[0], dst)
+    transaction.set_transfer_source(
+        dst, published, FileTransaction.MODE_HARDLINK_OR_COPY)
+    assert transaction.queued_transfers == [
+        (published, dst, FileTransaction.MODE_HARDLINK_OR_COPY)
+    ]
+    transaction.process()
+    transaction.finalize()
+
+    assert os.path.samefile(published, dst)
+    assert transaction.transfer_reports[0]["mode"] == (
+        FileTransaction.MODE_HARDLINK)
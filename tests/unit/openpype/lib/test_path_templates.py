@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates."""
+from openpype.lib.path_templates import StringTemplate
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{asset}"
+    "/{project[code]}_{asset}<_{comment}>_v{version:0>3}<.{frame:0>4}>.{ext}"
+)
+
+
+def test_solved_template():
+    data = {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Project", "code": "prj"},
+        "asset": "sh010",
+        "version": 2,
+        "frame": 1001,
+        "ext": "exr",
+    }
+    result = StringTemplate(TEMPLATE).format(data)
+
+    assert result == "/mnt/work/Project/sh010/prj_sh010_v002.1001.exr"
+    assert result.solved
+    assert result.missing_keys == []
+    assert result.invalid_types == {}
+    assert result.used_values == {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Project", "code": "prj"},
+        "asset": "sh010",
+        "version": "002",
+        "frame": "1001",
+        "ext": "exr",
+    }
+
+
+def test_unsolved_template():
+    data = {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Project"},
+        "asset": {"name": "sh010"},
+        "version": 2,
+        "ext": "exr",
+    }
+    result = StringTemplate(TEMPLATE).format(data)
+
+    assert not result.solved
+    assert result.missing_keys == ["project[code]"]
+    assert result.invalid_types == {"asset": dict}
+    assert result == (
+        "/mnt/work/Project/{asset}/{project[code]}_{asset}_v002.exr"
+    )
+
+
+def test_compiled_parts_are_cached():
+    StringTemplate.clear_compiled_cache()
+    template_a = StringTemplate(TEMPLATE)
+    template_b = StringTemplate(TEMPLATE)
+
+    assert template_a._parts is template_b._parts
+
+
+def test_format_many():
+    template = StringTemplate("{asset}<.{frame:0>4}>.{ext}")
+    data_list = [
+        {"asset": "sh010", "frame": frame, "ext": "exr"}
+        for frame in range(1, 4)
+    ]
+    data_list.append({"asset": "sh010", "ext": "mov"})
+
+    results = template.format_many(data_list)
+
+    assert results == [
+        "sh010.0001.exr",
+        "sh010.0002.exr",
+        "sh010.0003.exr",
+        "sh010.mov",
+    ]
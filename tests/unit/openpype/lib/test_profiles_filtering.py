@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Test suite for profiles filtering."""
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    CompiledProfiles,
+    get_compiled_profiles,
+)
+
+PROFILES = [
+    {"hosts": [], "families": [], "template": "default"},
+    {"hosts": ["maya"], "families": ["render.*"], "template": "maya_render"},
+    {"hosts": ["maya", "nuke"], "families": ["*"], "template": "maya_nuke"},
+    {"hosts": ["nuke"], "families": ["plate"], "template": "nuke_plate"},
+    {"hosts": "houdini", "families": [], "template": "houdini"},
+]
+
+
+def test_compiled_profiles_match_filter_profiles():
+    compiled = CompiledProfiles(PROFILES)
+    for host_name in ("maya", "nuke", "houdini", "blender", None):
+        for family in ("render", "renderLayer", "plate", "model", None):
+            key_values = {"hosts": host_name, "families": family}
+            expected = filter_profiles(PROFILES, key_values)
+            assert compiled.filter(key_values) is expected
+            # Memoized result
+            assert compiled.filter(key_values) is expected
+
+
+def test_compiled_profiles_keys_order():
+    profiles = [
+        {"hosts": ["maya"], "families": []},
+        {"hosts": [], "families": ["model"]},
+    ]
+    key_values = {"hosts": "maya", "families": "model"}
+    compiled = CompiledProfiles(profiles)
+
+    assert compiled.filter(key_values) is profiles[0]
+    assert compiled.filter(key_values, ["families"]) is profiles[1]
+
+
+def test_get_compiled_profiles_cache():
+    profiles = list(PROFILES)
+
+    assert get_compiled_profiles(profiles) is get_compiled_profiles(profiles)
+
+    profiles.append({"hosts": ["blender"], "template": "blender"})
+    compiled = get_compiled_profiles(profiles)
+    assert compiled.filter({"hosts": "blender"}) is profiles[-1]
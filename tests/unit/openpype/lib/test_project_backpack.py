@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""Test suite for project packages."""
+import os
+import json
+import time
+import hashlib
+import zipfile
+import platform
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.lib import project_backpack
+
+PROJECT_NAME = "prj"
+
+
+class _Cursor(list):
+    def batch_size(self, size):
+        return self
+
+
+class _Collection(object):
+    """Project collection keeping documents in memory."""
+
+    def __init__(self):
+        self.docs = []
+
+    def find(self, query):
+        return _Cursor(self.docs)
+
+    def find_one(self, query):
+        for doc in self.docs:
+            if all(doc.get(key) == value for key, value in query.items()):
+                return doc
+        return None
+
+    def drop(self):
+        self.docs = []
+
+    def insert_many(self, docs):
+        self.docs.extend(docs)
+
+    def update_one(self, query, update):
+        doc = self.find_one(query)
+        for key, value in update["$set"].items():
+            parts = key.split(".")
+            item = doc
+            for part in parts[:-1]:
+                item = item[part]
+            item[parts[-1]] = value
+
+
+def _write_file(root, rel_path, content):
+    filepath = os.path.join(root, *rel_path.split("/"))
+    dirpath = os.path.dirname(filepath)
+    if not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+    with open(filepath, "wb") as stream:
+        stream.write(content)
+    return filepath
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    root_path = str(tmp_path / "root")
+    collections_by_name = {}
+
+    def _get_project_connection(project_name, database_name=None):
+        key = (project_name, database_name)
+        if key not in collections_by_name:
+            collections_by_name[key] = _Collection()
+        return collections_by_name[key]
+
+    monkeypatch.setattr(
+        project_backpack, "get_project_connection", _get_project_connection
+    )
+    # Each file is stored to own zip part
+    monkeypatch.setattr(project_backpack, "FILES_PART_MAX_COUNT", 1)
+
+    collection = _get_project_connection(PROJECT_NAME)
+    collection.insert_many([
+        {
+            "_id": ObjectId(),
+            "type": "project",
+            "name": PROJECT_NAME,
+            "config": {"roots": {
+                "work": {platform.system().lower(): root_path}
+            }},
+        },
+        {"_id": ObjectId(), "type": "asset", "name": "sh010"},
+    ])
+
+    files = {
+        "prj/a.txt": b"a" * 1000,
+        "prj/b.exr": os.urandom(1000),
+        "prj/sub/c.txt": b"c" * 1000,
+    }
+    for rel_path, content in files.items():
+        _write_file(root_path, rel_path, content)
+    return root_path, files, _get_project_connection
+
+
+def _load_manifest_lines(package_dir):
+    filepath = os.path.join(
+        package_dir, project_backpack._get_manifest_filename()
+    )
+    with open(filepath, "r") as stream:
+        return [json.loads(line) for line in stream if line.strip()]
+
+
+def test_pack_resume_and_unpack(tmp_path, project, monkeypatch):
+    root_path, files, get_connection = project
+    destination_dir = str(tmp_path / "packages")
+
+    packed_paths = []
+    pack_file = project_backpack._pack_file
+
+    def _pack_file(zip_stream, filepath, rel_path):
+        if len(packed_paths) == 1:
+            raise RuntimeError("Interrupted")
+        packed_paths.append(rel_path)
+        return pack_file(zip_stream, filepath, rel_path)
+
+    # Packing is interrupted after first file
+    monkeypatch.setattr(project_backpack, "_pack_file", _pack_file)
+    with pytest.raises(RuntimeError):
+        project_backpack.pack_project(
+            PROJECT_NAME, destination_dir, workers=1
+        )
+    monkeypatch.setattr(project_backpack, "_pack_file", pack_file)
+
+    package_dir = os.path.join(
+        destination_dir, PROJECT_NAME + project_backpack.PACKAGE_DIR_SUFFIX
+    )
+    first_items = _load_manifest_lines(package_dir)
+    assert [item["path"] for item in first_items] == packed_paths
+
+    # Resume packs only remaining files
+    monkeypatch.setattr(
+        project_backpack,
+        "_pack_file",
+        lambda *args: packed_paths.append(args[-1]) or pack_file(*args)
+    )
+    project_backpack.pack_project(
+        PROJECT_NAME, destination_dir, workers=2, resume=True
+    )
+    assert sorted(packed_paths) == sorted(files.keys())
+    # Incomplete part of interrupted packing was removed
+    assert not [
+        filename
+        for filename in os.listdir(package_dir)
+        if filename.endswith(".tmp")
+    ]
+
+    # Only changed file is packed again
+    packed_paths[:] = []
+    files["prj/a.txt"] = b"changed"
+    filepath = _write_file(root_path, "prj/a.txt", files["prj/a.txt"])
+    future_time = time.time() + 10
+    os.utime(filepath, (future_time, future_time))
+    project_backpack.pack_project(
+        PROJECT_NAME, destination_dir, workers=2, resume=True
+    )
+    assert packed_paths == ["prj/a.txt"]
+
+    manifest = project_backpack._load_manifest(package_dir)
+    assert sorted(manifest.keys()) == sorted(files.keys())
+    assert manifest["prj/a.txt"]["size"] == len(b"changed")
+
+    # Unpack to different root
+    new_root = str(tmp_path / "new_root")
+    project_backpack.unpack_project(
+        package_dir, new_root, database_name="unpacked", workers=2
+    )
+    for rel_path, content in files.items():
+        with open(os.path.join(new_root, *rel_path.split("/")), "rb") as f:
+            assert f.read() == content
+
+    unpacked_docs = get_connection(PROJECT_NAME, "unpacked").docs
+    assert len(unpacked_docs) == 2
+    project_doc = unpacked_docs[0]
+    assert project_doc["config"]["roots"]["work"][
+        platform.system().lower()
+    ] == new_root
+
+
+def test_unpack_validates_hashes(tmp_path, project):
+    destination_dir = str(tmp_path / "packages")
+    package_dir = project_backpack.pack_project(
+        PROJECT_NAME, destination_dir, workers=1
+    )
+
+    # Change hash of a file in manifest
+    items = _load_manifest_lines(package_dir)
+    items[0]["sha256"] = "0" * 64
+    manifest_path = os.path.join(
+        package_dir, project_backpack._get_manifest_filename()
+    )
+    with open(manifest_path, "w") as stream:
+        for item in items:
+            stream.write(json.dumps(item) + "\n")
+
+    with pytest.raises(ValueError):
+        project_backpack.unpack_project(
+            package_dir,
+            str(tmp_path / "new_root"),
+            database_name="unpacked",
+            workers=1
+        )
+
+
+@pytest.mark.parametrize("member_name", ["../evil.txt", "/evil.txt"])
+def test_unpack_rejects_paths_outside_root(tmp_path, project, member_name):
+    destination_dir = str(tmp_path / "packages")
+    package_dir = project_backpack.pack_project(
+        PROJECT_NAME, destination_dir, workers=1
+    )
+
+    # Add member pointing outside of root to package
+    content = b"evil"
+    items = _load_manifest_lines(package_dir)
+    item = dict(items[0])
+    item.update({
+        "path": member_name,
+        "size": len(content),
+        "sha256": hashlib.sha256(content).hexdigest(),
+    })
+    part_path = os.path.join(package_dir, item["part"])
+    with zipfile.ZipFile(part_path, "a") as zip_stream:
+        zip_stream.writestr(member_name, content)
+    manifest_path = os.path.join(
+        package_dir, project_backpack._get_manifest_filename()
+    )
+    with open(manifest_path, "a") as stream:
+        stream.write(json.dumps(item) + "\n")
+
+    with pytest.raises(ValueError):
+        project_backpack.unpack_project(
+            package_dir,
+            str(tmp_path / "new_root"),
+            database_name="unpacked",
+            workers=1
+        )
+    assert not os.path.exists(str(tmp_path / "evil.txt"))
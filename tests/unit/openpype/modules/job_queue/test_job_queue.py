@@ -0,0 +1,140 @@
+"""Test file for job queue with SQLite storage."""
+import datetime
+
+import pytest
+
+pytest.importorskip("aiohttp_json_rpc")
+
+from openpype.modules.job_queue.job_server.jobs import (  # noqa: E402
+    JobQueue,
+)
+from openpype.modules.job_queue.job_server.storage import (  # noqa: E402
+    SQLiteJobStorage,
+)
+from openpype.modules.job_queue.job_server.workers import (  # noqa: E402
+    Worker,
+)
+
+HOST_NAME = "tvpaint"
+
+
+class _Request(object):
+    """Request of worker connection, worker only stores attributes on it."""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "jobs" / "jobs.db")
+
+
+def _assign_job(job_queue):
+    worker = Worker(HOST_NAME, _Request())
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    job = worker.current_job
+    if job is not None:
+        job_queue.job_sent(worker)
+    return worker, job
+
+
+def test_storage_round_trip(db_path):
+    storage = SQLiteJobStorage(db_path)
+    jobs_data = [
+        {
+            "id": "job_{}".format(idx),
+            "host_name": HOST_NAME,
+            "state": "waiting",
+            "priority": idx,
+            "created_time": 1000.0 - idx,
+            "data": {"idx": idx},
+        }
+        for idx in range(3)
+    ]
+    storage.save_jobs(jobs_data)
+    jobs_data[0]["state"] = "done"
+    storage.save_job(jobs_data[0])
+    storage.delete_job("job_1")
+    storage.close()
+
+    storage = SQLiteJobStorage(db_path)
+    # Ordered by creation
+    assert storage.load_jobs() == [jobs_data[2], jobs_data[0]]
+    storage.close()
+
+
+def test_priority_order(db_path):
+    job_queue = JobQueue(SQLiteJobStorage(db_path))
+    low_job = job_queue.create_job(HOST_NAME, {"name": "low"})
+    high_job = job_queue.create_job(HOST_NAME, {"name": "high"}, priority=5)
+    other_low_job = job_queue.create_job(HOST_NAME, {"name": "low_2"})
+
+    assigned_jobs = [_assign_job(job_queue)[1] for _ in range(4)]
+
+    # Higher priority first, then by creation
+    assert assigned_jobs == [high_job, low_job, other_low_job, None]
+    job_queue.close()
+
+
+def test_lease_expiry_requeues_job(db_path):
+    job_queue = JobQueue(
+        SQLiteJobStorage(db_path), lease_timeout=10, retry_delay=0
+    )
+    job = job_queue.create_job(HOST_NAME, {}, max_attempts=2)
+    worker, assigned_job = _assign_job(job_queue)
+    assert assigned_job is job
+    assert job.state == "started"
+
+    # Expire lease of the job
+    job._lease_expire_time = (
+        datetime.datetime.now() - datetime.timedelta(seconds=1)
+    )
+    job_queue.assign_jobs()
+    assert worker.current_job is None
+    assert job.state == "waiting"
+
+    # Job is assigned again on next check
+    job_queue.assign_jobs()
+    assert worker.current_job is job
+    job_queue.job_sent(worker)
+    assert job.attempts == 2
+    assert job.state == "started"
+
+    # Last attempt expired, job is failed
+    job._lease_expire_time = (
+        datetime.datetime.now() - datetime.timedelta(seconds=1)
+    )
+    job_queue.assign_jobs()
+    assert worker.current_job is None
+    assert job.state == "error"
+    assert job.status()["message"] == "Job lease expired"
+    job_queue.close()
+
+
+def test_restore_waiting_jobs(db_path):
+    job_queue = JobQueue(SQLiteJobStorage(db_path))
+    done_job = job_queue.create_job(HOST_NAME, {"name": "done"}, priority=2)
+    started_job = job_queue.create_job(
+        HOST_NAME, {"name": "started"}, priority=1
+    )
+    waiting_job = job_queue.create_job(HOST_NAME, {"name": "waiting"})
+
+    worker, job = _assign_job(job_queue)
+    assert job is done_job
+    job_queue.job_done(worker.id, job.id, True, "Finished", {"out": 1})
+    job_queue.remove_worker(worker)
+    worker, job = _assign_job(job_queue)
+    assert job is started_job
+    # Server is stopped while job is being processed
+    job_queue.close()
+
+    job_queue = JobQueue(SQLiteJobStorage(db_path))
+    restored_done_job = job_queue.get_job(done_job.id)
+    assert restored_done_job.state == "done"
+    assert restored_done_job.status()["result"] == {"out": 1}
+
+    # Started job is waiting again
+    assert job_queue.get_job(started_job.id).state == "waiting"
+    assigned_ids = [_assign_job(job_queue)[1].id for _ in range(2)]
+    assert assigned_ids == [started_job.id, waiting_job.id]
+    assert job_queue.get_job(waiting_job.id).data == {"name": "waiting"}
+    job_queue.close()
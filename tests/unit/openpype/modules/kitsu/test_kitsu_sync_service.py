@@ -0,0 +1,120 @@
+"""Test file for batch processing of Kitsu listener events.
+
+    Kitsu server and database connection are not used. Gazu functions
+    requesting server and database connection are monkeypatched.
+"""
+import pytest
+
+gazu = pytest.importorskip("gazu")
+
+from openpype.modules.kitsu.utils import sync_service  # noqa: E402
+
+
+class _DBConnection(object):
+    def __init__(self):
+        self.Session = {}
+        self.bulk_writes = []
+
+    def install(self):
+        pass
+
+    def bulk_write(self, requests):
+        self.bulk_writes.append(requests)
+
+
+@pytest.fixture
+def listener(monkeypatch):
+    processed = []
+
+    def _record(action):
+        def _callback(self, data):
+            processed.append((action, data["{}_id".format(action[1])]))
+        return _callback
+
+    def _get_assets_updates(self, project_id, entities):
+        processed.append(
+            ("update", project_id, [entity["id"] for entity in entities])
+        )
+        return [entity["id"] for entity in entities]
+
+    monkeypatch.setenv("KITSU_SERVER", "http://kitsu/api")
+    monkeypatch.setattr(sync_service, "AvalonMongoDB", _DBConnection)
+    monkeypatch.setattr(
+        sync_service, "validate_credentials", lambda *args: True
+    )
+    monkeypatch.setattr(gazu.client, "set_host", lambda *args: None)
+    monkeypatch.setattr(gazu, "set_event_host", lambda *args: None)
+    monkeypatch.setattr(gazu.events, "init", lambda: None)
+
+    callbacks = {}
+    monkeypatch.setattr(
+        gazu.events,
+        "add_listener",
+        lambda client, name, callback: callbacks.__setitem__(name, callback)
+    )
+    for entity_type in ("sequence", "shot"):
+        monkeypatch.setattr(
+            gazu.shot,
+            "get_{}".format(entity_type),
+            lambda entity_id: {"id": entity_id}
+        )
+        monkeypatch.setattr(
+            sync_service.Listener,
+            "_new_{}".format(entity_type),
+            _record(("new", entity_type))
+        )
+    monkeypatch.setattr(
+        sync_service.Listener, "_get_assets_updates", _get_assets_updates
+    )
+
+    listener = sync_service.Listener("login", "password", batch_interval=60)
+
+    def emit(event_name, **data):
+        callbacks[event_name](dict(data, project_id="project"))
+
+    yield listener, emit, processed
+
+    if listener._flush_timer is not None:
+        listener._flush_timer.cancel()
+
+
+def _flush(listener):
+    listener._flush_timer.cancel()
+    listener._flush_events()
+
+
+def test_events_are_merged_in_received_order(listener):
+    listener, emit, processed = listener
+
+    emit("sequence:new", sequence_id="S")
+    emit("shot:new", shot_id="X")
+    emit("sequence:update", sequence_id="S")
+    emit("shot:update", shot_id="Y")
+    emit("shot:update", shot_id="Z")
+    emit("shot:update", shot_id="Y")
+    _flush(listener)
+
+    # Update of sequence is merged to its creation which stays before
+    #   creation of its shot, updates are written at once
+    assert processed == [
+        (("new", "sequence"), "S"),
+        (("new", "shot"), "X"),
+        ("update", "project", ["Y", "Z"]),
+    ]
+    assert listener.dbcon.bulk_writes == [["Y", "Z"]]
+
+
+def test_updates_are_written_between_other_events(listener):
+    listener, emit, processed = listener
+
+    emit("shot:update", shot_id="Y")
+    emit("shot:new", shot_id="X")
+    emit("shot:update", shot_id="Z")
+    _flush(listener)
+
+    assert processed == [
+        ("update", "project", ["Y"]),
+        (("new", "shot"), "X"),
+        ("update", "project", ["Z"]),
+    ]
+    assert len(listener.dbcon.bulk_writes) == 2
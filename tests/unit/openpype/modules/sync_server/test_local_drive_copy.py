@@ -0,0 +1,74 @@
+"""Test file for chunked copy of local drive provider."""
+import os
+
+from openpype.modules.sync_server.providers import local_drive
+from openpype.modules.sync_server.providers.local_drive import (
+    PARTIAL_SUFFIX,
+    copy_file_chunked,
+)
+
+
+def test_copy_file_chunked(tmp_path):
+    content = os.urandom(1024 * 1024 + 17)
+    source_path = str(tmp_path / "source.exr")
+    target_path = str(tmp_path / "target.exr")
+    with open(source_path, "wb") as stream:
+        stream.write(content)
+
+    progress = []
+    copied = copy_file_chunked(
+        source_path,
+        target_path,
+        lambda done, total: progress.append((done, total)),
+        chunk_size=256 * 1024
+    )
+
+    assert copied == len(content)
+    assert progress[-1] == (len(content), len(content))
+    assert len(progress) == 5
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
+    assert not os.path.exists(target_path + PARTIAL_SUFFIX)
+
+
+def test_copy_file_chunked_resume(tmp_path):
+    content = os.urandom(1024 * 1024)
+    source_path = str(tmp_path / "source.exr")
+    target_path = str(tmp_path / "target.exr")
+    with open(source_path, "wb") as stream:
+        stream.write(content)
+    with open(target_path + PARTIAL_SUFFIX, "wb") as stream:
+        stream.write(content[:1000])
+
+    copied = copy_file_chunked(source_path, target_path)
+
+    assert copied == len(content) - 1000
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
+
+
+def test_copy_file_chunked_kernel_short_copy(tmp_path, monkeypatch):
+    content = os.urandom(1024 * 1024)
+    source_path = str(tmp_path / "source.exr")
+    target_path = str(tmp_path / "target.exr")
+    with open(source_path, "wb") as stream:
+        stream.write(content)
+
+    # Filesystem reporting end of file after first chunk
+    def _copy_chunk(src_fd, dst_fd, size):
+        if os.lseek(src_fd, 0, os.SEEK_CUR):
+            return 0
+        data = os.read(src_fd, 1000)
+        return os.write(dst_fd, data)
+
+    monkeypatch.setattr(
+        local_drive, "_get_kernel_copy_funcs", lambda: [_copy_chunk]
+    )
+
+    copied = copy_file_chunked(
+        source_path, target_path, chunk_size=256 * 1024
+    )
+
+    assert copied == len(content)
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
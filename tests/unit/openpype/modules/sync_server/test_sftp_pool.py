@@ -0,0 +1,114 @@
+"""Test file for connection pool of SFTP provider.
+
+    Connections are replaced by simple objects, pool does not use any other
+    api of connection than health check and 'close'.
+"""
+import threading
+
+from openpype.modules.sync_server.providers.sftp import SFTPConnectionPool
+
+
+class _Transport(object):
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+
+class _Channel(object):
+    def __init__(self, transport):
+        self._transport = transport
+
+    def get_transport(self):
+        return self._transport
+
+
+class _Client(object):
+    def __init__(self, transport):
+        self._channel = _Channel(transport)
+
+    def get_channel(self):
+        return self._channel
+
+    def normalize(self, path):
+        return "/"
+
+
+class _Connection(object):
+    def __init__(self):
+        self.transport = _Transport()
+        self.sftp_client = _Client(self.transport)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_connections_are_reused():
+    created = []
+
+    def connect():
+        conn = _Connection()
+        created.append(conn)
+        return conn
+
+    pool = SFTPConnectionPool(connect, max_connections=2)
+    for _ in range(5):
+        with pool.connection() as conn:
+            assert conn is created[0]
+    assert len(created) == 1
+
+    # Broken connection is replaced
+    created[0].transport.active = False
+    with pool.connection() as conn:
+        assert conn is created[1]
+    assert created[0].closed
+    assert pool.opened_count == 1
+
+
+def test_max_connections_and_idle_eviction():
+    pool = SFTPConnectionPool(_Connection, max_connections=2, idle_timeout=0)
+    conn_1 = pool.acquire()
+    conn_2 = pool.acquire()
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    thread.start()
+    thread.join(0.2)
+    # Waits for released connection
+    assert not acquired
+
+    pool.release(conn_1)
+    thread.join()
+    assert acquired
+    assert pool.opened_count == 2
+
+    pool.release(conn_2)
+    pool.release(acquired[0])
+    pool.evict_idle()
+    assert conn_2.closed
+    assert pool.opened_count == 0
+
+
+def test_failed_connect_releases_slot():
+    pool = SFTPConnectionPool(lambda: None, max_connections=2)
+    for _ in range(3):
+        with pool.connection() as conn:
+            assert conn is None
+    assert pool.opened_count == 0
+
+    # Limit of connections is still applied
+    pool._connect_func = _Connection
+    conn_1 = pool.acquire()
+    conn_2 = pool.acquire()
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    thread.start()
+    thread.join(0.2)
+    assert not acquired
+    assert pool.opened_count == 2
+
+    pool.release(conn_1)
+    thread.join()
+    pool.release(conn_2)
+    pool.release(acquired[0])
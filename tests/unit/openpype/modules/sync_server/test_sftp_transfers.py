@@ -0,0 +1,287 @@
+"""Test file for transfers of SFTP provider against local SFTP server.
+
+    Server is running in a thread and serves files from temporary
+    directory. Server counts transferred bytes so resumed transfers can be
+    validated.
+"""
+import os
+import time
+import socket
+import threading
+
+import pytest
+
+paramiko = pytest.importorskip("paramiko")
+pytest.importorskip("pysftp")
+
+from openpype.modules.sync_server.providers.sftp import (  # noqa: E402
+    SFTPHandler,
+    PARTIAL_SUFFIX,
+)
+
+USER = "user"
+PASSWORD = "password"
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        if username == USER and password == PASSWORD:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+
+class _SFTPHandle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(
+            os.fstat(self.readfile.fileno())
+        )
+
+    def read(self, offset, length):
+        data = super(_SFTPHandle, self).read(offset, length)
+        if isinstance(data, bytes):
+            self.counters["read"] += len(data)
+        return data
+
+    def write(self, offset, data):
+        self.counters["written"] += len(data)
+        return super(_SFTPHandle, self).write(offset, data)
+
+
+class _SFTPServerInterface(paramiko.SFTPServerInterface):
+    """Serves files from 'root' directory."""
+
+    root = None
+    counters = None
+
+    def _local_path(self, path):
+        return os.path.join(self.root, self.canonicalize(path).lstrip("/"))
+
+    def _call(self, func, *args):
+        try:
+            func(*args)
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+        return paramiko.SFTP_OK
+
+    def canonicalize(self, path):
+        return os.path.normpath("/" + path).replace("\\", "/")
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(
+                os.stat(self._local_path(path))
+            )
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+
+    lstat = stat
+
+    def list_folder(self, path):
+        local_path = self._local_path(path)
+        try:
+            return [
+                paramiko.SFTPAttributes.from_stat(
+                    os.stat(os.path.join(local_path, filename)), filename
+                )
+                for filename in os.listdir(local_path)
+            ]
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+
+    def open(self, path, flags, attr):
+        local_path = self._local_path(path)
+        try:
+            fd = os.open(local_path, flags | getattr(os, "O_BINARY", 0), 0o644)
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+        stream = os.fdopen(fd, mode)
+        handle = _SFTPHandle(flags)
+        handle.counters = self.counters
+        handle.readfile = stream
+        handle.writefile = stream
+        return handle
+
+    def remove(self, path):
+        return self._call(os.remove, self._local_path(path))
+
+    def rename(self, oldpath, newpath):
+        return self._call(
+            os.rename, self._local_path(oldpath), self._local_path(newpath)
+        )
+
+    def mkdir(self, path, attr):
+        return self._call(os.mkdir, self._local_path(path))
+
+    def rmdir(self, path):
+        return self._call(os.rmdir, self._local_path(path))
+
+
+class _SFTPServer(object):
+    def __init__(self, root):
+        self.counters = {"read": 0, "written": 0}
+        self._host_key = paramiko.RSAKey.generate(2048)
+        self._root = root
+        self._transports = []
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(10)
+        self.port = self._socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    def _accept(self):
+        interface = type(
+            "_RootSFTPServerInterface",
+            (_SFTPServerInterface, ),
+            {"root": self._root, "counters": self.counters}
+        )
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(self._host_key)
+            transport.set_subsystem_handler(
+                "sftp", paramiko.SFTPServer, interface
+            )
+            transport.start_server(server=_ServerInterface())
+            self._transports.append(transport)
+
+    def reset_counters(self):
+        self.counters["read"] = 0
+        self.counters["written"] = 0
+
+    def close(self):
+        self._socket.close()
+        for transport in self._transports:
+            transport.close()
+
+
+class _SyncServer(object):
+    LOG_PROGRESS_SEC = 0
+
+    def update_db(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def sftp_env(tmp_path):
+    remote_root = tmp_path / "remote"
+    local_root = tmp_path / "local"
+    remote_root.mkdir()
+    local_root.mkdir()
+
+    server = _SFTPServer(str(remote_root))
+    presets = {
+        "enabled": True,
+        "sftp_host": "127.0.0.1",
+        "sftp_port": server.port,
+        "sftp_user": USER,
+        "sftp_pass": PASSWORD,
+        "sftp_key": "",
+        "sftp_key_pass": "",
+        "root": {"work": "/"},
+    }
+    handler = SFTPHandler("project", "sftp", presets=presets)
+    yield handler, server, remote_root, local_root
+
+    handler.pool.close()
+    server.close()
+
+
+def _transfer(handler, method, source_path, target_path, overwrite=False):
+    func = getattr(handler, method)
+    return func(
+        source_path, target_path, _SyncServer(), "project", {}, {}, "sftp",
+        overwrite=overwrite
+    )
+
+
+def test_upload_and_download(sftp_env):
+    handler, server, remote_root, local_root = sftp_env
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    source_path = local_root / "source.bin"
+    source_path.write_bytes(data)
+
+    assert handler.is_active()
+
+    handler.create_folder("/folder")
+    _transfer(handler, "upload_file", str(source_path), "/folder/file.bin")
+    remote_path = remote_root / "folder" / "file.bin"
+    assert remote_path.read_bytes() == data
+    assert not os.path.exists(str(remote_path) + PARTIAL_SUFFIX)
+
+    # Existing file is replaced
+    data = os.urandom(1024)
+    source_path.write_bytes(data)
+    _transfer(
+        handler, "upload_file", str(source_path), "/folder/file.bin",
+        overwrite=True
+    )
+    assert remote_path.read_bytes() == data
+
+    target_path = local_root / "target.bin"
+    _transfer(handler, "download_file", "/folder/file.bin", str(target_path))
+    assert target_path.read_bytes() == data
+    assert not os.path.exists(str(target_path) + PARTIAL_SUFFIX)
+
+    # Connections are reused
+    assert handler.pool.opened_count == 1
+
+
+def test_resume_transfers(sftp_env):
+    handler, server, remote_root, local_root = sftp_env
+    data = os.urandom(2 * 1024 * 1024)
+    half_size = len(data) // 2
+    source_path = local_root / "source.bin"
+    source_path.write_bytes(data)
+    # Partial files must be newer than source
+    past_time = time.time() - 100
+    os.utime(str(source_path), (past_time, past_time))
+
+    # Upload continues from size of remote partial file
+    (remote_root / ("file.bin" + PARTIAL_SUFFIX)).write_bytes(
+        data[:half_size]
+    )
+    server.reset_counters()
+    _transfer(handler, "upload_file", str(source_path), "/file.bin")
+    assert (remote_root / "file.bin").read_bytes() == data
+    assert server.counters["written"] == len(data) - half_size
+
+    # Download continues from size of local partial file
+    remote_path = remote_root / "file.bin"
+    os.utime(str(remote_path), (past_time, past_time))
+    target_path = local_root / "target.bin"
+    with open(str(target_path) + PARTIAL_SUFFIX, "wb") as stream:
+        stream.write(data[:half_size])
+    server.reset_counters()
+    _transfer(handler, "download_file", "/file.bin", str(target_path))
+    assert target_path.read_bytes() == data
+    assert server.counters["read"] == len(data) - half_size
+
+    # Partial file older than source is not resumed
+    (remote_root / ("other.bin" + PARTIAL_SUFFIX)).write_bytes(
+        b"x" * half_size
+    )
+    os.utime(
+        str(remote_root / ("other.bin" + PARTIAL_SUFFIX)),
+        (past_time - 100, past_time - 100)
+    )
+    server.reset_counters()
+    _transfer(handler, "upload_file", str(source_path), "/other.bin")
+    assert (remote_root / "other.bin").read_bytes() == data
+    assert server.counters["written"] == len(data)
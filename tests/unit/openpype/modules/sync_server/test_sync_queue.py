@@ -0,0 +1,136 @@
+"""Test file for incremental queue of sync server in polling mode.
+
+    Collection of representations is kept in memory and does not support
+    change streams so the queue falls back to polling.
+"""
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+
+from openpype.modules.sync_server.sync_queue import SyncRepresentationsQueue
+
+PROJECT_NAME = "prj"
+
+
+class _Cursor(list):
+    def sort(self, key, direction):
+        return _Cursor(sorted(
+            self, key=lambda doc: doc[key], reverse=direction < 0
+        ))
+
+    def limit(self, count):
+        return _Cursor(self[:count])
+
+
+class _Collection(object):
+    """Collection without change streams (not a replica set)."""
+
+    def __init__(self):
+        self.docs = []
+
+    def find(self, query, projection=None):
+        docs = [doc for doc in self.docs if doc["type"] == query["type"]]
+        id_query = query.get("_id")
+        if id_query is not None:
+            docs = [doc for doc in docs if doc["_id"] > id_query["$gt"]]
+        return _Cursor(docs)
+
+    def watch(self, pipeline):
+        raise OperationFailure("The $changeStream stage is not supported")
+
+
+class _Connection(object):
+    def __init__(self, collection):
+        self.database = {PROJECT_NAME: collection}
+
+
+class _SyncServerModule(object):
+    """Representation is synchronized until its tries reach retry count."""
+
+    def __init__(self):
+        self.collection = _Collection()
+        self.connection = _Connection(self.collection)
+        self.retry_cnt = 3
+        self.queried_ids = []
+
+    def add_representation(self, tries=0, priority=50):
+        repre = {
+            "_id": ObjectId(),
+            "type": "representation",
+            "tries": tries,
+            "priority": priority,
+        }
+        self.collection.docs.append(repre)
+        return repre
+
+    def get_sync_representations(
+        self, project_name, active_site, remote_site, representation_ids=None
+    ):
+        self.queried_ids.append(representation_ids)
+        return [
+            dict(doc)
+            for doc in self.collection.docs
+            if doc["tries"] < self.retry_cnt
+            and (
+                representation_ids is None
+                or doc["_id"] in representation_ids
+            )
+        ]
+
+
+def _get_ids(sync_queue):
+    return [repre["_id"] for repre in sync_queue.get_representations()]
+
+
+def test_polling_queue():
+    module = _SyncServerModule()
+    first = module.add_representation(priority=10)
+    failed = module.add_representation(tries=3)
+
+    sync_queue = SyncRepresentationsQueue(
+        module, PROJECT_NAME, "studio", "sftp"
+    )
+    assert _get_ids(sync_queue) == [first["_id"]]
+    assert not sync_queue.uses_change_stream
+
+    # Nothing changed, nothing is queried
+    assert _get_ids(sync_queue) == [first["_id"]]
+    assert module.queried_ids == [None]
+
+    # Inserted representation is found by polling
+    inserted = module.add_representation(priority=90)
+    assert _get_ids(sync_queue) == [inserted["_id"], first["_id"]]
+    assert module.queried_ids[-1] == [inserted["_id"]]
+
+    # Updated representations are queued or dequeued
+    first["tries"] = 3
+    failed["tries"] = 0
+    sync_queue.mark_changed([first["_id"], failed["_id"]])
+    assert _get_ids(sync_queue) == [inserted["_id"], failed["_id"]]
+    assert sorted(module.queried_ids[-1]) == sorted(
+        [first["_id"], failed["_id"]]
+    )
+    sync_queue.stop()
+
+
+def test_polling_queue_settings_change():
+    module = _SyncServerModule()
+    first = module.add_representation()
+    failed = module.add_representation(tries=3)
+
+    sync_queue = SyncRepresentationsQueue(
+        module, PROJECT_NAME, "studio", "sftp"
+    )
+    sync_queue.set_query_settings({"retries": [0, 1, 2]})
+    assert _get_ids(sync_queue) == [first["_id"]]
+
+    # Same settings don't cause full refresh
+    sync_queue.set_query_settings({"retries": [0, 1, 2]})
+    assert _get_ids(sync_queue) == [first["_id"]]
+    assert module.queried_ids == [None]
+
+    # Failed representation is queued with higher retry count
+    module.retry_cnt = 5
+    sync_queue.set_query_settings({"retries": [0, 1, 2, 3, 4]})
+    assert _get_ids(sync_queue) == [first["_id"], failed["_id"]]
+    assert module.queried_ids == [None, None]
+    sync_queue.stop()
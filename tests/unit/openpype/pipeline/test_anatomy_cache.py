@@ -0,0 +1,64 @@
+"""Test file for Anatomy objects sharing cached anatomy snapshots."""
+import platform
+
+import pytest
+
+from openpype.pipeline import anatomy as anatomy_module
+from openpype.pipeline.anatomy import Anatomy
+
+PROJECT_NAME = "prj"
+
+
+@pytest.fixture
+def project_doc(monkeypatch):
+    project_doc = {
+        "name": PROJECT_NAME,
+        "data": {"code": "prj", "fps": 25},
+        "config": {
+            "roots": {"work": {platform.system().lower(): "/mnt/work"}},
+            "templates": {
+                "defaults": {"version_padding": 3},
+                "work": {
+                    "folder": "{root[work]}/{project[name]}/{asset}",
+                    "file": "{asset}_{@version}.ma",
+                    "path": "{@folder}/{@file}",
+                },
+                "version": "v{version:0>{@version_padding}}",
+                "others": {},
+            },
+        },
+    }
+    monkeypatch.setattr(
+        anatomy_module, "get_project", lambda project_name: project_doc
+    )
+    monkeypatch.setattr(
+        Anatomy,
+        "_get_site_root_overrides",
+        classmethod(lambda cls, project_name, site_name: None)
+    )
+    Anatomy.clear_cache()
+    yield project_doc
+    Anatomy.clear_cache()
+
+
+def test_anatomy_changes_are_not_shared(project_doc):
+    anatomy = Anatomy(PROJECT_NAME)
+    # Fill templates of shared snapshot
+    assert anatomy.templates["work"]["file"] == "{asset}_v{version:0>3}.ma"
+
+    anatomy.templates["work"]["file"] = "changed"
+    anatomy.templates_obj.set_templates(
+        {"work": {"file": "{asset}.ma"}, "others": {}}
+    )
+    anatomy.roots_obj.reset()
+    anatomy["roots"]["work"] = "changed"
+
+    new_anatomy = Anatomy(PROJECT_NAME)
+    assert new_anatomy.templates["work"]["file"] == (
+        "{asset}_v{version:0>3}.ma"
+    )
+    assert new_anatomy["roots"] == project_doc["config"]["roots"]
+    result = new_anatomy.format({
+        "project": {"name": PROJECT_NAME}, "asset": "sh010", "version": 1
+    })
+    assert result["work"]["path"] == "/mnt/work/prj/sh010/sh010_v001.ma"
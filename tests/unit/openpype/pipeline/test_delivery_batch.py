@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Test suite for delivery of files."""
+import os
+import logging
+import collections
+
+from openpype.pipeline import delivery
+from openpype.pipeline.delivery import DeliveryBatch
+
+
+def _write_file(dirpath, filename, content):
+    filepath = os.path.join(dirpath, filename)
+    with open(filepath, "w") as stream:
+        stream.write(content)
+    return filepath
+
+
+def test_delivery_batch(tmp_path):
+    src_dir = str(tmp_path / "src")
+    dst_dir = str(tmp_path / "dst")
+    os.makedirs(src_dir)
+    src_a = _write_file(src_dir, "a.txt", "a")
+    src_b = _write_file(src_dir, "b.txt", "b")
+    dst_a = os.path.join(dst_dir, "sub", "a.txt")
+    dst_b = os.path.join(dst_dir, "b.txt")
+
+    report_items = collections.defaultdict(list)
+    batch = DeliveryBatch(logging.getLogger(__name__), workers=2)
+    assert batch.add(src_a, dst_a, report_items)
+    assert batch.add(src_b, dst_b, report_items)
+    # Same delivery is planned only once
+    assert not batch.add(src_a, dst_a, report_items)
+    assert not report_items
+    # Different source to the same destination is reported
+    assert not batch.add(src_b, dst_a, report_items)
+    assert len(report_items) == 1
+    assert len(batch) == 2
+
+    delivered = []
+    results = batch.process(report_items, delivered.append)
+
+    assert len(results) == 2
+    assert delivered == results
+    for result in results:
+        assert result["error"] is None
+        assert result["method"] in (
+            "hardlink", "reflink", "copy_file_range", "copy"
+        )
+        assert result["size"] == 1
+    with open(dst_a, "r") as stream:
+        assert stream.read() == "a"
+
+    # Existing files are not copied again
+    batch.add(src_a, dst_a, report_items)
+    results = batch.process(report_items)
+    assert results[0]["method"] == "exists"
+
+
+def test_copy_file_range_short_copy(tmp_path, monkeypatch):
+    src_path = _write_file(str(tmp_path), "src.txt", "content" * 100)
+    dst_path = str(tmp_path / "dst.txt")
+
+    # Filesystem reporting end of file after first chunk
+    def _copy_file_range(src_fd, dst_fd, count):
+        if os.lseek(src_fd, 0, os.SEEK_CUR):
+            return 0
+        data = os.read(src_fd, 10)
+        return os.write(dst_fd, data)
+
+    def _no_link(*args):
+        raise OSError("Not supported")
+
+    monkeypatch.setattr(os, "copy_file_range", _copy_file_range, raising=False)
+    monkeypatch.setattr(delivery, "create_hard_link", _no_link)
+    monkeypatch.setattr(delivery, "_reflink_file", _no_link)
+
+    assert delivery._copy_file(src_path, dst_path) == "copy"
+    with open(dst_path, "r") as stream:
+        assert stream.read() == "content" * 100
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Test suite for plugin discovery."""
+import os
+import time
+
+from openpype.pipeline.plugin_discover import PluginDiscoverContext
+
+
+class BasePlugin(object):
+    pass
+
+
+PLUGIN_CONTENT = """
+from {module} import BasePlugin
+
+
+class {name}(BasePlugin):
+    pass
+"""
+
+
+def _write_plugin(dirpath, name):
+    filepath = os.path.join(dirpath, "{}.py".format(name.lower()))
+    with open(filepath, "w") as stream:
+        stream.write(PLUGIN_CONTENT.format(module=__name__, name=name))
+    return filepath
+
+
+def test_discover_cache(tmp_path):
+    dirpath = str(tmp_path)
+    filepath = _write_plugin(dirpath, "PluginA")
+    _write_plugin(dirpath, "PluginB")
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(BasePlugin, dirpath)
+    first_plugins = context.discover(BasePlugin)
+    second_plugins = context.discover(BasePlugin)
+
+    assert len(first_plugins) == 2
+    # Unchanged files are not imported again
+    assert set(first_plugins) == set(second_plugins)
+
+    # Changed file is imported again
+    _write_plugin(dirpath, "PluginA")
+    future_time = time.time() + 10
+    os.utime(filepath, (future_time, future_time))
+    third_plugins = context.discover(BasePlugin)
+    changed = set(third_plugins) - set(second_plugins)
+    assert [plugin.__name__ for plugin in changed] == ["PluginA"]
+
+    # Invalidated cache import all files again
+    context.invalidate_cache(dirpath)
+    fourth_plugins = context.discover(BasePlugin)
+    assert not set(fourth_plugins) & set(third_plugins)
+
+
+def test_discover_without_cache(tmp_path):
+    dirpath = str(tmp_path)
+    _write_plugin(dirpath, "PluginA")
+
+    context = PluginDiscoverContext(use_cache=False)
+    context.register_plugin_path(BasePlugin, dirpath)
+
+    assert not (
+        set(context.discover(BasePlugin)) & set(context.discover(BasePlugin))
+    )
+
+
+LOADER_CONTENT = """
+from openpype.pipeline.load import LoaderPlugin
+
+
+class LoaderA(LoaderPlugin):
+    families = ["model"]
+    representations = ["abc"]
+"""
+
+
+def test_discover_cache_restores_settings(tmp_path):
+    from openpype.pipeline.load import LoaderPlugin
+
+    dirpath = str(tmp_path)
+    with open(os.path.join(dirpath, "loader_a.py"), "w") as stream:
+        stream.write(LOADER_CONTENT)
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(LoaderPlugin, dirpath)
+
+    project_a_settings = {"global": {"load": {"LoaderA": {
+        "enabled": False, "families": ["model", "rig"], "color": "red"
+    }}}}
+    project_b_settings = {"global": {"load": {"LoaderA": {
+        "representations": ["usd"]
+    }}}}
+
+    loader, = context.discover(LoaderPlugin)
+    loader.apply_settings(project_a_settings, {})
+    loader.families.append("look")
+    assert loader.enabled is False
+    assert loader.color == "red"
+
+    # Switch to project B
+    loader_b, = context.discover(LoaderPlugin)
+    assert loader_b is loader
+    loader_b.apply_settings(project_b_settings, {})
+    assert loader_b.enabled is True
+    assert loader_b.families == ["model"]
+    assert loader_b.representations == ["usd"]
+    assert not hasattr(loader_b, "color")
+
+    # Back to project without settings
+    loader_c, = context.discover(LoaderPlugin)
+    assert loader_c.representations == ["abc"]
@@ -0,0 +1,45 @@
+import os
+
+from openpype.plugins.publish.integrate_hero_version import (
+    IntegrateHeroVersion,
+)
+
+
+def _write(path, content):
+    dirpath = os.path.dirname(path)
+    if not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+    with open(path, "w") as stream:
+        stream.write(content)
+
+
+def _read(path):
+    with open(path, "r") as stream:
+        return stream.read()
+
+
+def test_integrate_staged(tmp_path):
+    """New hero files replace current hero folder at once."""
+    root = str(tmp_path)
+    hero_dir = os.path.join(root, "hero")
+    _write(os.path.join(hero_dir, "model_hero.abc"), "old")
+    _write(os.path.join(hero_dir, "resources", "old.png"), "old")
+
+    src_to_dst = []
+    for name in ("model_v002.abc", "model_v002.ma"):
+        src_path = os.path.join(root, "v002", name)
+        _write(src_path, name)
+        dst_name = name.replace("v002", "hero")
+        src_to_dst.append((src_path, os.path.join(hero_dir, dst_name)))
+
+    plugin = IntegrateHeroVersion()
+    plugin.transfer_workers = 2
+    backup_dir = plugin._integrate_staged(hero_dir, src_to_dst)
+
+    assert sorted(os.listdir(hero_dir)) == ["model_hero.abc", "model_hero.ma"]
+    assert _read(os.path.join(hero_dir, "model_hero.abc")) == "model_v002.abc"
+    # Previous hero files are kept until integration is finished
+    assert _read(os.path.join(backup_dir, "model_hero.abc")) == "old"
+    assert sorted(os.listdir(root)) == sorted([
+        "hero", "v002", os.path.basename(backup_dir)
+    ])